@@ -0,0 +1,160 @@
+# Time the tokenizing of data rows before and after split_data_line
+# See README.md for complete documentation
+
+# Import needed libraries
+import argparse
+import random
+import sys
+import time
+
+import parse_reports
+
+# Other user variables
+QUOTEDROWS = 0.2  # Share of rows with every field wrapped in quotation marks
+REPEAT = 5  # Number of times each pipeline is timed; the best time is reported
+ROWS = 50000  # Number of Schedule A rows timed
+
+# Sample values for the Schedule A (version 8.3) columns. Columns not
+# listed here are left empty, as most of them are in real filings.
+ROWVALUES = {'LineNbr': ['SA11AI', 'SA11AI', 'SA11C', 'SA17'],
+             'CommID': ['C00123456'],
+             'EntTp': ['IND', 'IND', 'PAC', 'ORG'],
+             'ContOrgNm': ['', '', 'Friends of Jane Smith', 'Acme Widgets Inc.'],
+             'ContLName': ['Smith', 'Garcia', "O'Brien", 'Nguyen', 'Van Der Berg'],
+             'ContFName': ['Jane', 'Robert', 'Maria', 'Li'],
+             'ContMName': ['', 'A', 'J.'],
+             'ContPfx': ['', '', 'Mr.', 'Dr.'],
+             'ContSfx': ['', '', 'Jr.', 'III'],
+             'Addr1': ['123 Main St', '4500 N. Lake Shore Dr', 'PO Box 77'],
+             'Addr2': ['', '', 'Apt 4B', 'Suite 200'],
+             'City': ['Springfield', 'Chicago', 'Arlington', 'Saint Paul'],
+             'StAbbr': ['IL', 'VA', 'MN', 'TX'],
+             'Zip': ['62701', '606111234', '22201'],
+             'ElecCd': ['P2020', 'G2020', ''],
+             'ContDt': ['20200115', '20200302', '20201019'],
+             'ContAmt': ['25.00', '250.00', '1000', '2800.00', '-50.00'],
+             'ContAgg': ['75.00', '500.00', '2800.00'],
+             'ContPurpDesc': ['', '', 'Earmarked through ActBlue'],
+             'Emp': ['Self-Employed', 'Retired', 'Acme Widgets Inc.', 'Springfield Public Schools'],
+             'Occ': ['Attorney', 'Retired', 'Teacher', 'Software Engineer'],
+             'MemoCd': ['', '', 'X'],
+             'MemoTxt': ['', '', 'See Schedule B']}
+
+
+def build_original_column_plan(formtype, version):
+    # Returns the template dictionary and the (source column position,
+    # output header) pairs that original_populate_data_row_dict expects
+    linehdrs = parse_reports.outputhdrs[formtype]
+    template = dict.fromkeys(linehdrs, '')
+    rowhdrs = parse_reports.get_row_headers(formtype, version)
+    return template, tuple((x, hdr) for x, hdr in enumerate(rowhdrs) if hdr in template)
+
+
+def build_rows(nrows, seed=0):
+    # Returns nrows random Schedule A data lines delimited the way
+    # version 8.3 filings are. A share of the rows (QUOTEDROWS) have
+    # every field wrapped in quotation marks, which sends them down the
+    # slower path of split_data_line.
+    rng = random.Random(seed)
+    headers = parse_reports.get_row_headers('SA', '8.3')
+    transid = headers.index('TransID')
+    rows = []
+    for x in range(nrows):
+        fields = [rng.choice(ROWVALUES.get(header, [''])) for header in headers]
+        fields[transid] = 'SA11AI.' + str(x)
+        if rng.random() < QUOTEDROWS:
+            fields = ['"' + field + '"' for field in fields]
+        rows.append(parse_reports.SRCDELIMITER.join(fields) + '\r\n')
+    return rows
+
+
+def original_clean_data_line(line):
+    # clean_data_line as it was written before split_data_line replaced it
+    if parse_reports.OUTPUTDELIMITER == '\t':
+        line = line.expandtabs(1).replace('\r', ' ').strip()
+
+    while '  ' in line:
+        line = line.replace('  ', ' ')
+
+    return line
+
+
+def original_parse_data_row(data, delim):
+    # parse_data_row as it was written before split_data_line replaced
+    # it. Only the branch for delimiters other than commas is kept.
+    data = data.split(delim)
+    data[:] = (datum.strip('" ') for datum in data)
+
+    return data
+
+
+def original_populate_data_row_dict(data, plan):
+    # populate_data_row_dict as it was written before field cleanup
+    # moved into split_data_line
+    output = plan[0].copy()
+    ncols = len(data)
+    for x, header in plan[1]:
+        if x < ncols:
+            output[header] = data[x].strip().replace('\t', ' ').strip(' "\n')
+    return output
+
+
+def time_pipeline(pipeline, rows, plan, repeat):
+    # Runs pipeline over every row repeat times and returns the best time
+    # in seconds
+    best = None
+    for x in range(repeat):
+        start = time.time()
+        pipeline(rows, plan)
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def tokenize_after(rows, plan):
+    # Tokenizes and populates rows the way parse_data_rows does now
+    output = []
+    for line in rows:
+        line, data = parse_reports.split_data_line(line, parse_reports.SRCDELIMITER)
+        output.append(parse_reports.populate_data_row(data, plan))
+    return output
+
+
+def tokenize_before(rows, plan):
+    # Tokenizes and populates rows the way parse_data_rows did before
+    # split_data_line
+    output = []
+    for line in rows:
+        data = original_parse_data_row(original_clean_data_line(line), parse_reports.SRCDELIMITER)
+        output.append(original_populate_data_row_dict(data, plan))
+    return output
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Times the tokenizing of Schedule A data rows before and after '
+                                                 'split_data_line.')
+    parser.add_argument('--rows', type=int, default=ROWS,
+                        help='Number of rows timed (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=REPEAT,
+                        help='Number of times each pipeline is timed (default: %(default)s)')
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    plan = parse_reports.get_column_plan('SA', '8.3')
+    oldplan = build_original_column_plan('SA', '8.3')
+
+    # The timings mean nothing if the pipelines don't map the same values.
+    # The original pipeline returns dictionaries, so their values are
+    # put in the order of the output headers.
+    linehdrs = parse_reports.outputhdrs['SA']
+    before = [[data[header] for header in linehdrs] for data in tokenize_before(rows, oldplan)]
+    if before != tokenize_after(rows, plan):
+        print('The pipelines returned different values.')
+        sys.exit(1)
+
+    before = time_pipeline(tokenize_before, rows, oldplan, args.repeat)
+    after = time_pipeline(tokenize_after, rows, plan, args.repeat)
+    print('Rows: ' + str(len(rows)) + ' (best of ' + str(args.repeat) + ')')
+    print('before: %.2f us/row' % (before / len(rows) * 1e6))
+    print('after:  %.2f us/row' % (after / len(rows) * 1e6))
@@ -0,0 +1,90 @@
+# Check clean_sql_text and clean_sql_literal against the original clean_sql_text
+# See README.md for complete documentation
+
+# Import needed libraries
+import argparse
+import random
+import sys
+
+import parse_reports
+
+# Other user variables
+ITERATIONS = 200000  # Random values checked for each seed
+NULLSTRINGS = ('', 'nullstring', 'NULL')  # nullstring values to check
+OUTPUTTEXTDELIMS = ('', "'", '"', '|')  # outputtextdelim values to check
+
+# Random values are built from these tokens, so quotation marks,
+# doubled quotation marks and whitespace turn up often at either end
+TOKENS = ["'", '"', ' ', 'a', 'b', '\t', '\n', "''", '""', 'x y', '\0', '^']
+
+
+def check_value(val):
+    # Returns a list of descriptions of every nullstring and
+    # outputtextdelim combination for which the new functions don't
+    # return the same value as the original clean_sql_text.
+    diffs = []
+    for nullstring in NULLSTRINGS:
+        for outputtextdelim in OUTPUTTEXTDELIMS:
+            expected = original_clean_sql_text(val, nullstring, outputtextdelim)
+            actual = parse_reports.clean_sql_text(val, nullstring, outputtextdelim)
+            if actual != expected:
+                diffs.append('clean_sql_text(' + repr(val) + ', ' + repr(nullstring) + ', ' + repr(
+                    outputtextdelim) + ') returned ' + repr(actual) + ' rather than ' + repr(expected))
+        expected = original_clean_sql_text(val, nullstring, "'")
+        actual = parse_reports.clean_sql_literal(val, nullstring)
+        if actual != expected:
+            diffs.append('clean_sql_literal(' + repr(val) + ', ' + repr(nullstring) + ') returned ' + repr(
+                actual) + ' rather than ' + repr(expected))
+    return diffs
+
+
+def original_clean_sql_text(val, nullstring='', outputtextdelim=''):
+    # clean_sql_text as it was written before it returned early for
+    # values without quotation marks
+    val = val.strip(' "')
+    if val == None:
+        return nullstring
+    elif val == '':
+        return nullstring
+    else:
+        while val.find("''") != -1:
+            val = val.replace("''", "'")
+        while val.find('""') != -1:
+            val = val.replace('""', '"')
+        if outputtextdelim == "'":
+            val = val.replace("'", "''")
+        return outputtextdelim + val + outputtextdelim
+
+
+def random_value(rng):
+    # Returns a value of up to 10 random tokens
+    return ''.join([rng.choice(TOKENS) for x in range(rng.randint(0, 10))])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Checks clean_sql_text and clean_sql_literal in parse_reports '
+                                                 'against the original clean_sql_text on random values.')
+    parser.add_argument('--iterations', type=int, default=ITERATIONS,
+                        help='Number of random values to check for each seed (default: %(default)s)')
+    parser.add_argument('seeds', type=int, nargs='*', default=[0],
+                        help='Seeds for the random values (default: 0)')
+    args = parser.parse_args()
+
+    # Every value is checked with every nullstring and outputtextdelim, so
+    # the fixed edge cases are checked along with the random values
+    fixed = ['', ' ', '"', "'", '""', "''", '" "', "'''", '"""', "a''b", 'a""b', " 'a' ", '"a"', 'a b']
+    ndiffs = 0
+    nvalues = 0
+    for seed in args.seeds:
+        rng = random.Random(seed)
+        values = fixed + [random_value(rng) for x in range(args.iterations)]
+        for val in values:
+            diffs = check_value(val)
+            for diff in diffs:
+                print(diff)
+            ndiffs += len(diffs)
+        nvalues += len(values)
+
+    print('Checked ' + str(nvalues) + ' values: ' + str(ndiffs) + ' differences found.')
+    if ndiffs:
+        sys.exit(1)
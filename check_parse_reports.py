@@ -0,0 +1,107 @@
+# Check parse_reports behavior that the regression corpus can't reach
+# See README.md for complete documentation
+
+# Import needed libraries
+import os
+import shutil
+import StringIO
+import sys
+import tempfile
+
+import parse_reports
+
+
+def build_filing(nrows):
+    # Returns a StringIO buffer housing a version 8.3 filing with nrows
+    # Schedule A rows, each with a contribution amount that can't be
+    # converted to a number
+    filehdr = ['HDR', 'FEC', '8.3', 'FECfile', '8.1.0', '', '', '']
+    rpthdr = ['F3XN', 'C00123456', 'Friends of Jane Smith'] + [''] * 120
+    lines = [parse_reports.SRCDELIMITER.join(filehdr), parse_reports.SRCDELIMITER.join(rpthdr)]
+    headers = parse_reports.get_row_headers('SA', '8.3')
+    for x in range(nrows):
+        row = [''] * len(headers)
+        row[headers.index('LineNbr')] = 'SA11AI'
+        row[headers.index('CommID')] = 'C00123456'
+        row[headers.index('TransID')] = 'SA11AI.' + str(x)
+        row[headers.index('ContDt')] = '20200115'
+        row[headers.index('ContAmt')] = 'abc'
+        lines.append(parse_reports.SRCDELIMITER.join(row))
+    return StringIO.StringIO('\r\n'.join(lines) + '\r\n')
+
+
+def check_failed_filings_rolled_back(tempdir):
+    # Writes rows for four filings to one output handle, the way
+    # parse_report does, and discards the rows of the second and third
+    # filings as if both had failed. Returns a list of problems found.
+    outputfile = os.path.join(tempdir, 'SA.txt')
+    with open(outputfile, 'wb') as f:
+        f.write('HEADER\n')
+    outputs = parse_reports.open_output_files({'SA': outputfile})
+    try:
+        for rows, failed in [(['row1\n', 'row2\n'], False), (['bad1\n'], True), (['bad2\n'], True),
+                             (['row3\n'], False)]:
+            offsets = parse_reports.mark_output_files(outputs)
+            for row in rows:
+                outputs['SA'].write(row)
+            if failed:
+                parse_reports.truncate_output_files(outputs, offsets)
+    finally:
+        parse_reports.close_output_files(outputs)
+
+    expected = 'HEADER\nrow1\nrow2\nrow3\n'
+    with open(outputfile, 'rb') as f:
+        actual = f.read()
+    if actual != expected:
+        return ['Failed filings left ' + repr(actual) + ' rather than ' + repr(expected)]
+    return []
+
+
+def check_iter_records_error_logs(tempdir):
+    # Reads one filing to the end and stops reading another after its
+    # first row. Returns a list of problems found if the bad values read
+    # aren't in BadCurrency.log once iter_records is done.
+    problems = []
+    rpterrdir = parse_reports.RPTERRDIR
+    for nrows, nread in [(3, 3), (3, 1)]:
+        parse_reports.RPTERRDIR = os.path.join(tempdir, str(nread)) + os.sep
+        os.mkdir(parse_reports.RPTERRDIR)
+        records = parse_reports.iter_records(build_filing(nrows), imageid=123456)
+        if nread == nrows:
+            list(records)
+        else:
+            for x in range(nread):
+                next(records)
+            records.close()
+
+        logfile = parse_reports.RPTERRDIR + 'BadCurrency.log'
+        if not os.path.isfile(logfile):
+            problems.append('BadCurrency.log was not written after reading ' + str(nread) + ' of ' + str(
+                nrows) + ' rows')
+            continue
+        with open(logfile, 'rb') as f:
+            nentries = len(f.readlines())
+        if nentries != nread:
+            problems.append('BadCurrency.log houses ' + str(nentries) + ' entries rather than ' + str(
+                nread) + ' after reading ' + str(nread) + ' of ' + str(nrows) + ' rows')
+    parse_reports.close_error_logs()
+    parse_reports.RPTERRDIR = rpterrdir
+    return problems
+
+
+if __name__ == '__main__':
+    checks = [check_failed_filings_rolled_back, check_iter_records_error_logs]
+    nproblems = 0
+    for check in checks:
+        tempdir = tempfile.mkdtemp()
+        try:
+            problems = check(tempdir)
+        finally:
+            shutil.rmtree(tempdir)
+        for problem in problems:
+            print(check.__name__ + ': ' + problem)
+        nproblems += len(problems)
+
+    print('Ran ' + str(len(checks)) + ' checks: ' + str(nproblems) + ' problems found.')
+    if nproblems:
+        sys.exit(1)
@@ -7,14 +7,16 @@
 import datetime
 import glob
 import multiprocessing
+import multiprocessing.pool
 import os
 import pickle
 import re
 import sys
-import urllib
 import urllib2
 import zipfile
 
+import download_tools
+
 # Try to import user settings or set them explicitly
 try:
     import usersettings
@@ -34,6 +36,8 @@ except:
 # Other user variables
 ARCFTP = 'https://cg-519a459a-0ea3-42c2-b7bc-fa1143481f74.s3-us-gov-west-1.amazonaws.com/bulk-downloads/electronic/'
 NUMPROC = 1  # Multiprocessing processes to run simultaneously
+NUMDOWNLOADS = 4  # Archives to download simultaneously
+RPTCHUNKSIZE = 256 * 1024  # Bytes of each report held in memory while it is downloaded
 RPTURL = 'http://docquery.fec.gov/dcdev/posted/'
 RSSURL = 'http://efilingapps.fec.gov/rss/generate?preDefinedFilingType=ALL'
 
@@ -130,93 +134,66 @@ def consume_rss():
 def download_archive(archive):
     """
     Downloads a single archive file and saves it in the directory
-    specified by the ARCSVDIR variable.  After downloading an archive,
-    this subroutine compares the length of the downloaded file with the
-    length of the source file and will try to download a file up to
-    five times when the lengths don't match.
+    specified by the ARCSVDIR variable.  download_url compares the
+    length of the download with the length of the source file, and this
+    subroutine will try to download a file up to five times when the
+    lengths don't match.
+
+    Returns True if the archive was downloaded and False otherwise.
+    Archives are downloaded on several threads at once, so the caller
+    is responsible for adding any failures to try_again_later.
     """
     src = ARCFTP + archive
     dest = ARCSVDIR + archive
     y = 0
-    # I have added a header to my request
-    try:
-        # Add a header to the request
-        request = urllib2.Request(src, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:54.0) Gecko/20100101 Firefox/54.0'})
-        srclen = float(urllib2.urlopen(request).info().get('Content-Length'))
-    except:
-        y = 5
-
     while y < 5:
         try:
             # Add a header to the request
-            urllib.URLopener.version = 'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:54.0) Gecko/20100101 Firefox/54.0'
-            urllib.urlretrieve(src, dest)
-
-            destlen = os.path.getsize(dest)
-
-            # Repeat download up to five times if files not same size
-            if srclen != destlen:
-                os.remove(dest)
-                y += 1
-                continue
-            else:
-                y = 6
+            download_tools.download_url(src, dest, {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:54.0) Gecko/20100101 Firefox/54.0'})
+            return True
+        except urllib2.HTTPError:
+            # The archive isn't available
+            break
         except:
+            # Repeat download up to five times if files not same size
             y += 1
-    if y == 5:
-        zipinfo['try_again_later'].append(archive)
-        print(src + ' could not be downloaded.')
+    print(src + ' could not be downloaded.')
+    return False
 
 
 def download_report(download):
     """
     Downloads a single electronic report and saves it in the directory
-    specified by the RPTSVDIR variable.  After downloading a report,
-    this subroutine compares the length of the downloaded file with the
-    length of the source file and will try to download a file up to
-    five times when the lengths don't match.
+    specified by the RPTSVDIR variable.  download_url compares the
+    length of the download with the length of the source file, and this
+    subroutine will try to download a file up to five times when the
+    lengths don't match.
+
+    The report is written RPTCHUNKSIZE bytes at a time, and the transfer
+    rate is printed periodically for reports that take a while.
     """
-    # Construct file url and get length of file
+    # Construct file url
     url = RPTURL + download + '.fec'
-    y = 0
-
-    try:
-        # Add a header to the request
-        request = urllib2.Request(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:54.0) Gecko/20100101 Firefox/54.0'})
-        srclen = float(urllib2.urlopen(request).info().get('Content-Length'))
-    except:
-        y = 5
-
     filename = RPTSVDIR + download + '.fec'
-
+    url_headers = {'ACCEPT': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                   'ACCEPT_ENCODING': 'gzip, deflate, br',
+                   'ACCEPT_LANGUAGE': 'en-US,en;q=0.5',
+                   'USER-AGENT': 'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:56.0) Gecko/20100101 Firefox/56.0'}
+    y = 0
     while y < 5:
         try:
-            url_headers = {'ACCEPT': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                           'ACCEPT_ENCODING': 'gzip, deflate, br',
-                           'ACCEPT_LANGUAGE': 'en-US,en;q=0.5',
-                           'USER-AGENT': 'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:56.0) Gecko/20100101 Firefox/56.0'}
-            request = urllib2.Request(url, headers=url_headers)
-            response = urllib2.urlopen(request)
-            with open(filename, 'wb') as f:
-                f.write(response.read())
-
-            destlen = os.path.getsize(filename)
-
-            # Repeat download up to five times if files not same size
-            if srclen != destlen:
-                os.remove(filename)
-                y += 1
-                continue
-            else:
-                y = 6
+            download_tools.download_url(url, filename, url_headers, RPTCHUNKSIZE, progress=True)
+            return
+        except urllib2.HTTPError:
+            # The report isn't available
+            break
         except:
+            # Repeat download up to five times if files not same size
             y += 1
 
-    if y == 5:
-        print('Report ' + download + ' could not be downloaded.')
-        sys.exit()
+    print('Report ' + download + ' could not be downloaded.')
+    sys.exit()
 
 
 def pickle_archives(zipinfo, archives):
@@ -291,7 +268,8 @@ def verify_reports(rpts, downloaded):
     For reports that already have been downloaded, the function verifies
     the length of the downloaded file matches the length of the file
     posted on the FEC website.  When the lengths do not match, the saved
-    file is deleted and retained in the download list.
+    file is deleted and retained in the download list.  Files are kept
+    when the website doesn't report a length.
     """
     downloads = []
     for rpt in rpts:
@@ -301,13 +279,17 @@ def verify_reports(rpts, downloaded):
         else:
             try:
                 # Add a header to the request
-                request = urllib2.Request(RPTURL + rpt + '.fec', headers={
+                srclen = download_tools.get_content_length(RPTURL + rpt + '.fec', {
                     'User-Agent': 'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:54.0) Gecko/20100101 Firefox/54.0'})
-                srclen = float(urllib2.urlopen(request).info().get('Content-Length'))
             except urllib2.HTTPError:
                 print(RPTURL + rpt + '.fec could not be downloaded.')
                 continue
 
+            # Without a length from the server, the saved file can't be
+            # checked, so it is kept
+            if srclen is None:
+                continue
+
             for child in childdirs:
                 try:
                     destlen = os.path.getsize(child + rpt + '.fec')
@@ -364,11 +346,16 @@ if __name__ == '__main__':
         print('Done!\n')
         print('Downloading ' + str(len(archives))
               + ' new archive(s)...')
-        pool = multiprocessing.Pool(processes=NUMPROC)
-        for archive in archives:
-            pool.apply_async(download_archive(archive))
-        pool.close()
-        pool.join()
+        # Downloading is I/O bound, so use threads rather than processes
+        pool = multiprocessing.pool.ThreadPool(processes=NUMDOWNLOADS)
+        try:
+            results = pool.map(download_archive, archives)
+        finally:
+            pool.close()
+            pool.join()
+        for archive, downloaded in zip(archives, results):
+            if not downloaded:
+                zipinfo['try_again_later'].append(archive)
         print('Done!\n')
 
         # Open each archive and extract new reports
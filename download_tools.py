@@ -0,0 +1,296 @@
+# Download helpers shared by download_reports and update_master_files
+# See README.md for complete documentation
+
+# Import needed libraries
+import httplib
+import os
+import pickle
+import re
+import socket
+import StringIO
+import threading
+import time
+import urllib2
+import urlparse
+
+# Other user variables
+CHUNKSIZE = 64 * 1024  # Default number of bytes read from the server at a time
+MAXREDIRECTS = 5  # Redirects followed for a single request
+PROGRESSINTERVAL = 10  # Seconds between progress reports for slow downloads
+TIMEOUT = 60  # Seconds to wait on the server before a request fails
+
+# Idle keep-alive connections, keyed by scheme and host, that are reused
+# by every request this process makes. Downloads run on several threads,
+# so the pool is guarded by connectionlock. pid is the process that
+# opened the connections: a process forked by multiprocessing must not
+# share its parent's sockets, so it starts with an empty pool.
+connectionpool = {'pid': os.getpid(), 'idle': {}}
+connectionlock = threading.Lock()
+
+REDIRECTCODES = (301, 302, 303, 307, 308)
+contentrange = re.compile(r'bytes\s+(\d+)-\d+/(\d+|\*)')
+
+
+def discard_part(dest):
+    """
+    Deletes the partial download of dest and the record of its length.
+    """
+    for partfile in [dest + '.part', dest + '.part.p']:
+        if os.path.exists(partfile):
+            os.remove(partfile)
+
+
+def download_url(url, dest, headers=None, chunksize=None, progress=False):
+    """
+    Downloads url with a single request and saves it as dest. Returns
+    the number of bytes in the file.
+
+    The response is streamed to a partial file (dest with a .part
+    extension) in chunks of chunksize bytes (CHUNKSIZE by default), so
+    only one chunk is held in memory at a time. If the server sends a
+    Content-Length header, the number of bytes received is compared with
+    it as the file is written.  dest is replaced only once the whole
+    file has been downloaded, so it is never left half written.
+
+    When a download comes up short, IOError is raised, but the partial
+    file is kept and the number of bytes it holds is recorded in a
+    pickle alongside it (dest with a .part.p extension).  The next call
+    for the same url asks the server for just the rest of the file with
+    a Range request.  The download starts over only if the server sends
+    the whole file instead, as it does when it doesn't support ranges or
+    the file has changed, or if the server sends more than it promised.
+
+    Set progress to True to print the bytes received and the transfer
+    rate every PROGRESSINTERVAL seconds, so slow downloads are visible.
+    Downloads that finish sooner print nothing.
+    """
+    if chunksize is None:
+        chunksize = CHUNKSIZE
+    part = dest + '.part'
+
+    # Resume a partial download
+    partinfo = load_part_info(url, dest)
+    rangeheaders = dict(headers or {})
+    if partinfo is not None:
+        rangeheaders['Range'] = 'bytes=' + str(partinfo['offset']) + '-'
+        if partinfo['validator'] is not None:
+            rangeheaders['If-Range'] = partinfo['validator']
+    try:
+        response = open_url(url, rangeheaders)
+    except urllib2.HTTPError as err:
+        # Start over if the recorded range is no longer valid
+        if err.code != 416 or partinfo is None:
+            raise
+        discard_part(dest)
+        return download_url(url, dest, headers, chunksize, progress)
+
+    offset, srclen, validator, keep = 0, None, None, True
+    try:
+        srclen = response.getheader('Content-Length')
+        if srclen is not None:
+            srclen = int(srclen)
+        validator = response.getheader('ETag') or response.getheader('Last-Modified')
+        if response.status == 206 and partinfo is not None:
+            match = contentrange.match(response.getheader('Content-Range') or '')
+            if match is None or int(match.group(1)) != partinfo['offset'] or (
+                    partinfo['length'] is not None and match.group(2) != str(partinfo['length'])):
+                keep = False
+                raise IOError(url + ' returned a different range than the one requested.')
+            offset = partinfo['offset']
+            if srclen is not None:
+                srclen += offset
+        save_part_info(url, dest, offset, srclen, validator)
+
+        destlen = offset
+        reportedlen = 0
+        start = lastreport = time.time()
+        with open(part, 'r+b' if offset else 'wb') as f:
+            f.seek(offset)
+            f.truncate()
+            while True:
+                chunk = response.read(chunksize)
+                if not chunk:
+                    break
+                destlen += len(chunk)
+                if srclen is not None and destlen > srclen:
+                    keep = False
+                    break
+                f.write(chunk)
+                if progress and time.time() - lastreport >= PROGRESSINTERVAL:
+                    lastreport = time.time()
+                    reportedlen = destlen
+                    print_progress(url, destlen, srclen, destlen - offset, lastreport - start)
+        if 0 < reportedlen < destlen:
+            print_progress(url, destlen, srclen, destlen - offset, time.time() - start)
+        if srclen is not None and destlen != srclen:
+            raise IOError(url + ' returned ' + str(destlen) + ' bytes rather than ' + str(srclen) + '.')
+    except:
+        release_response(response, False)
+        if keep and os.path.exists(part):
+            save_part_info(url, dest, os.path.getsize(part), srclen, validator)
+        else:
+            discard_part(dest)
+        raise
+
+    release_response(response)
+    replace_file(part, dest)
+    discard_part(dest)
+    return destlen
+
+
+def get_connection(key):
+    """
+    Returns an idle connection to the scheme and host in key from the
+    connection pool, or a new connection when none is idle, along with
+    a flag that is True for a reused connection.
+    """
+    with connectionlock:
+        if connectionpool['pid'] != os.getpid():
+            connectionpool['pid'] = os.getpid()
+            connectionpool['idle'] = {}
+        idle = connectionpool['idle'].get(key)
+        if idle:
+            return idle.pop(), True
+    return new_connection(key), False
+
+
+def get_content_length(url, headers=None):
+    """
+    Returns the length of url reported by the server in response to a
+    HEAD request, or None if the server doesn't report one.
+    """
+    response = open_url(url, headers, 'HEAD')
+    response.read()
+    release_response(response)
+    srclen = response.getheader('Content-Length')
+    if srclen is not None:
+        srclen = int(srclen)
+    return srclen
+
+
+def load_part_info(url, dest):
+    """
+    Returns the record of a partial download of url saved as dest, or
+    None if there isn't a usable partial download.
+    """
+    try:
+        with open(dest + '.part.p', 'rb') as partfile:
+            partinfo = pickle.load(partfile)
+    except:
+        return None
+    if partinfo.get('url') != url or partinfo['offset'] <= 0 or not os.path.exists(dest + '.part') or \
+            os.path.getsize(dest + '.part') < partinfo['offset']:
+        return None
+    return partinfo
+
+
+def new_connection(key):
+    """
+    Opens a connection to the scheme and host in key.
+    """
+    scheme, host = key
+    if scheme == 'https':
+        return httplib.HTTPSConnection(host, timeout=TIMEOUT)
+    return httplib.HTTPConnection(host, timeout=TIMEOUT)
+
+
+def open_url(url, headers=None, method='GET'):
+    """
+    Sends a request for url over a pooled keep-alive connection and
+    returns the httplib response, following up to MAXREDIRECTS
+    redirects.  Raises urllib2.HTTPError for error responses, like
+    urllib2.urlopen does.
+
+    Pass the response to release_response once its body has been read
+    so the connection can be reused.  If an idle connection turns out to
+    have been closed by the server, the request is sent again on a new
+    connection.
+    """
+    for x in range(MAXREDIRECTS + 1):
+        parts = urlparse.urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        conn, reused = get_connection(key)
+        try:
+            conn.request(method, path, headers=headers or {})
+            response = conn.getresponse()
+        except (httplib.HTTPException, socket.error):
+            conn.close()
+            if not reused:
+                raise
+            conn = new_connection(key)
+            try:
+                conn.request(method, path, headers=headers or {})
+                response = conn.getresponse()
+            except:
+                conn.close()
+                raise
+        response.connkey = key
+        response.conn = conn
+
+        if response.status in REDIRECTCODES and response.getheader('Location'):
+            response.read()
+            release_response(response)
+            url = urlparse.urljoin(url, response.getheader('Location'))
+            continue
+        if response.status >= 400:
+            body = response.read()
+            release_response(response)
+            raise urllib2.HTTPError(url, response.status, response.reason, response.msg, StringIO.StringIO(body))
+        return response
+
+    release_response(response, False)
+    raise urllib2.HTTPError(url, response.status, 'Too many redirects', response.msg, None)
+
+
+def print_progress(url, destlen, srclen, sessionlen, elapsed):
+    """
+    Prints the number of bytes of url downloaded so far (out of srclen,
+    when it is known) and the average rate at which the sessionlen bytes
+    received by this request arrived over elapsed seconds.
+    """
+    status = os.path.basename(url) + ': ' + str(destlen / 1024) + ' KB'
+    if srclen is not None:
+        status += ' of ' + str(srclen / 1024) + ' KB'
+    print(status + ' downloaded (' + str(int(sessionlen / 1024.0 / max(elapsed, 0.001))) + ' KB/s)')
+
+
+def release_response(response, reuse=True):
+    """
+    Returns the connection that carried response to the connection pool
+    if the whole response has been read and the server will keep the
+    connection open.  Otherwise, or when reuse is False, the connection
+    is closed.
+    """
+    if reuse and response.isclosed() and not response.will_close:
+        with connectionlock:
+            if connectionpool['pid'] == os.getpid():
+                connectionpool['idle'].setdefault(response.connkey, []).append(response.conn)
+                return
+    response.conn.close()
+
+
+def replace_file(src, dest):
+    """
+    Renames src to dest, replacing dest if it exists.  The rename is
+    atomic except on Windows, where an existing dest must be deleted
+    first.
+    """
+    if os.name == 'nt' and os.path.exists(dest):
+        os.remove(dest)
+    os.rename(src, dest)
+
+
+def save_part_info(url, dest, offset, length, validator):
+    """
+    Records that the partial download of url saved as dest holds offset
+    bytes of the length bytes in the file.  validator is the ETag or
+    Last-Modified header sent with the file, which is sent back when the
+    download is resumed so the server sends the whole file again if it
+    has changed.
+    """
+    with open(dest + '.part.p', 'wb') as partfile:
+        pickle.dump({'url': url, 'offset': offset, 'length': length, 'validator': validator}, partfile)
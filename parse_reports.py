@@ -4,14 +4,37 @@
 # See README.md for complete documentation
 
 # Import needed libraries
+import argparse
+import collections
 import csv
 import datetime
+import decimal
+import errno
 import glob
-import linecache
+import itertools
+import json
+import multiprocessing
+import multiprocessing.util
+import operator
 import os
-import pyodbc
+import re
 import shutil
-import time
+import signal
+import sys
+
+# pyodbc is needed only to load report headers into the database, so the
+# parser can still be imported without it
+try:
+    import pyodbc
+except ImportError:
+    pyodbc = None
+
+# NumPy is needed only to validate data rows in batches (see BATCHROWS);
+# without it, batched values are checked one at a time
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 """
   Currently supported forms and versions:
@@ -78,8 +101,49 @@ SRCDELIMITER = chr(28)
 # Set the delimiter to be used for output data files
 OUTPUTDELIMITER = '\t'
 
-# Create counter variable to stop file iteration when reaches filelimit
-filectr = 0
+# Buffer size, in bytes, for each output data file
+OUTPUTBUFSIZE = 1024 * 1024
+
+# Number of entries buffered for each error log before they are written.
+# Buffered entries are also written once each report has been parsed.
+ERRORLOGBATCH = 1000
+
+# Format used for bad value entries in the error logs: 'text' (the
+# original tab-delimited entries), 'tsv' or 'jsonl'. The structured
+# formats house the fields listed in ERRORLOGFIELDS.
+ERRORLOGFORMAT = 'text'
+
+# Number of report headers loaded before the database work is committed.
+# Uncommitted headers are also committed when the module finishes.
+DBCOMMITBATCH = 1
+
+# Number of report headers sent to the database in each round trip.
+# Every header in a batch is loaded before any of the reports are parsed,
+# so if a report can't be parsed, the headers of the reports after it in
+# the batch remain loaded. Those reports are listed in ErrorMessages.log.
+HDRBATCHSIZE = 1
+
+# Maximum number of parameters SQL Server accepts in a single request
+MAXSQLPARAMS = 2100
+
+# Maximum number of normalized dates cached by convert_to_date
+DATECACHESIZE = 10000
+
+# Maximum number of parsed full names cached by parse_full_name
+NAMECACHESIZE = 10000
+
+# Multiprocessing processes to run simultaneously. Override with --workers.
+NUMPROC = 1
+
+# When parsing with more than one process, files larger than this many
+# bytes are split into byte ranges that are parsed simultaneously.
+SPLITSIZE = 256 * 1024 * 1024
+
+# Number of data rows of each form type collected before their currency
+# and integer columns are validated together, a column at a time, using
+# NumPy when it is installed. Rows of each form type are still written
+# in the order they are read. Set to 0 to validate each row as it is read.
+BATCHROWS = 0
 
 # Build header variables
 # Note that H3 header versions 1 and 2 have been disabled. I have found
@@ -1176,25 +1240,1291 @@ outputhdrs = {
     'TEXT': ['LineNbr', 'CommID', 'TransID', 'BkRefTransID', 'BkRefSchdNm', 'FullText']}
 
 
-def add_entry_to_error_log(logfile, logtext):
-    with open(logfile, 'a+b') as output:
-        output.write(logtext.strip() + '\n')
-
-
-def build_data_row(data, headers, imageid, rpttype):
-    output = [str(imageid)]
-    if rpttype != None:
-        output.append(rpttype)
-    for header in headers:
-        if data[header] == None:
-            output.append('')
-        elif data[header] == '':
-            output.append('')
+# Full name fields used in older electronic filings. The validators parse
+# these names into their component fields, so the full name fields are
+# not written to the output data files.
+fullnamehdrs = {'SA': ['ContFullName', 'DonorCandFullName'],
+                'SB': ['PayeeFullName', 'BenCandFullName'],
+                'SC': ['LenderFullName', 'LenderCandFullName'],
+                'SC1': ['LendRepFullName', 'TrsFullName'],
+                'SC2': ['GuarFullName'],
+                'SE': ['PayeeFullName', 'SupOppCandFullName', 'CompFullName'],
+                'SF': ['PayeeFullName', 'PayeeCandFullName'],
+                'H4': ['PayeeFullName'],
+                'H6': ['PayeeFullName'],
+                'F1S': ['AgtFullName']}
+
+# Field specs compiled by build_validator into the functions that
+# validate the data rows of each form type (rowspecs) and the report
+# header of each report type (rpthdrspecs). Fields are validated in the
+# order listed. Each field is a (field name, type) tuple, optionally
+# followed by a dictionary of options. Types:
+# * text: cleaned by clean_sql_text. Options: maxlen (the parser exits
+#   if the cleaned value is longer), nullstring (report headers only;
+#   blank values become NULL rather than '') and upper.
+# * bit: converted to 0 or 1 by convert_to_bit. Option: quoted (the
+#   value is converted to a SQL literal first).
+# * currency, date, tinyint: validated by ck_curr_val, convert_to_date
+#   and convert_to_tinyint. Report header dates are SQL literals.
+# * district: a tinyint that is blanked when it matches the state
+#   field named by the state option or is NA or **.
+# * fullname: split into the five name fields that share its prefix
+#   (LName, FName, MName, Pfx, Sfx) using the name delimiter. Option:
+#   label (used in the error log).
+rowspecs = {'SA': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text', {'maxlen': 20}),
+                   ('BkRefTransID', 'text'),
+                   ('BkRefSchdNm', 'text'),
+                   ('EntTp', 'text'),
+                   ('ContOrgNm', 'text'),
+                   ('ContFullName', 'fullname', {'label': 'Contributor'}),
+                   ('ContLName', 'text'),
+                   ('ContFName', 'text'),
+                   ('ContMName', 'text'),
+                   ('ContPfx', 'text'),
+                   ('ContSfx', 'text'),
+                   ('Addr1', 'text'),
+                   ('Addr2', 'text'),
+                   ('City', 'text'),
+                   ('StAbbr', 'text', {'maxlen': 2}),
+                   ('Zip', 'text'),
+                   ('ElecCd', 'text'),
+                   ('ElecDesc', 'text'),
+                   ('ContDt', 'date'),
+                   ('ContAmt', 'currency'),
+                   ('ContAgg', 'currency'),
+                   ('ContPurpCd', 'text'),
+                   ('ContPurpDesc', 'text'),
+                   ('Emp', 'text', {'maxlen': 38}),
+                   ('Occ', 'text', {'maxlen': 38}),
+                   ('DonorCommID', 'text', {'maxlen': 11}),
+                   ('DonorCommNm', 'text'),
+                   ('DonorCandID', 'text'),
+                   ('DonorCandFullName', 'fullname', {'label': 'Donor candidate'}),
+                   ('DonorCandLName', 'text'),
+                   ('DonorCandFName', 'text'),
+                   ('DonorCandMName', 'text'),
+                   ('DonorCandPfx', 'text'),
+                   ('DonorCandSfx', 'text'),
+                   ('DonorCandOfc', 'text', {'maxlen': 3}),
+                   ('DonorCandSt', 'text'),
+                   ('DonorCandDist', 'tinyint'),
+                   ('ConduitNm', 'text'),
+                   ('ConduitAddr1', 'text'),
+                   ('ConduitAddr2', 'text'),
+                   ('ConduitCity', 'text'),
+                   ('ConduitState', 'text'),
+                   ('ConduitZip', 'text'),
+                   ('MemoCd', 'bit'),
+                   ('MemoTxt', 'text'),
+                   ('SIorSLRef', 'text')],
+            'SB': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('BkRefTransID', 'text'),
+                   ('BkRefSchdNm', 'text'),
+                   ('EntTp', 'text'),
+                   ('PayeeOrgNm', 'text'),
+                   ('PayeeFullName', 'fullname', {'label': 'Payee'}),
+                   ('PayeeLName', 'text'),
+                   ('PayeeFName', 'text'),
+                   ('PayeeMName', 'text'),
+                   ('PayeePfx', 'text'),
+                   ('PayeeSfx', 'text'),
+                   ('PayeeAddr1', 'text'),
+                   ('PayeeAddr2', 'text'),
+                   ('PayeeCity', 'text'),
+                   ('PayeeState', 'text'),
+                   ('PayeeZip', 'text'),
+                   ('ElecCd', 'text'),
+                   ('ElecDesc', 'text'),
+                   ('ExpDt', 'date'),
+                   ('ExpAmt', 'currency'),
+                   ('SemiAnnRefBundAmt', 'currency'),
+                   ('ExpPurpCd', 'text'),
+                   ('ExpPurpDesc', 'text'),
+                   ('ExpCatCd', 'text'),
+                   ('BenCommID', 'text'),
+                   ('BenCommNm', 'text'),
+                   ('BenCandID', 'text'),
+                   ('BenCandFullName', 'fullname', {'label': 'Beneficiary candidate'}),
+                   ('BenCandLName', 'text'),
+                   ('BenCandFName', 'text'),
+                   ('BenCandMName', 'text'),
+                   ('BenCandPfx', 'text'),
+                   ('BenCandSfx', 'text'),
+                   ('BenCandOfc', 'text'),
+                   ('BenCandState', 'text'),
+                   ('BenCandDist', 'district', {'state': 'BenCandState'}),
+                   ('ConduitNm', 'text'),
+                   ('ConduitAddr1', 'text'),
+                   ('ConduitAddr2', 'text'),
+                   ('ConduitCity', 'text'),
+                   ('ConduitState', 'text'),
+                   ('ConduitZip', 'text'),
+                   ('MemoCd', 'bit'),
+                   ('MemoTxt', 'text'),
+                   ('SIorSLRef', 'text')],
+            'SC': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('RctLnNbr', 'text'),
+                   ('EntTp', 'text'),
+                   ('LenderOrgName', 'text'),
+                   ('LenderLName', 'text'),
+                   ('LenderFName', 'text'),
+                   ('LenderMName', 'text'),
+                   ('LenderPfx', 'text'),
+                   ('LenderSfx', 'text'),
+                   ('LenderAddr1', 'text'),
+                   ('LenderAddr2', 'text'),
+                   ('LenderCity', 'text'),
+                   ('LenderState', 'text'),
+                   ('LenderZip', 'text'),
+                   ('ElecCd', 'text'),
+                   ('ElecDesc', 'text'),
+                   ('LoanAmt', 'currency'),
+                   ('PymtToDt', 'currency'),
+                   ('LoanBlnc', 'currency'),
+                   ('IncurredDt', 'date'),
+                   ('DueDt', 'date'),
+                   ('IntRt', 'text'),
+                   ('flgSecured', 'bit'),
+                   ('flgPersFunds', 'bit'),
+                   ('LenderCommID', 'text'),
+                   ('LenderCandID', 'text'),
+                   ('LenderCandLName', 'text'),
+                   ('LenderCandFName', 'text'),
+                   ('LenderCandMName', 'text'),
+                   ('LenderCandPfx', 'text'),
+                   ('LenderCandSfx', 'text'),
+                   ('LenderCandOfc', 'text'),
+                   ('LenderCandState', 'text'),
+                   ('LenderCandDist', 'tinyint'),
+                   ('MemoCd', 'bit'),
+                   ('MemoTxt', 'text')],
+            'SC1': [('LineNbr', 'text'),
+                    ('CommID', 'text'),
+                    ('TransID', 'text'),
+                    ('BkRefTransID', 'text'),
+                    ('Lender', 'text'),
+                    ('LenderAddr1', 'text'),
+                    ('LenderAddr2', 'text'),
+                    ('LenderCity', 'text'),
+                    ('LenderState', 'text'),
+                    ('LenderZip', 'text'),
+                    ('LoanAmt', 'currency'),
+                    ('IntRt', 'text'),
+                    ('IncurredDt', 'date'),
+                    ('DueDt', 'date'),
+                    ('flgLoanRestructured', 'bit'),
+                    ('OrigLoanDt', 'date'),
+                    ('CrdtAmtThisDraw', 'currency'),
+                    ('TotBlnc', 'currency'),
+                    ('flgOthersLiable', 'bit'),
+                    ('flgCollateral', 'bit'),
+                    ('CollateralDesc', 'text'),
+                    ('CollateralVal', 'currency'),
+                    ('flgPerfectedInt', 'bit'),
+                    ('flgFutIncPledged', 'bit'),
+                    ('FutIncDesc', 'text'),
+                    ('FutIncEstVal', 'currency'),
+                    ('DepAcctEstDt', 'date'),
+                    ('AcctLocName', 'text'),
+                    ('AcctLocAddr1', 'text'),
+                    ('AcctLocAddr2', 'text'),
+                    ('AcctLocCity', 'text'),
+                    ('AcctLocState', 'text'),
+                    ('AcctLocZip', 'text'),
+                    ('DepAcctAuthDt', 'date'),
+                    ('LoanBasisDesc', 'text'),
+                    ('TrsFullName', 'fullname', {'label': 'Treasurer'}),
+                    ('TrsLName', 'text'),
+                    ('TrsFName', 'text'),
+                    ('TrsMName', 'text'),
+                    ('TrsPfx', 'text'),
+                    ('TrsSfx', 'text'),
+                    ('TrsSignDt', 'date'),
+                    ('LendRepFullName', 'fullname', {'label': 'Lender representative'}),
+                    ('LendRepLName', 'text'),
+                    ('LendRepFName', 'text'),
+                    ('LendRepMName', 'text'),
+                    ('LendRepPfx', 'text'),
+                    ('LendRepSfx', 'text'),
+                    ('LendRepTitle', 'text'),
+                    ('LendRepSignDt', 'date')],
+            'SC2': [('LineNbr', 'text'),
+                    ('CommID', 'text'),
+                    ('TransID', 'text'),
+                    ('BkRefTransID', 'text'),
+                    ('GuarFullName', 'fullname', {'label': 'Guarantor'}),
+                    ('GuarLName', 'text'),
+                    ('GuarFName', 'text'),
+                    ('GuarMName', 'text'),
+                    ('GuarPfx', 'text'),
+                    ('GuarSfx', 'text'),
+                    ('GuarAddr1', 'text'),
+                    ('GuarAddr2', 'text'),
+                    ('GuarCity', 'text'),
+                    ('GuarState', 'text'),
+                    ('GuarZip', 'text'),
+                    ('GuarEmp', 'text'),
+                    ('GuarOcc', 'text'),
+                    ('GuarAmt', 'currency')],
+            'SD': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('EntTp', 'text'),
+                   ('CreditorOrgName', 'text'),
+                   ('CreditorLName', 'text'),
+                   ('CreditorFName', 'text'),
+                   ('CreditorMName', 'text'),
+                   ('CreditorPfx', 'text'),
+                   ('CreditorSfx', 'text'),
+                   ('CreditorAddr1', 'text'),
+                   ('CreditorAddr2', 'text'),
+                   ('CreditorCity', 'text'),
+                   ('CreditorState', 'text'),
+                   ('CreditorZip', 'text'),
+                   ('DebtPurp', 'text'),
+                   ('BegBlnc_P', 'currency'),
+                   ('IncurAmt_P', 'currency'),
+                   ('PymtAmt_P', 'currency'),
+                   ('BalClose_P', 'currency'),
+                   ('CreditorCommID', 'text'),
+                   ('CreditorCandID', 'text'),
+                   ('CreditorCandFullName', 'text'),
+                   ('CreditorCandOfc', 'text'),
+                   ('CreditorCandState', 'text'),
+                   ('CreditorCandDist', 'tinyint'),
+                   ('ConduitName', 'text'),
+                   ('ConduitAddr1', 'text'),
+                   ('ConduitAddr2', 'text'),
+                   ('ConduitCity', 'text'),
+                   ('ConduitState', 'text'),
+                   ('ConduitZip', 'text'),
+                   ('TransID', 'text')],
+            'SE': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('BkRefTransID', 'text'),
+                   ('BkRefSchdNm', 'text'),
+                   ('EntTp', 'text'),
+                   ('PayeeOrgNm', 'text'),
+                   ('PayeeFullName', 'fullname', {'label': 'Payee'}),
+                   ('PayeeLName', 'text'),
+                   ('PayeeFName', 'text'),
+                   ('PayeeMName', 'text'),
+                   ('PayeePfx', 'text'),
+                   ('PayeeSfx', 'text'),
+                   ('PayeeAddr1', 'text'),
+                   ('PayeeAddr2', 'text'),
+                   ('PayeeCity', 'text'),
+                   ('PayeeStAbbr', 'text'),
+                   ('PayeeZip', 'text'),
+                   ('ElecCd', 'text'),
+                   ('ElecDesc', 'text'),
+                   ('DissmntnDt', 'date'),
+                   ('ExpDt', 'date'),
+                   ('ExpAmt', 'currency'),
+                   ('ExpAgg', 'currency'),
+                   ('ExpPurpDesc', 'text'),
+                   ('ExpCatCd', 'text'),
+                   ('PayeeCommID', 'text'),
+                   ('SupOppCd', 'text'),
+                   ('SupOppCandID', 'text'),
+                   ('SupOppCandFullName', 'fullname', {'label': 'Sup/Opp candidate'}),
+                   ('SupOppCandLName', 'text'),
+                   ('SupOppCandFName', 'text'),
+                   ('SupOppCandMName', 'text'),
+                   ('SupOppCandPfx', 'text'),
+                   ('SupOppCandSfx', 'text'),
+                   ('SupOppCandOfc', 'text'),
+                   ('SupOppCandStAbbr', 'text'),
+                   ('SupOppCandDist', 'tinyint'),
+                   ('CompFullName', 'fullname', {'label': 'Form completed by'}),
+                   ('CompLName', 'text'),
+                   ('CompFName', 'text'),
+                   ('CompMName', 'text'),
+                   ('CompPfx', 'text'),
+                   ('CompSfx', 'text'),
+                   ('SignDt', 'date'),
+                   ('MemoCd', 'bit'),
+                   ('MemoTxt', 'text')],
+            'SF': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('BkRefTransID', 'text'),
+                   ('BkRefSchdNm', 'text'),
+                   ('flgDesigCoordExp', 'bit'),
+                   ('DesigCommID', 'text'),
+                   ('DesigCommNm', 'text'),
+                   ('SubordCommID', 'text'),
+                   ('SubordCommNm', 'text'),
+                   ('SubordAddr1', 'text'),
+                   ('SubordAddr2', 'text'),
+                   ('SubordCity', 'text'),
+                   ('SubordStAbbr', 'text'),
+                   ('SubordZip', 'text'),
+                   ('EntTp', 'text'),
+                   ('PayeeOrgNm', 'text'),
+                   ('PayeeFullName', 'fullname', {'label': 'Payee'}),
+                   ('PayeeLName', 'text'),
+                   ('PayeeFName', 'text'),
+                   ('PayeeMName', 'text'),
+                   ('PayeePfx', 'text'),
+                   ('PayeeSfx', 'text'),
+                   ('PayeeAddr1', 'text'),
+                   ('PayeeAddr2', 'text'),
+                   ('PayeeCity', 'text'),
+                   ('PayeeStAbbr', 'text'),
+                   ('PayeeZip', 'text'),
+                   ('ExpDt', 'date'),
+                   ('ExpAmt', 'currency'),
+                   ('ExpAgg', 'currency'),
+                   ('ExpPurpCd', 'text'),
+                   ('ExpPurpDesc', 'text'),
+                   ('ExpCatCd', 'text'),
+                   ('PayeeCommID', 'text'),
+                   ('PayeeCandID', 'text'),
+                   ('PayeeCandFullName', 'fullname', {'label': 'Payee candidate'}),
+                   ('PayeeCandLName', 'text'),
+                   ('PayeeCandFName', 'text'),
+                   ('PayeeCandMName', 'text'),
+                   ('PayeeCandPfx', 'text'),
+                   ('PayeeCandSfx', 'text'),
+                   ('PayeeCandOfc', 'text'),
+                   ('PayeeCandStAbbr', 'text'),
+                   ('PayeeCandDist', 'tinyint'),
+                   ('MemoCd', 'bit'),
+                   ('MemoTxt', 'text')],
+            'H1': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('flgStLocFxPctPresOnly', 'bit'),
+                   ('flgStLocFxPctPresAndSen', 'bit'),
+                   ('flgStLocFxPctSenOnly', 'bit'),
+                   ('flgStLocFxPctNonPresNonSen', 'bit'),
+                   ('flgFlatMin50PctFed', 'bit'),
+                   ('FedPct', 'currency'),
+                   ('NonFedPct', 'currency'),
+                   ('flgAdmRatio', 'bit'),
+                   ('flgGenericVoterDrvRatio', 'bit'),
+                   ('flgPubCommunRefPrtyRatio', 'bit')],
+            'H2': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('EventNm', 'text'),
+                   ('flgDirFndrsg', 'bit'),
+                   ('flgDirCandSup', 'bit'),
+                   ('RatioCd', 'text'),
+                   ('FedPct', 'currency'),
+                   ('NonFedPct', 'currency')],
+            'H3': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('BkRefTransID', 'text'),
+                   ('AcctNm', 'text'),
+                   ('EventTp', 'text'),
+                   ('EventNm', 'text'),
+                   ('RcptDt', 'date'),
+                   ('TotAmtTrans', 'currency'),
+                   ('TransAmt', 'currency')],
+            'H4': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('BkRefTransID', 'text'),
+                   ('BkRefSchdNm', 'text'),
+                   ('EntTp', 'text'),
+                   ('PayeeOrgNm', 'text'),
+                   ('PayeeFullName', 'fullname', {'label': 'Payee'}),
+                   ('PayeeLName', 'text'),
+                   ('PayeeFName', 'text'),
+                   ('PayeeMName', 'text'),
+                   ('PayeePfx', 'text'),
+                   ('PayeeSfx', 'text'),
+                   ('PayeeAddr1', 'text'),
+                   ('PayeeAddr2', 'text'),
+                   ('PayeeCity', 'text'),
+                   ('PayeeStAbbr', 'text'),
+                   ('PayeeZip', 'text'),
+                   ('EventNm', 'text'),
+                   ('ExpDt', 'date'),
+                   ('ExpAmt', 'currency'),
+                   ('FedAmt', 'currency'),
+                   ('NonFedAmt', 'currency'),
+                   ('EventAgg', 'currency'),
+                   ('ExpPurpCd', 'text'),
+                   ('ExpPurpDesc', 'text'),
+                   ('ExpCatCd', 'text'),
+                   ('flgAdminActivity', 'bit'),
+                   ('flgDirectFndrsg', 'bit'),
+                   ('flgExempt', 'bit'),
+                   ('flgGenVtrDrv', 'bit'),
+                   ('flgDirCandSup', 'bit'),
+                   ('flgPubCommun', 'bit'),
+                   ('MemoCd', 'bit'),
+                   ('MemoTxt', 'text')],
+            'H5': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('AcctNm', 'text'),
+                   ('RcptDt', 'date'),
+                   ('TotAmt', 'currency'),
+                   ('VotRegnAmt', 'currency'),
+                   ('VotIDAmt', 'currency'),
+                   ('GOTVAmt', 'currency'),
+                   ('GenCampAmt', 'currency')],
+            'H6': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('BkRefTransID', 'text'),
+                   ('BkRefSchdNm', 'text'),
+                   ('EntTp', 'text'),
+                   ('PayeeOrgNm', 'text'),
+                   ('PayeeFullName', 'fullname', {'label': 'Payee'}),
+                   ('PayeeLName', 'text'),
+                   ('PayeeFName', 'text'),
+                   ('PayeeMName', 'text'),
+                   ('PayeePfx', 'text'),
+                   ('PayeeSfx', 'text'),
+                   ('PayeeAddr1', 'text'),
+                   ('PayeeAddr2', 'text'),
+                   ('PayeeCity', 'text'),
+                   ('PayeeStAbbr', 'text'),
+                   ('PayeeZip', 'text'),
+                   ('EventNm', 'text'),
+                   ('ExpDt', 'date'),
+                   ('TotExpAmt', 'currency'),
+                   ('FedAmt', 'currency'),
+                   ('LevinAmt', 'currency'),
+                   ('ExpAgg', 'currency'),
+                   ('ExpPurpCd', 'text'),
+                   ('ExpPurpDesc', 'text'),
+                   ('ExpCatCd', 'text'),
+                   ('flgActVotRegn', 'bit'),
+                   ('flgActGOTV', 'bit'),
+                   ('flgActVotID', 'bit'),
+                   ('flgActGenCamp', 'bit'),
+                   ('MemoCd', 'bit'),
+                   ('MemoTxt', 'text')],
+            'SI': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('RecIDNbr', 'text'),
+                   ('AcctNm', 'text'),
+                   ('BankAcctID', 'text'),
+                   ('CovgFmDt', 'date'),
+                   ('CovgToDt', 'date'),
+                   ('TotRcpts', 'currency'),
+                   ('TransToFed', 'currency'),
+                   ('TransToStAndLoc', 'currency'),
+                   ('DirStLocCandSup', 'currency'),
+                   ('OthDisb', 'currency'),
+                   ('TotDisb', 'currency'),
+                   ('BegCOH', 'currency'),
+                   ('Rcpts', 'currency'),
+                   ('Subtotal', 'currency'),
+                   ('Disb', 'currency'),
+                   ('EndCOH', 'currency'),
+                   ('TotRcpts2', 'currency'),
+                   ('TransToFed2', 'currency'),
+                   ('TransToStAndLoc2', 'currency'),
+                   ('DirStLocCandSup2', 'currency'),
+                   ('OthDisb2', 'currency'),
+                   ('TotDisb2', 'currency'),
+                   ('BegCOH2', 'currency'),
+                   ('Rcpts2', 'currency'),
+                   ('Subtotal2', 'currency'),
+                   ('Disb2', 'currency'),
+                   ('EndCOH2', 'currency')],
+            'SL': [('LineNbr', 'text'),
+                   ('CommID', 'text'),
+                   ('TransID', 'text'),
+                   ('RecordID', 'text'),
+                   ('AcctNm', 'text'),
+                   ('CovgFmDt', 'date'),
+                   ('CovgToDt', 'date'),
+                   ('IndRcptsItem_P', 'currency'),
+                   ('IndRcptsUnitem_P', 'currency'),
+                   ('IndRcptsTot_P', 'currency'),
+                   ('OthRcpts_P', 'currency'),
+                   ('TotRcpts_P', 'currency'),
+                   ('TransVotReg_P', 'currency'),
+                   ('TransVotID_P', 'currency'),
+                   ('TransGOTV_P', 'currency'),
+                   ('TransGenCamp_P', 'currency'),
+                   ('TransTot_P', 'currency'),
+                   ('OthDisb_P', 'currency'),
+                   ('TotDisb_P', 'currency'),
+                   ('BegCOH_P', 'currency'),
+                   ('Rcpts_P', 'currency'),
+                   ('Subtotal_P', 'currency'),
+                   ('Disb_P', 'currency'),
+                   ('EndCOH_P', 'currency'),
+                   ('IndRcptsItem_T', 'currency'),
+                   ('IndRcptsUnitem_T', 'currency'),
+                   ('IndRcptsTot_T', 'currency'),
+                   ('OthRcpts_T', 'currency'),
+                   ('TotRcpts_T', 'currency'),
+                   ('TransVotReg_T', 'currency'),
+                   ('TransVotID_T', 'currency'),
+                   ('TransGOTV_T', 'currency'),
+                   ('TransGenCamp_T', 'currency'),
+                   ('TransTot_T', 'currency'),
+                   ('OthDisb_T', 'currency'),
+                   ('TotDisb_T', 'currency'),
+                   ('BegCOH_T', 'currency'),
+                   ('Rcpts_T', 'currency'),
+                   ('Subtotal_T', 'currency'),
+                   ('Disb_T', 'currency'),
+                   ('EndCOH_T', 'currency')],
+            'TEXT': [('LineNbr', 'text'),
+                     ('CommID', 'text'),
+                     ('TransID', 'text'),
+                     ('BkRefTransID', 'text'),
+                     ('BkRefSchdNm', 'text'),
+                     ('FullText', 'text')],
+            'F1S': [('FormTp', 'text'),
+                    ('CommID', 'text'),
+                    ('JtFndCommNm', 'text'),
+                    ('JtFundCommID', 'text'),
+                    ('AffCommID', 'text'),
+                    ('AffCommNm', 'text'),
+                    ('AffCandID', 'text'),
+                    ('AffLName', 'text'),
+                    ('AffFName', 'text'),
+                    ('AffMName', 'text'),
+                    ('AffPfx', 'text'),
+                    ('AffSfx', 'text'),
+                    ('AffAddr1', 'text'),
+                    ('AffAddr2', 'text'),
+                    ('AffCity', 'text'),
+                    ('AffStAbbr', 'text'),
+                    ('AffZip', 'text'),
+                    ('AffRelCd', 'text'),
+                    ('AgtLName', 'text'),
+                    ('AgtFName', 'text'),
+                    ('AgtMName', 'text'),
+                    ('AgtPfx', 'text'),
+                    ('AgtSfx', 'text'),
+                    ('AgtAddr1', 'text'),
+                    ('AgtAddr2', 'text'),
+                    ('AgtCity', 'text'),
+                    ('AgtStAbbr', 'text'),
+                    ('AgtZip', 'text'),
+                    ('AgtTitle', 'text'),
+                    ('AgtPhone', 'text'),
+                    ('BankNm', 'text'),
+                    ('BankAddr1', 'text'),
+                    ('BankAddr2', 'text'),
+                    ('BankCity', 'text'),
+                    ('BankStAbbr', 'text'),
+                    ('BankZip', 'text')]}
+
+rpthdrspecs = {'F3': [('FormTp', 'text', {'nullstring': True}),
+                      ('CommID', 'text', {'nullstring': True}),
+                      ('CommNm', 'text', {'nullstring': True}),
+                      ('AddrChg', 'bit'),
+                      ('Addr1', 'text', {'nullstring': True}),
+                      ('Addr2', 'text'),
+                      ('City', 'text', {'nullstring': True}),
+                      ('StAbbr', 'text', {'nullstring': True}),
+                      ('Zip', 'text', {'nullstring': True}),
+                      ('ElecSt', 'text', {'nullstring': True}),
+                      ('ElecDist', 'tinyint'),
+                      ('RptCd', 'text', {'nullstring': True}),
+                      ('ElecCd', 'text'),
+                      ('ElecDt', 'date'),
+                      ('StateOfElec', 'text', {'nullstring': True}),
+                      ('CovgFmDt', 'date'),
+                      ('CovgToDt', 'date'),
+                      ('TrsFullName', 'fullname', {'label': 'Treasurer'}),
+                      ('TrsLName', 'text', {'nullstring': True}),
+                      ('TrsFName', 'text'),
+                      ('TrsMName', 'text'),
+                      ('TrsPfx', 'text'),
+                      ('TrsSfx', 'text'),
+                      ('SignDt', 'date'),
+                      ('TotConts_P_6a', 'currency'),
+                      ('TotContRfds_P_6b', 'currency'),
+                      ('NetConts_P_6c', 'currency'),
+                      ('TotOpExps_P_7a', 'currency'),
+                      ('TotOffsetOpExps_P_7b', 'currency'),
+                      ('NetOpExps_P_7c', 'currency'),
+                      ('CashClose_P_8', 'currency'),
+                      ('DebtsTo_P_9', 'currency'),
+                      ('DebtsBy_P_10', 'currency'),
+                      ('IndContsItem_P_11a1', 'currency'),
+                      ('IndContsUnitem_P_11a2', 'currency'),
+                      ('IndContsTot_P_11a3', 'currency'),
+                      ('PolPtyCommConts_P_11b', 'currency'),
+                      ('OthPolCommConts_P_11c', 'currency'),
+                      ('CandConts_P_11d', 'currency'),
+                      ('TotConts_P_11e', 'currency'),
+                      ('TranFmOthAuthComms_P_12', 'currency'),
+                      ('CandLoans_P_13a', 'currency'),
+                      ('OthLoans_P_13b', 'currency'),
+                      ('TotLoans_P_13c', 'currency'),
+                      ('OffsetOpExps_P_14', 'currency'),
+                      ('OthRcpts_P_15', 'currency'),
+                      ('TotRcpts_P_16', 'currency'),
+                      ('OpExps_P_17', 'currency'),
+                      ('TranToOthAuthComms_P_18', 'currency'),
+                      ('CandLoansRepaid_P_19a', 'currency'),
+                      ('OthLoansRepaid_P_19b', 'currency'),
+                      ('TotLoansRepaid_P_19c', 'currency'),
+                      ('RefundsInd_P_20a', 'currency'),
+                      ('RefundsPolPtyComms_P_20b', 'currency'),
+                      ('RefundsOthPolComms_P_20c', 'currency'),
+                      ('TotRefunds_P_20d', 'currency'),
+                      ('OthDisb_P_21', 'currency'),
+                      ('TotDisb_P_22', 'currency'),
+                      ('CashBegin_P_23', 'currency'),
+                      ('TotRcpts_P_24', 'currency'),
+                      ('Subtotal_P_25', 'currency'),
+                      ('TotDisb_P_26', 'currency'),
+                      ('CashClose_P_27', 'currency'),
+                      ('TotConts_T_6a', 'currency'),
+                      ('TotContRfds_T_6b', 'currency'),
+                      ('NetConts_T_6c', 'currency'),
+                      ('TotOpExps_T_7a', 'currency'),
+                      ('TotOffsetOpExps_T_7b', 'currency'),
+                      ('NetOpExps_T_7c', 'currency'),
+                      ('IndContsItem_T_11a1', 'currency'),
+                      ('IndContsUnitem_T_11a2', 'currency'),
+                      ('IndContsTot_T_11a3', 'currency'),
+                      ('PolPtyCommConts_T_11b', 'currency'),
+                      ('OthPolCommConts_T_11c', 'currency'),
+                      ('CandConts_T_11d', 'currency'),
+                      ('TotConts_T_11e', 'currency'),
+                      ('TranFmOthAuthComms_T_12', 'currency'),
+                      ('CandLoans_T_13a', 'currency'),
+                      ('OthLoans_T_13b', 'currency'),
+                      ('TotLoans_T_13c', 'currency'),
+                      ('OffsetOpExps_T_14', 'currency'),
+                      ('OthRcpts_T_15', 'currency'),
+                      ('TotRcpts_T_16', 'currency'),
+                      ('OpExps_T_17', 'currency'),
+                      ('TranToOthAuthComms_T_18', 'currency'),
+                      ('CandLoansRepaid_T_19a', 'currency'),
+                      ('OthLoansRepaid_T_19b', 'currency'),
+                      ('TotLoansRepaid_T_19c', 'currency'),
+                      ('RefundsInd_T_20a', 'currency'),
+                      ('RefundsPolPtyComms_T_20b', 'currency'),
+                      ('RefundsOthPolComms_T_20c', 'currency'),
+                      ('TotRefunds_T_20d', 'currency'),
+                      ('OthDisb_T_21', 'currency'),
+                      ('TotDisb_T_22', 'currency')],
+               'F3L': [('FormTp', 'text', {'nullstring': True}),
+                       ('CommID', 'text', {'nullstring': True}),
+                       ('CommNm', 'text', {'nullstring': True}),
+                       ('AddrChg', 'bit'),
+                       ('Addr1', 'text', {'nullstring': True}),
+                       ('Addr2', 'text'),
+                       ('City', 'text', {'nullstring': True}),
+                       ('StAbbr', 'text', {'nullstring': True}),
+                       ('Zip', 'text', {'nullstring': True}),
+                       ('ElecSt', 'text', {'nullstring': True}),
+                       ('ElecDist', 'tinyint'),
+                       ('RptCd', 'text', {'nullstring': True}),
+                       ('ElecDt', 'date'),
+                       ('StateOfElec', 'text', {'nullstring': True}),
+                       ('flgInclSemiAnnPrd', 'bit'),
+                       ('CovgFmDt', 'date'),
+                       ('CovgToDt', 'date'),
+                       ('flgInclSemiAnnJanJun', 'bit'),
+                       ('flgInclSemiAnnJulDec', 'bit'),
+                       ('TotRptBundContribs', 'currency'),
+                       ('SemiAnnBundContribs', 'currency'),
+                       ('TrsLName', 'text', {'nullstring': True}),
+                       ('TrsFName', 'text'),
+                       ('TrsMName', 'text'),
+                       ('TrsPfx', 'text'),
+                       ('TrsSfx', 'text'),
+                       ('SignDt', 'date')],
+               'F3P': [('FormTp', 'text', {'nullstring': True}),
+                       ('CommID', 'text', {'nullstring': True}),
+                       ('CommNm', 'text', {'nullstring': True}),
+                       ('AddrChg', 'bit'),
+                       ('Addr1', 'text', {'nullstring': True}),
+                       ('Addr2', 'text'),
+                       ('City', 'text', {'nullstring': True}),
+                       ('StAbbr', 'text', {'nullstring': True}),
+                       ('Zip', 'text', {'nullstring': True}),
+                       ('PrimElec', 'bit'),
+                       ('GenElec', 'bit'),
+                       ('RptCd', 'text', {'nullstring': True}),
+                       ('ElecCd', 'text'),
+                       ('ElecDt', 'date'),
+                       ('ElecSt', 'text', {'nullstring': True}),
+                       ('CovgFmDt', 'date'),
+                       ('CovgToDt', 'date'),
+                       ('TrsFullName', 'fullname', {'label': 'Treasurer'}),
+                       ('TrsLName', 'text', {'nullstring': True}),
+                       ('TrsFName', 'text'),
+                       ('TrsMName', 'text'),
+                       ('TrsPfx', 'text'),
+                       ('TrsSfx', 'text'),
+                       ('SignDt', 'date'),
+                       ('CashBegin_P_6', 'currency'),
+                       ('TotRcpts_P_7', 'currency'),
+                       ('Subtotal_P_8', 'currency'),
+                       ('TotDisb_P_9', 'currency'),
+                       ('CashClose_P_10', 'currency'),
+                       ('DebtsTo_P_11', 'currency'),
+                       ('DebtsBy_P_12', 'currency'),
+                       ('LmtdExps_P_13', 'currency'),
+                       ('NetConts_P_14', 'currency'),
+                       ('NetOpExps_P_15', 'currency'),
+                       ('FedFnds_P_16', 'currency'),
+                       ('IndContsItem_P_17a1', 'currency'),
+                       ('IndContsUnitem_P_17a2', 'currency'),
+                       ('IndContsTot_P_17a3', 'currency'),
+                       ('PolPtyCommConts_P_17b', 'currency'),
+                       ('OthPolCommConts_P_17c', 'currency'),
+                       ('CandConts_P_17d', 'currency'),
+                       ('TotConts_P_17e', 'currency'),
+                       ('TranFmPtyComms_P_18', 'currency'),
+                       ('CandLoans_P_19a', 'currency'),
+                       ('OthLoans_P_19b', 'currency'),
+                       ('TotLoans_P_19c', 'currency'),
+                       ('OptgOffsets_P_20a', 'currency'),
+                       ('FndrsgOffsets_P_20b', 'currency'),
+                       ('LegalAcctgOffsets_P_20c', 'currency'),
+                       ('TotOffsets_P_20d', 'currency'),
+                       ('OthRcpts_P_21', 'currency'),
+                       ('TotRcpts_P_22', 'currency'),
+                       ('OpExps_P_23', 'currency'),
+                       ('TranToOthAuthComms_P_24', 'currency'),
+                       ('FndrsgDisb_P_25', 'currency'),
+                       ('LegalAcctgDisb_P_26', 'currency'),
+                       ('CandLoansRepaid_P_27a', 'currency'),
+                       ('OthLoansRepaid_P_27b', 'currency'),
+                       ('TotLoansRepaid_P_27c', 'currency'),
+                       ('RefundsInd_P_28a', 'currency'),
+                       ('RefundsPolPtyComms_P_28b', 'currency'),
+                       ('RefundsOthPolComms_P_28c', 'currency'),
+                       ('TotRefunds_P_28d', 'currency'),
+                       ('OthDisb_P_29', 'currency'),
+                       ('TotDisb_P_30', 'currency'),
+                       ('ItmsToBeLiq_P_31', 'currency'),
+                       ('Alabama_P', 'currency'),
+                       ('Alaska_P', 'currency'),
+                       ('Arizona_P', 'currency'),
+                       ('Arkansas_P', 'currency'),
+                       ('California_P', 'currency'),
+                       ('Colorado_P', 'currency'),
+                       ('Connecticut_P', 'currency'),
+                       ('Delaware_P', 'currency'),
+                       ('DistCol_P', 'currency'),
+                       ('Florida_P', 'currency'),
+                       ('Georgia_P', 'currency'),
+                       ('Hawaii_P', 'currency'),
+                       ('Idaho_P', 'currency'),
+                       ('Illinois_P', 'currency'),
+                       ('Indiana_P', 'currency'),
+                       ('Iowa_P', 'currency'),
+                       ('Kansas_P', 'currency'),
+                       ('Kentucky_P', 'currency'),
+                       ('Louisiana_P', 'currency'),
+                       ('Maine_P', 'currency'),
+                       ('Maryland_P', 'currency'),
+                       ('Massachusetts_P', 'currency'),
+                       ('Michigan_P', 'currency'),
+                       ('Minnesota_P', 'currency'),
+                       ('Mississippi_P', 'currency'),
+                       ('Missouri_P', 'currency'),
+                       ('Montana_P', 'currency'),
+                       ('Nebraska_P', 'currency'),
+                       ('Nevada_P', 'currency'),
+                       ('NewHampshire_P', 'currency'),
+                       ('NewJersey_P', 'currency'),
+                       ('NewMexico_P', 'currency'),
+                       ('NewYork_P', 'currency'),
+                       ('NorthCarolina_P', 'currency'),
+                       ('NorthDakota_P', 'currency'),
+                       ('Ohio_P', 'currency'),
+                       ('Oklahoma_P', 'currency'),
+                       ('Oregon_P', 'currency'),
+                       ('Pennsylvania_P', 'currency'),
+                       ('RhodeIsland_P', 'currency'),
+                       ('SouthCarolina_P', 'currency'),
+                       ('SouthDakota_P', 'currency'),
+                       ('Tennessee_P', 'currency'),
+                       ('Texas_P', 'currency'),
+                       ('Utah_P', 'currency'),
+                       ('Vermont_P', 'currency'),
+                       ('Virginia_P', 'currency'),
+                       ('Washington_P', 'currency'),
+                       ('WestVirginia_P', 'currency'),
+                       ('Wisconsin_P', 'currency'),
+                       ('Wyoming_P', 'currency'),
+                       ('PuertoRico_P', 'currency'),
+                       ('Guam_P', 'currency'),
+                       ('VirginIslands_P', 'currency'),
+                       ('TotAllocs_P', 'currency'),
+                       ('FedFnds_T_16', 'currency'),
+                       ('IndContsItem_T_17a1', 'currency'),
+                       ('IndContsUnitem_T_17a2', 'currency'),
+                       ('IndContsTot_T_17a3', 'currency'),
+                       ('PolPtyCommConts_T_17b', 'currency'),
+                       ('OthPolCommConts_T_17c', 'currency'),
+                       ('CandConts_T_17d', 'currency'),
+                       ('TotConts_T_17e', 'currency'),
+                       ('TranFmPtyComms_T_18', 'currency'),
+                       ('CandLoans_T_19a', 'currency'),
+                       ('OthLoans_T_19b', 'currency'),
+                       ('TotLoans_T_19c', 'currency'),
+                       ('OptgOffsets_T_20a', 'currency'),
+                       ('FndrsgOffsets_T_20b', 'currency'),
+                       ('LegalAcctgOffsets_T_20c', 'currency'),
+                       ('TotOffsets_T_20d', 'currency'),
+                       ('OthRcpts_T_21', 'currency'),
+                       ('TotRcpts_T_22', 'currency'),
+                       ('OpExps_T_23', 'currency'),
+                       ('TranToOthAuthComms_T_24', 'currency'),
+                       ('FndrsgDisb_T_25', 'currency'),
+                       ('LegalAcctgDisb_T_26', 'currency'),
+                       ('CandLoansRepaid_T_27a', 'currency'),
+                       ('OthLoansRepaid_T_27b', 'currency'),
+                       ('TotLoansRepaid_T_27c', 'currency'),
+                       ('RefundsInd_T_28a', 'currency'),
+                       ('RefundsPolPtyComms_T_28b', 'currency'),
+                       ('RefundsOthPolComms_T_28c', 'currency'),
+                       ('TotRefunds_T_28d', 'currency'),
+                       ('OthDisb_T_29', 'currency'),
+                       ('TotDisb_T_30', 'currency'),
+                       ('Alabama_T', 'currency'),
+                       ('Alaska_T', 'currency'),
+                       ('Arizona_T', 'currency'),
+                       ('Arkansas_T', 'currency'),
+                       ('California_T', 'currency'),
+                       ('Colorado_T', 'currency'),
+                       ('Connecticut_T', 'currency'),
+                       ('Delaware_T', 'currency'),
+                       ('DistCol_T', 'currency'),
+                       ('Florida_T', 'currency'),
+                       ('Georgia_T', 'currency'),
+                       ('Hawaii_T', 'currency'),
+                       ('Idaho_T', 'currency'),
+                       ('Illinois_T', 'currency'),
+                       ('Indiana_T', 'currency'),
+                       ('Iowa_T', 'currency'),
+                       ('Kansas_T', 'currency'),
+                       ('Kentucky_T', 'currency'),
+                       ('Louisiana_T', 'currency'),
+                       ('Maine_T', 'currency'),
+                       ('Maryland_T', 'currency'),
+                       ('Massachusetts_T', 'currency'),
+                       ('Michigan_T', 'currency'),
+                       ('Minnesota_T', 'currency'),
+                       ('Mississippi_T', 'currency'),
+                       ('Missouri_T', 'currency'),
+                       ('Montana_T', 'currency'),
+                       ('Nebraska_T', 'currency'),
+                       ('Nevada_T', 'currency'),
+                       ('NewHampshire_T', 'currency'),
+                       ('NewJersey_T', 'currency'),
+                       ('NewMexico_T', 'currency'),
+                       ('NewYork_T', 'currency'),
+                       ('NorthCarolina_T', 'currency'),
+                       ('NorthDakota_T', 'currency'),
+                       ('Ohio_T', 'currency'),
+                       ('Oklahoma_T', 'currency'),
+                       ('Oregon_T', 'currency'),
+                       ('Pennsylvania_T', 'currency'),
+                       ('RhodeIsland_T', 'currency'),
+                       ('SouthCarolina_T', 'currency'),
+                       ('SouthDakota_T', 'currency'),
+                       ('Tennessee_T', 'currency'),
+                       ('Texas_T', 'currency'),
+                       ('Utah_T', 'currency'),
+                       ('Vermont_T', 'currency'),
+                       ('Virginia_T', 'currency'),
+                       ('Washington_T', 'currency'),
+                       ('WestVirginia_T', 'currency'),
+                       ('Wisconsin_T', 'currency'),
+                       ('Wyoming_T', 'currency'),
+                       ('PuertoRico_T', 'currency'),
+                       ('Guam_T', 'currency'),
+                       ('VirginIslands_T', 'currency'),
+                       ('TotAllocs_T', 'currency')],
+               'F3X': [('FormTp', 'text', {'nullstring': True}),
+                       ('CommID', 'text', {'nullstring': True}),
+                       ('CommNm', 'text', {'nullstring': True}),
+                       ('AddrChg', 'bit'),
+                       ('Addr1', 'text', {'nullstring': True}),
+                       ('Addr2', 'text'),
+                       ('City', 'text', {'nullstring': True}),
+                       ('StAbbr', 'text', {'nullstring': True}),
+                       ('Zip', 'text', {'nullstring': True}),
+                       ('RptCd', 'text', {'nullstring': True}),
+                       ('ElecCd', 'text'),
+                       ('ElecDt', 'date'),
+                       ('ElecSt', 'text', {'nullstring': True}),
+                       ('CovgFmDt', 'date'),
+                       ('CovgToDt', 'date'),
+                       ('flgQualComm', 'bit', {'quoted': True}),
+                       ('TrsFullName', 'fullname', {'label': 'Treasurer'}),
+                       ('TrsLName', 'text', {'nullstring': True}),
+                       ('TrsFName', 'text'),
+                       ('TrsMName', 'text'),
+                       ('TrsPfx', 'text'),
+                       ('TrsSfx', 'text'),
+                       ('SignDt', 'date'),
+                       ('CashBegin_P_6b', 'currency'),
+                       ('TotRcpts_P_6c', 'currency'),
+                       ('Subtotal_P_6d', 'currency'),
+                       ('TotDisb_P_7', 'currency'),
+                       ('CashClose_P_8', 'currency'),
+                       ('DebtsTo_P_9', 'currency'),
+                       ('DebtsBy_P_10', 'currency'),
+                       ('IndContsItem_P_11a1', 'currency'),
+                       ('IndContsUnitem_P_11a2', 'currency'),
+                       ('IndContsTot_P_11a3', 'currency'),
+                       ('PolPtyCommConts_P_11b', 'currency'),
+                       ('OthPolCommConts_P_11c', 'currency'),
+                       ('TotConts_P_11d', 'currency'),
+                       ('TranFmPtyComms_P_12', 'currency'),
+                       ('AllLoansRcvd_P_13', 'currency'),
+                       ('LoanPymtsRcvd_P_14', 'currency'),
+                       ('RefundOffsets_P_15', 'currency'),
+                       ('RefundsFedConts_P_16', 'currency'),
+                       ('OthFedRcptsDvds_P_17', 'currency'),
+                       ('TranFmNonFedAcctH3_P_18a', 'currency'),
+                       ('TranFmNonFedAcctH5_P_18b', 'currency'),
+                       ('TotNonFedTrans_P_18c', 'currency'),
+                       ('TotRcpts_P_19', 'currency'),
+                       ('TotFedRcpts_P_20', 'currency'),
+                       ('OpExpsFedShr_P_21a1', 'currency'),
+                       ('OpExpsNonFedShr_P_21a2', 'currency'),
+                       ('OpExpsOthFed_P_21b', 'currency'),
+                       ('TotOpExps_P_21c', 'currency'),
+                       ('TranToPtyComms_P_22', 'currency'),
+                       ('ContsToFedCandsComms_P_23', 'currency'),
+                       ('IndtExps_P_24', 'currency'),
+                       ('CoordExpsByPtyComms_P_25', 'currency'),
+                       ('LoansRepaid_P_26', 'currency'),
+                       ('LoansMade_P_27', 'currency'),
+                       ('RefundsInd_P_28a', 'currency'),
+                       ('RefundsPolPtyComms_P_28b', 'currency'),
+                       ('RefundsOthPolComms_P_28c', 'currency'),
+                       ('TotContRefunds_P_28d', 'currency'),
+                       ('OthDisb_P_29', 'currency'),
+                       ('ShrdElecActivityFedShr_P_30a1', 'currency'),
+                       ('ShrdElecActivityNonFedShr_P_30a2', 'currency'),
+                       ('NonAllocFedElecActivity_P_30b', 'currency'),
+                       ('TotFedElecActivity_P_30c', 'currency'),
+                       ('TotDisb_P_31', 'currency'),
+                       ('TotFedDisb_P_32', 'currency'),
+                       ('TotConts_P_33', 'currency'),
+                       ('TotContRefunds_P_34', 'currency'),
+                       ('NetConts_P_35', 'currency'),
+                       ('TotFedOpExps_P_36', 'currency'),
+                       ('TotOffsetsOpExp_P_37', 'currency'),
+                       ('NetOpExps_P_38', 'currency'),
+                       ('CashBegin_T_6a', 'currency'),
+                       ('CashBeginYr', 'currency'),
+                       ('TotRcpts_T_6c', 'currency'),
+                       ('Subtotal_T_6d', 'currency'),
+                       ('TotDisb_T_7', 'currency'),
+                       ('CashClose_T_8', 'currency'),
+                       ('IndContsItem_T_11a1', 'currency'),
+                       ('IndContsUnitem_T_11a2', 'currency'),
+                       ('IndContsTot_T_11a3', 'currency'),
+                       ('PolPtyCommConts_T_11b', 'currency'),
+                       ('OthPolCommConts_T_11c', 'currency'),
+                       ('TotConts_T_11d', 'currency'),
+                       ('TranFmPtyComms_T_12', 'currency'),
+                       ('AllLoansRcvd_T_13', 'currency'),
+                       ('LoanPymtsRcvd_T_14', 'currency'),
+                       ('RefundOffsets_T_15', 'currency'),
+                       ('RefundsFedConts_T_16', 'currency'),
+                       ('OthFedRcptsDvds_T_17', 'currency'),
+                       ('TranFmNonFedAcctH3_T_18a', 'currency'),
+                       ('TranFmNonFedAcctH5_T_18b', 'currency'),
+                       ('TotNonFedTrans_T_18c', 'currency'),
+                       ('TotRcpts_T_19', 'currency'),
+                       ('TotFedRcpts_T_20', 'currency'),
+                       ('OpExpsFedShr_T_21a1', 'currency'),
+                       ('OpExpsNonFedShr_T_21a2', 'currency'),
+                       ('OpExpsOthFed_T_21b', 'currency'),
+                       ('TotOpExps_T_21c', 'currency'),
+                       ('TranToPtyComms_T_22', 'currency'),
+                       ('ContsToFedCandsComms_T_23', 'currency'),
+                       ('IndtExps_T_24', 'currency'),
+                       ('CoordExpsByPtyComms_T_25', 'currency'),
+                       ('LoansRepaid_T_26', 'currency'),
+                       ('LoansMade_T_27', 'currency'),
+                       ('RefundsInd_T_28a', 'currency'),
+                       ('RefundsPolPtyComms_T_28b', 'currency'),
+                       ('RefundsOthPolComms_T_28c', 'currency'),
+                       ('TotContRefunds_T_28d', 'currency'),
+                       ('OthDisb_T_29', 'currency'),
+                       ('ShrdElecActivityFedShr_T_30a1', 'currency'),
+                       ('ShrdElecActivityNonFedShr_T_30a2', 'currency'),
+                       ('NonAllocFedElecActivity_T_30b', 'currency'),
+                       ('TotFedElecActivity_T_30c', 'currency'),
+                       ('TotDisb_T_31', 'currency'),
+                       ('TotFedDisb_T_32', 'currency'),
+                       ('TotConts_T_33', 'currency'),
+                       ('TotContRefunds_T_34', 'currency'),
+                       ('NetConts_T_35', 'currency'),
+                       ('TotFedOpExps_T_36', 'currency'),
+                       ('TotOffsetsOpExp_T_37', 'currency'),
+                       ('NetOpExps_T_38', 'currency')],
+               'F1': [('FormTp', 'text', {'nullstring': True}),
+                      ('CommID', 'text', {'nullstring': True}),
+                      ('flgChgCommNm', 'bit'),
+                      ('CommNm', 'text', {'nullstring': True}),
+                      ('flgAddrChg', 'bit'),
+                      ('Addr1', 'text', {'nullstring': True}),
+                      ('Addr2', 'text'),
+                      ('City', 'text', {'nullstring': True}),
+                      ('StAbbr', 'text', {'nullstring': True}),
+                      ('Zip', 'text', {'nullstring': True}),
+                      ('flgChgCommEmail', 'bit'),
+                      ('CommEmail', 'text'),
+                      ('flgChgCommUrl', 'bit'),
+                      ('CommUrl', 'text', {'nullstring': True}),
+                      ('SubmDt', 'date'),
+                      ('SignFullName', 'fullname', {'label': 'Signer'}),
+                      ('SignLName', 'text', {'nullstring': True}),
+                      ('SignFName', 'text'),
+                      ('SignMName', 'text'),
+                      ('SignPfx', 'text'),
+                      ('SignSfx', 'text'),
+                      ('SignDt', 'date'),
+                      ('CommTp', 'text', {'nullstring': True}),
+                      ('CandID', 'text', {'nullstring': True}),
+                      ('CandFullName', 'fullname', {'label': 'Candidate'}),
+                      ('CandLName', 'text'),
+                      ('CandFName', 'text'),
+                      ('CandMName', 'text'),
+                      ('CandPfx', 'text'),
+                      ('CandSfx', 'text'),
+                      ('CandOff', 'text', {'nullstring': True}),
+                      ('CandStAbbr', 'text', {'nullstring': True}),
+                      ('CandDist', 'tinyint'),
+                      ('PtyCd', 'text', {'nullstring': True}),
+                      ('PtyTp', 'text', {'nullstring': True}),
+                      ('PACTp', 'text', {'nullstring': True}),
+                      ('flgLobRegPAC_ConnOrg_5e', 'bit'),
+                      ('flgLobRegPAC_MultCands_5f', 'bit'),
+                      ('flgLdspPAC_5f', 'bit'),
+                      ('AffCommID', 'text', {'nullstring': True}),
+                      ('AffCommNm', 'text'),
+                      ('AffCandID', 'text', {'nullstring': True}),
+                      ('AffCandLName', 'text'),
+                      ('AffCandFName', 'text'),
+                      ('AffCandMName', 'text'),
+                      ('AffCandPfx', 'text'),
+                      ('AffCandSfx', 'text'),
+                      ('AffAddr1', 'text'),
+                      ('AffAddr2', 'text'),
+                      ('AffCity', 'text'),
+                      ('AffStAbbr', 'text', {'nullstring': True}),
+                      ('AffZip', 'text'),
+                      ('AffRelCd', 'text', {'nullstring': True, 'upper': True}),
+                      ('CustFullName', 'fullname', {'label': 'Custodian'}),
+                      ('CustLName', 'text'),
+                      ('CustFName', 'text'),
+                      ('CustMName', 'text'),
+                      ('CustPfx', 'text'),
+                      ('CustSfx', 'text'),
+                      ('CustAddr1', 'text'),
+                      ('CustAddr2', 'text'),
+                      ('CustCity', 'text'),
+                      ('CustStAbbr', 'text', {'nullstring': True}),
+                      ('CustZip', 'text'),
+                      ('CustTitle', 'text'),
+                      ('CustPhone', 'text'),
+                      ('TrsFullName', 'fullname', {'label': 'Treasurer'}),
+                      ('TrsLName', 'text'),
+                      ('TrsFName', 'text'),
+                      ('TrsMName', 'text'),
+                      ('TrsPfx', 'text'),
+                      ('TrsSfx', 'text'),
+                      ('TrsAddr1', 'text'),
+                      ('TrsAddr2', 'text'),
+                      ('TrsCity', 'text'),
+                      ('TrsStAbbr', 'text', {'nullstring': True}),
+                      ('TrsZip', 'text'),
+                      ('TrsTitle', 'text'),
+                      ('TrsPhone', 'text'),
+                      ('AgtFullName', 'fullname', {'label': 'Agent'}),
+                      ('AgtLName', 'text'),
+                      ('AgtFName', 'text'),
+                      ('AgtMName', 'text'),
+                      ('AgtPfx', 'text'),
+                      ('AgtSfx', 'text'),
+                      ('AgtAddr1', 'text'),
+                      ('AgtAddr2', 'text'),
+                      ('AgtCity', 'text'),
+                      ('AgtStAbbr', 'text', {'nullstring': True}),
+                      ('AgtZip', 'text'),
+                      ('AgtTitle', 'text'),
+                      ('AgtPhone', 'text'),
+                      ('Bank1Nm', 'text'),
+                      ('Bank1Addr1', 'text'),
+                      ('Bank1Addr2', 'text'),
+                      ('Bank1City', 'text'),
+                      ('Bank1StAbbr', 'text', {'nullstring': True}),
+                      ('Bank1Zip', 'text'),
+                      ('Bank2Nm', 'text'),
+                      ('Bank2Addr1', 'text'),
+                      ('Bank2Addr2', 'text'),
+                      ('Bank2City', 'text'),
+                      ('Bank2StAbbr', 'text', {'nullstring': True}),
+                      ('Bank2Zip', 'text')]}
+
+
+# Prefix used to name the data file for each form type
+outputfilenames = {'SA': 'SchedA',
+                   'SB': 'SchedB',
+                   'SC': 'SchedC',
+                   'SC1': 'SchedC1',
+                   'SC2': 'SchedC2',
+                   'SD': 'SchedD',
+                   'SE': 'SchedE',
+                   'SF': 'SchedF',
+                   'H1': 'SchedH1',
+                   'H2': 'SchedH2',
+                   'H3': 'SchedH3',
+                   'H4': 'SchedH4',
+                   'H5': 'SchedH5',
+                   'H6': 'SchedH6',
+                   'SI': 'SchedI',
+                   'SL': 'SchedL',
+                   'TEXT': 'Text',
+                   'F1S': 'F1S'}
+
+# Fields written for each bad value when ERRORLOGFORMAT is 'tsv' or 'jsonl'
+ERRORLOGFIELDS = ['ErrorType', 'ImageID', 'Schedule', 'TransID', 'RowNbr', 'FormTp', 'FieldName', 'Value', 'Detail']
+
+# Error log entries waiting to be written, the open error log file
+# handles, the number of entries logged for each error type and the
+# error logs that house bad values
+errorlogbuffers = {}
+errorloghandles = {}
+errorcounts = {}
+valuelogs = set()
+
+# Database connection used by this process, its cursor and the number
+# of header loads not yet committed
+dbconn = {'conn': None, 'cursor': None, 'uncommitted': 0}
+
+# Normalized dates keyed by raw value and date format, in least recently
+# used order, and the offsets compiled for each date format
+datecache = collections.OrderedDict()
+dateformats = {}
+
+# Parsed full names keyed by the raw name and name delimiter, with the
+# least recently used names first, and the number of names found in and
+# missing from the cache
+namecache = collections.OrderedDict()
+namecachestats = {'hits': 0, 'misses': 0}
+
+# Pattern matching a field in a comma-delimited line: a quoted field
+# that is closed before the next comma or the end of the line, or
+# everything up to the next comma
+commafieldpattern = re.compile(r' *"((?:[^"]|"")*)" *(?=,|\Z)|([^,]*)')
+
+# Pattern matching numeric literals in SQL statements
+numberpattern = re.compile(r'[-+]?([0-9]+\.?[0-9]*|\.[0-9]+)([eE][-+]?[0-9]+)?\Z')
+
+# Pattern time.strptime uses to match '%m/%d/%Y'
+datepattern = re.compile(r'(1[0-2]|0[1-9]|[1-9])/(3[01]|[12][0-9]|0[1-9]|[1-9]| [1-9])/([0-9]{4})\Z')
+
+
+def add_bad_value_to_error_log(logfile, fields, logtext=None):
+    # Logs a value that could not be validated. fields is a tuple
+    # housing the image ID, schedule, transaction ID, row number, form
+    # type, field name and value, optionally followed by a detail such
+    # as the date format. When ERRORLOGFORMAT is 'text', logtext is
+    # logged if supplied; otherwise the fields are tab-delimited.
+    valuelogs.add(logfile)
+    if ERRORLOGFORMAT == 'text':
+        if logtext is None:
+            logtext = '\t'.join([str(field) for field in fields])
+    else:
+        fields = (os.path.splitext(os.path.basename(logfile))[0],) + tuple(fields)
+        fields += ('',) * (len(ERRORLOGFIELDS) - len(fields))
+        if ERRORLOGFORMAT == 'jsonl':
+            logtext = json.dumps(dict(zip(ERRORLOGFIELDS, fields)), encoding='latin-1', sort_keys=True)
         else:
-            output.append(data[header])
+            logtext = '\t'.join([str(field).replace('\t', ' ').replace('\n', ' ') for field in fields])
+    add_entry_to_error_log(logfile, logtext)
+
+
+def add_entry_to_error_log(logfile, logtext):
+    # Buffers an entry for logfile. The buffer is written once it holds
+    # ERRORLOGBATCH entries or when flush_error_logs is called.
+    entries = errorlogbuffers.setdefault(logfile, [])
+    entries.append(logtext.strip() + '\n')
+    errortype = os.path.splitext(os.path.basename(logfile))[0]
+    errorcounts[errortype] = errorcounts.get(errortype, 0) + 1
+    if len(entries) >= ERRORLOGBATCH:
+        write_error_log(logfile)
+
+
+def build_column_plans():
+    # Compile a column plan for every form type and version housed in
+    # the row header registry. Rows are held as lists with one value for
+    # each output header of their form type, in the order of outputhdrs,
+    # whatever the version. Each plan is a tuple housing:
+    # * the number of output headers, including full name fields
+    # * (source column position, output column position) pairs for every
+    #   column in the data row that is mapped to an output header
+    # * the number of columns written to the data file. The full name
+    #   fields are the last output headers, so they are left off by
+    #   writing only this many leading columns.
+    # * an itemgetter that picks the source column of every output
+    #   header in order, or the last column for headers the data row
+    #   doesn't house, so a blank value can be appended to the row
+    # * the number of columns a data row needs for the itemgetter
+    # Call this function only after full name fields have been appended
+    # to outputhdrs.
+    plans = {}
+    for (formtype, version), rowhdrs in rowhdrregistry.items():
+        if formtype not in outputhdrs:
+            continue
+        linehdrs = outputhdrs[formtype]
+        positions = dict((hdr, x) for x, hdr in enumerate(linehdrs))
+        fieldmap = tuple((x, positions[hdr]) for x, hdr in enumerate(rowhdrs) if hdr in positions)
+        outcols = len(linehdrs) - len(fullnamehdrs.get(formtype, []))
+        sources = [-1] * len(linehdrs)
+        for x, y in fieldmap:
+            sources[y] = x
+        plans[(formtype, version)] = (len(linehdrs), fieldmap, outcols, operator.itemgetter(*sources),
+                                      max([x + 1 for x in sources]))
+    return plans
+
+
+def build_data_row(data, outcols, imageid, rpttype):
+    if rpttype is None:
+        output = [str(imageid)]
+    else:
+        output = [str(imageid), rpttype]
+    output.extend([val or '' for val in data[:outcols]])
     return output
 
 
+def build_form_type_trie():
+    # Compile the output form types into a trie of nested dictionaries
+    # keyed by character, so the form type of a record type code can be
+    # found by walking the code once. The form type ending at a node is
+    # housed under the None key.
+    trie = {}
+    for formtype in outputhdrs.keys():
+        node = trie
+        for char in formtype:
+            node = node.setdefault(char, {})
+        node[None] = formtype
+    return trie
+
+
 def build_list_of_supported_report_types():
     types = []
     for hdr in filehdrs:
@@ -1202,8 +2532,241 @@ def build_list_of_supported_report_types():
     return types
 
 
-def ck_curr_val(val, image, fieldname, formtype, rownbr):
-    errfile = RPTERRDIR + 'BadDates.log'
+def build_char_matrix(vals, width=1):
+    # Converts a column of values to a NumPy matrix with a row of
+    # character codes for each value, padded with zeros to at least width
+    # characters. Returns the values (with None replaced by an empty
+    # string), the matrix and a mask of the characters in each value.
+    vals = [val or '' for val in vals]
+    column = numpy.array(vals, dtype=str)
+    chars = column.view(numpy.uint8).reshape(len(vals), column.itemsize)
+    if chars.shape[1] < width:
+        chars = numpy.hstack([chars, numpy.zeros((len(vals), width - chars.shape[1]), numpy.uint8)])
+    lengths = numpy.array([len(val) for val in vals])
+    inside = numpy.arange(chars.shape[1]) < lengths[:, None]
+    return vals, chars, inside
+
+
+def build_output_files(filestamp, shard=''):
+    # Returns a dictionary housing the path of the data file for each
+    # form type plus the OtherData file. When shard is specified, it is
+    # appended to each filename so worker processes can write their own
+    # files.
+    if shard != '':
+        filestamp = filestamp + '_' + shard
+    outputfiles = {'OtherData': RPTOUTDIR + 'OtherData_' + filestamp + '.txt'}
+    for formtype, filename in outputfilenames.items():
+        outputfiles[formtype] = RPTOUTDIR + filename + '_' + filestamp + '.txt'
+    return outputfiles
+
+
+def build_row_header_registry():
+    # Compile filehdrs into a dictionary keyed by (form type, version)
+    # so row headers can be retrieved without scanning filehdrs. When a
+    # version is listed more than once for a form type, the last entry
+    # wins, matching the original linear scan.
+    registry = {}
+    for hdr in filehdrs:
+        for subhdr in hdr[1]:
+            for version in subhdr[0]:
+                registry[(hdr[0], version)] = tuple(subhdr[1])
+    return registry
+
+
+def build_rpt_hdr_call(rpttype, imageid, rowdata, filehdr, outputhdrs):
+    # Builds the parameterized stored procedure call that loads a report
+    # header into the database. Returns a tuple housing the ImageID, the
+    # SQL and the parameter values. The validators return SQL literals,
+    # which are converted to parameter values by convert_sql_literal.
+    params = [imageid]
+
+    # Add report header data values
+    # Ignore full names
+    for hdr in outputhdrs:
+        if hdr == 'TrsFullName' or hdr == 'SignFullName' or hdr == 'AgtFullName' or hdr == 'CustFullName' or hdr == 'CandFullName':
+            continue
+        params.append(convert_sql_literal(rowdata[hdr]))
+
+    # Add file header data values
+    params.append(convert_sql_literal(str(filehdr['Ver'])))
+    params.append(convert_sql_literal(clean_sql_literal(filehdr['SftNm'])))
+    params.append(convert_sql_literal(clean_sql_literal(filehdr['SftVer'])))
+    params.append(convert_sql_literal(clean_sql_literal(filehdr['RptID'])))
+    params.append(convert_sql_literal(clean_sql_literal(filehdr['RptNbr'])))
+    params.append(convert_sql_literal(clean_sql_literal(filehdr['HdrCmnt'])))
+
+    # The SQL is the same for every report of a type, so the statement
+    # can be prepared once and reused
+    sql = 'EXEC dbo.usp_AddRptHdr_' + rpttype + ' ' + ', '.join(['?'] * len(params))
+    return imageid, sql, params
+
+
+def build_validator(formtype, fields, header=False, deferred=False):
+    # Compiles the field spec of a form type (see rowspecs) into a
+    # function that validates a data row, or of a report type (see
+    # rpthdrspecs) into a function that validates a report header. The
+    # generated function works on local variables, reading each field
+    # from the data once and writing every field back at the end, so new
+    # form versions need only a spec edit. Report headers are
+    # dictionaries. Data rows are lists laid out like outputhdrs (see
+    # build_column_plans), so each field is read from and written to a
+    # fixed position. When deferred is True, currency and integer fields
+    # are left for validate_batch.
+    if header:
+        code = ["def check_rpt_hdrs_%s(image, data, namedelim='', dateformat='CCYYMMDD'):" % formtype.lower()]
+        linenbr, rownbr, trans = "'Header'", '0', "''"
+        rowdata = 'data'
+    else:
+        code = ["def check_row_data_%s(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):" % formtype.lower()]
+        rowdata = 'dict(zip(outputhdrs[%r], data))' % formtype
+    values = []
+
+    def value(field):
+        # Current value of a field: its local variable once it has been
+        # validated, or the raw value in the data
+        if field in values:
+            return field
+        if header:
+            return 'data[%r]' % field
+        return 'data[%d]' % outputhdrs[formtype].index(field)
+
+    def assign(field, expr):
+        code.append('    %s = %s' % (field, expr))
+        if field not in values:
+            values.append(field)
+
+    def write_back(indent):
+        if header:
+            code.append(indent + 'data.update({%s})' % ', '.join(['%r: %s' % (field, field) for field in values]))
+        else:
+            for field in values:
+                code.append(indent + 'data[%d] = %s' % (outputhdrs[formtype].index(field), field))
+
+    for spec in fields:
+        field, fieldtype = spec[0], spec[1]
+        options = {}
+        if len(spec) > 2:
+            options = spec[2]
+        if not re.match(r'[A-Za-z]\w*\Z', field) or field in ('data', 'image', 'rownbr', 'namedelim',
+                                                                'dateformat', 'fullname'):
+            raise ValueError('Field name ' + field + ' in the ' + formtype + ' spec can\'t be compiled.')
+        # Error log entries name the row's line number and transaction
+        # ID. Rows without them, such as F1S rows, have no fields that
+        # are logged.
+        if not header and fieldtype in ('currency', 'date', 'tinyint', 'district'):
+            linenbr, rownbr, trans = value('LineNbr'), 'rownbr', value('TransID')
+
+        if fieldtype == 'text':
+            if header:
+                expr = 'clean_sql_literal(%s, %r)' % (value(field), 'nullstring' if options.get('nullstring') else '')
+            else:
+                expr = 'clean_sql_text(%s)' % value(field)
+            if options.get('upper'):
+                expr += '.upper()'
+            assign(field, expr)
+            if 'maxlen' in options:
+                code.append('    if len(%s) > %d:' % (field, options['maxlen']))
+                write_back('        ')
+                code.append('        print((%r, image, rownbr, %s))' % (field + ' field too long.', rowdata))
+                code.append('        sys.exit((%r, image, rownbr, %s))' % (field + ' field too long.', rowdata))
+        elif fieldtype == 'bit':
+            expr = 'clean_sql_text(%s)'
+            if options.get('quoted'):
+                expr = 'clean_sql_literal(%s)'
+            assign(field, 'convert_to_bit(%s)' % (expr % value(field)))
+        elif fieldtype == 'currency':
+            if deferred:
+                continue
+            assign(field, 'ck_curr_val(%s, image, %r, %s, %s, %r, %s)' % (
+                value(field), field, linenbr, rownbr, formtype, trans))
+        elif fieldtype == 'date':
+            expr = 'convert_to_date(%s, dateformat, image, %r, %s, %s, %r, %s)' % (
+                value(field), field, linenbr, rownbr, formtype, trans)
+            if header:
+                # Report header dates are SQL literals
+                assign(field, '"\'" + %s + "\'"' % expr)
+                code.append('    if %s == "\'\'":' % field)
+                code.append("        %s = 'NULL'" % field)
+            else:
+                assign(field, expr)
+        elif fieldtype == 'tinyint' or fieldtype == 'district':
+            if fieldtype == 'district':
+                # Some filers put the state or NA in the district field
+                assign(field, value(field))
+                code.append('    if %s == %s:' % (field, value(options['state'])))
+                code.append('        try:')
+                code.append('            float(%s)' % field)
+                code.append('        except:')
+                code.append('            %s = None' % field)
+                code.append("    elif %s == 'NA' or %s == '**':" % (field, field))
+                code.append('        %s = None' % field)
+            if deferred:
+                continue
+            assign(field, 'convert_to_tinyint(%s, image, %r, %s, %s, %r, %s)' % (
+                value(field), field, linenbr, rownbr, formtype, trans))
+        elif fieldtype == 'fullname':
+            # Split the full name into its component fields unless that
+            # would overwrite them
+            prefix = field[:-len('FullName')]
+            parts = [prefix + part for part in ('LName', 'FName', 'MName', 'Pfx', 'Sfx')]
+            for part in parts:
+                assign(part, value(part))
+            assign(field, value(field))
+            code.append("    if %s != '':" % field)
+            code.append('        if %s:' % ' or '.join([part + " != ''" for part in parts]))
+            code.append("            add_entry_to_error_log(RPTERRDIR + 'ErrorMessages.log', %r + %s + %r + str(image) + %r)" % (
+                options['label'] + ' full name (', field, ') could not be parsed for ',
+                ' because that would overwrite existing data. This script will attempt to add this data row to the '
+                'database, but the full name field will be ignored.'))
+            code.append("        elif namedelim != '':")
+            code.append('            fullname = parse_full_name(%s, namedelim)' % field)
+            for x, part in enumerate(parts):
+                code.append('            %s = fullname[%d]' % (part, x))
+            code.append('        else:')
+            code.append('            %s = %s' % (parts[0], field))
+        else:
+            raise ValueError('Unknown field type ' + fieldtype + ' in the ' + formtype + ' spec.')
+
+    write_back('    ')
+    code.append('    return data')
+
+    namespace = {}
+    exec(compile('\n'.join(code) + '\n', '<' + formtype + ' validator>', 'exec'), globals(), namespace)
+    return namespace.values()[0]
+
+
+def check_currency_column(vals):
+    # Checks a column of currency values with NumPy. Returns a list
+    # housing, for each value, the value ck_curr_val would return or None
+    # if the value isn't a plain decimal number (digits, at most one
+    # decimal point and an optional leading sign) and must be checked by
+    # ck_curr_val.
+    vals, chars, inside = build_char_matrix(vals)
+    digits = (chars >= ord('0')) & (chars <= ord('9'))
+    points = chars == ord('.')
+    allowed = digits | points | ~inside
+    allowed[:, 0] |= (chars[:, 0] == ord('-')) | (chars[:, 0] == ord('+'))
+    valid = allowed.all(axis=1) & (points.sum(axis=1) <= 1) & digits.any(axis=1)
+    valid |= ~inside[:, 0]
+    return [val if ok else None for val, ok in itertools.izip(vals, valid.tolist())]
+
+
+def check_tinyint_column(vals):
+    # Checks a column of integer values with NumPy. Returns a list
+    # housing, for each value, the value convert_to_tinyint would return
+    # or None if the value isn't one to three digits from 0 to 255 and
+    # must be checked by convert_to_tinyint.
+    vals, chars, inside = build_char_matrix(vals, 3)
+    digits = (chars >= ord('0')) & (chars <= ord('9'))
+    valid = (digits | ~inside).all(axis=1) & ~inside[:, 3:].any(axis=1)
+    places = inside[:, :3].sum(axis=1)[:, None] - numpy.arange(1, 4)
+    nums = numpy.where(inside[:, :3], (chars[:, :3] - ord('0')) * 10 ** numpy.maximum(places, 0), 0).sum(axis=1)
+    valid &= nums <= 255
+    return [(val and str(num)) if ok else None for val, num, ok in itertools.izip(vals, nums.tolist(), valid.tolist())]
+
+
+def ck_curr_val(val, image, fieldname, formtype, rownbr, sched='', trans=''):
+    errfile = RPTERRDIR + 'BadCurrency.log'
     try:
         if val == None:
             return ''
@@ -1214,30 +2777,129 @@ def ck_curr_val(val, image, fieldname, formtype, rownbr):
             float(val)
             return val
     except:
-        add_entry_to_error_log(errfile,
-                               'Unable to convert ' + fieldname + ' field (value: "' + val + '") to number for row ' + str(
-                                   rownbr) + ' (form type: ' + formtype + ') of ' + str(image) + '.')
+        add_bad_value_to_error_log(errfile, (image, sched, trans, rownbr, formtype, fieldname, val),
+                                   'Unable to convert ' + fieldname + ' field (value: "' + val + '") to number for row ' + str(
+                                       rownbr) + ' (form type: ' + formtype + ') of ' + str(image) + '.')
         return ''
 
 
+def clean_sql_literal(val, nullstring=''):
+    # Returns the same value as clean_sql_text(val, nullstring, "'"): the
+    # cleaned text quoted as a SQL literal, with apostrophes doubled. Used
+    # by the report header validators.
+    val = val.strip(' "')
+    if val == '':
+        return nullstring
+    if "'" in val:
+        while val.find("''") != -1:
+            val = val.replace("''", "'")
+        val = val.replace("'", "''")
+    if '"' in val:
+        while val.find('""') != -1:
+            val = val.replace('""', '"')
+    return "'" + val + "'"
+
+
 def clean_sql_text(val, nullstring='', outputtextdelim=''):
     # This function removes leading and trailing quotation marks and whitespace
     # and converts any instances of an apostrope to two apostrophes so the
     # text can be imported into SQL Server.
     # nullstring value returned when None or empty string found.
+    # Most values house no quotation marks, so they are returned as soon
+    # as they are stripped.
     val = val.strip(' "')
-    if val == None:
-        return nullstring
-    elif val == '':
+    if val == '':
         return nullstring
-    else:
+    elif outputtextdelim == "'":
+        return clean_sql_literal(val, nullstring)
+    elif "'" in val or '"' in val:
         while val.find("''") != -1:
             val = val.replace("''", "'")
         while val.find('""') != -1:
             val = val.replace('""', '"')
-        if outputtextdelim == "'":
-            val = val.replace("'", "''")
-        return outputtextdelim + val + outputtextdelim
+    if outputtextdelim == '':
+        return val
+    return outputtextdelim + val + outputtextdelim
+
+
+def close_db_connection(commit=True):
+    # Commits any outstanding database work, unless commit is False, and
+    # closes this process's database connection
+    if dbconn['conn'] is None:
+        return
+    try:
+        if commit:
+            commit_db_work()
+    finally:
+        try:
+            dbconn['conn'].close()
+        except pyodbc.Error:
+            pass
+        dbconn['conn'] = None
+        dbconn['cursor'] = None
+        dbconn['uncommitted'] = 0
+
+
+def close_error_logs():
+    # Writes any buffered error log entries and closes the error logs
+    flush_error_logs()
+    for handle in errorloghandles.values():
+        handle.close()
+    errorloghandles.clear()
+
+
+def close_output_files(outputs):
+    for outputfile in outputs.values():
+        outputfile.close()
+
+
+def commit_db_work():
+    # Commits any outstanding work on this process's database connection
+    if dbconn['conn'] is not None and dbconn['uncommitted'] > 0:
+        dbconn['conn'].commit()
+        dbconn['uncommitted'] = 0
+
+
+def compile_date_format(dateformat):
+    # Returns the offsets of the month, day and year in dates that use
+    # dateformat and the number of digits in the year (0 if the format
+    # has no year). Formats are compiled once and then reused.
+    if dateformat not in dateformats:
+        monthpos = dateformat.find('MM')
+        daypos = dateformat.find('DD')
+        yearpos, yearlen = -1, 0
+        for yearfmt in ['CCYY', 'YYYY', 'YY']:
+            if dateformat.find(yearfmt) != -1:
+                yearpos, yearlen = dateformat.find(yearfmt), len(yearfmt)
+                break
+        dateformats[dateformat] = (monthpos, daypos, yearpos, yearlen)
+    return dateformats[dateformat]
+
+
+def convert_sql_literal(val):
+    # Converts a SQL literal returned by a validator to a parameter value
+    # the way SQL Server reads the literal in an EXEC statement: NULL and
+    # empty values become None, 'nullstring' an empty string, quoted text
+    # the unquoted text, numbers an int, Decimal or float and any other
+    # unquoted word a string
+    if val == None:
+        return None
+    val = val.strip()
+    if val == '' or val.upper() == 'NULL':
+        return None
+    elif val == 'nullstring':
+        return ''
+    elif len(val) > 1 and val.startswith("'") and val.endswith("'"):
+        return val[1:-1].replace("''", "'")
+    match = numberpattern.match(val)
+    if match is None:
+        return val
+    elif match.group(2):
+        return float(val)
+    elif val.find('.') != -1:
+        return decimal.Decimal(val)
+    else:
+        return int(val)
 
 
 def convert_to_bit(val):
@@ -1254,73 +2916,28 @@ def convert_to_bit(val):
 
 
 def convert_to_date(val, dateformat, image, fieldname, formtype, rownbr, sched, trans=''):
-    errfile = RPTERRDIR + 'BadDates.log'
     if val == None:
         return ''
     val = val.strip(' "')
     if val == '':
         return ''
-    else:
-        try:
-            year = ''
-            month = ''
-            day = ''
-            currtime = datetime.datetime.now()
-            curryear = int(currtime.strftime('%Y'))
-            # First see if date string is M/D/(CC)YY or M-D-(CC)YY
-            if val.find('/') != -1:
-                if val[val.find('/') + 1:].find('/') != -1:
-                    x1 = val.find('/')
-                    x2 = x1 + val[x1 + 1:].find('/') + 1
-                    month = val[:x1].lstrip('0')
-                    day = val[x1 + 1:x2].lstrip('0')
-                    year = val[x2 + 1:]
-                    if int(year) < 10:
-                        year = '0' + year
-                    if int(year) < 100:
-                        year = '20' + year
-                    if int(year) > curryear:
-                        year = '19' + year[-2:]
-            elif val.find('-') != -1:
-                if val[val.find('-') + 1:].find('-') != -1:
-                    x1 = val.find('-')
-                    x2 = x1 + val[x1 + 1:].find('-') + 1
-                    month = val[:x1].lstrip('0')
-                    day = val[x1 + 1:x2].lstrip('0')
-                    year = val[x2 + 1:]
-                    if int(year) < 10:
-                        year = '0' + year
-                    if int(year) < 100:
-                        year = '20' + year
-                    if int(year) > curryear:
-                        year = '19' + year[-2:]
-            else:
-                month = dateformat.find('MM')
-                month = val[month:month + 2]  # .lstrip('0')
-                day = dateformat.find('DD')
-                day = val[day:day + 2]  # .lstrip('0')
-                if dateformat.find('CCYY') != -1:
-                    year = val[dateformat.find('CCYY'):dateformat.find('CCYY') + 4]
-                elif dateformat.find('YYYY') != -1:
-                    year = val[dateformat.find('YYYY'):dateformat.find('YYYY') + 4]
-                elif dateformat.find('YY') != -1:
-                    year = '20' + val[dateformat.find('YY'):dateformat.find('YY') + 2]
-                    if int(year) > curryear:
-                        year = '19' + val[-2:]
-                else:
-                    add_entry_to_error_log(errfile, str(image) + '\t' + sched + '\t' + trans + '\t' + str(
-                        rownbr) + '\t' + formtype + '\t' + fieldname + '\t' + val + '\t' + dateformat)
-                    with open(errfile, 'a+b') as output:
-                        output.write(errtxt + '\n')
-                    return ''
-            datestring = month + '/' + day + '/' + year
-            datadate = time.strptime(datestring, '%m/%d/%Y')
-            return datestring
 
-        except:
-            add_entry_to_error_log(errfile, str(image) + '\t' + sched + '\t' + trans + '\t' + str(
-                rownbr) + '\t' + formtype + '\t' + fieldname + '\t' + val + '\t' + dateformat)
-            return ''
+    # Look up the normalized date, moving it to the end of the cache so
+    # the least recently used dates are discarded first
+    key = (val, dateformat)
+    try:
+        datestring = datecache.pop(key)
+    except KeyError:
+        datestring = normalize_date(val, dateformat)
+        if len(datecache) >= DATECACHESIZE:
+            datecache.popitem(False)
+    datecache[key] = datestring
+
+    if datestring is None:
+        add_bad_value_to_error_log(RPTERRDIR + 'BadDates.log',
+                                   (image, sched, trans, rownbr, formtype, fieldname, val, dateformat))
+        return ''
+    return datestring
 
 
 def convert_to_tinyint(val, image, fieldname, formtype, rownbr, sched, trans=''):
@@ -1334,14 +2951,12 @@ def convert_to_tinyint(val, image, fieldname, formtype, rownbr, sched, trans='')
         try:
             x = int(val)
             if x < 0 or x > 255:
-                add_entry_to_error_log(errfile, str(image) + '\t' + sched + '\t' + trans + '\t' + str(
-                    rownbr) + '\t' + formtype + '\t' + fieldname + '\t' + val)
+                add_bad_value_to_error_log(errfile, (image, sched, trans, rownbr, formtype, fieldname, val))
                 return ''
             else:
                 return str(x)
         except:
-            add_entry_to_error_log(errfile, str(image) + '\t' + sched + '\t' + trans + '\t' + str(
-                rownbr) + '\t' + formtype + '\t' + fieldname + '\t' + val)
+            add_bad_value_to_error_log(errfile, (image, sched, trans, rownbr, formtype, fieldname, val))
             return ''
 
 
@@ -1350,85 +2965,436 @@ def create_file_timestamp():
     return filetime.strftime('%Y%m%d%H%M')
 
 
+def execute_db_sql(sql, params=(), connstr=DBCONNSTR, nresults=1):
+    # Runs sql with params on this process's database connection, which
+    # is opened on first use and reused for the rest of the run. sql may
+    # house several statements; returns the first value of each of the
+    # first nresults result sets. Work is committed once DBCOMMITBATCH
+    # statements are outstanding. If the connection has been lost, it is
+    # reopened and sql is retried once, provided no uncommitted work is
+    # lost.
+    if pyodbc is None:
+        raise ImportError('pyodbc is required to load report headers into the database')
+    for attempt in range(2):
+        if dbconn['conn'] is None:
+            dbconn['conn'] = pyodbc.connect(connstr)
+            dbconn['cursor'] = dbconn['conn'].cursor()
+        try:
+            dbconn['cursor'].execute(sql, *params)
+            sqlresults = []
+            for x in range(nresults):
+                if x > 0:
+                    dbconn['cursor'].nextset()
+                sqlresults.append(dbconn['cursor'].fetchone()[0])
+            break
+        except pyodbc.Error as err:
+            if attempt > 0 or dbconn['uncommitted'] > 0 or not is_db_connection_error(err):
+                raise
+            close_db_connection(False)
+
+    dbconn['uncommitted'] += max(nresults, 1)
+    if dbconn['uncommitted'] >= DBCOMMITBATCH:
+        commit_db_work()
+    return sqlresults
+
+
+def flush_error_logs():
+    # Writes the entries buffered for every error log
+    for logfile in errorlogbuffers.keys():
+        write_error_log(logfile)
+
+
+def flush_output_files(outputs):
+    for outputfile in outputs.values():
+        outputfile.flush()
+
+
+def format_sql_call(sql, params):
+    # Returns sql with each parameter marker replaced by its value as a
+    # SQL literal, so a failed call can be logged and rerun by hand
+    sql = sql.split('?')
+    literals = []
+    for param in params:
+        if param is None:
+            literals.append('NULL')
+        elif isinstance(param, str):
+            literals.append("'" + param.replace("'", "''") + "'")
+        else:
+            literals.append(str(param))
+    return ''.join([part + literal for part, literal in zip(sql, literals)]) + sql[-1]
+
+
+def get_column_plan(formtype, version):
+    # Returns the column plan for a form type and version or None when
+    # the form type and version are not supported.
+    return columnplans.get((formtype, str(version)))
+
+
+def get_form_type(code):
+    # Returns the form type of a data row's record type code using the
+    # longest form type that begins the code, or '' if none does. Text
+    # rows sometimes aren't ALLCAPS.
+    if code.lower() == 'text':
+        return 'TEXT'
+    formtype = ''
+    node = formtypetrie
+    for char in code:
+        node = node.get(char)
+        if node is None:
+            break
+        formtype = node.get(None, formtype)
+    return formtype
+
+
 def get_row_headers(header, version):
-    rowhdrs = []
-    for hdr in filehdrs:
-        if hdr[0] == header:
-            for subhdr in hdr[1]:
-                if str(version) in subhdr[0]:
-                    rowhdrs = subhdr[1]
-    return rowhdrs
+    # Returns an immutable tuple of row headers or an empty tuple when
+    # the form type and version are not supported.
+    return rowhdrregistry.get((header, str(version)), ())
+
+
+def init_parse_worker(filestamp, stopevent):
+    # Sets up a worker process to write data rows to its own set of
+    # output shards, which are merged when all files have been parsed.
+    # The shards remain open until the worker exits and are flushed
+    # after each file. The shards are closed, the worker's database
+    # connection is closed, and any outstanding header loads committed,
+    # when the worker exits. stopevent is set by the main process when
+    # the run is aborted. Workers ignore Ctrl+C and leave it to the main
+    # process, so they are never interrupted partway through a file.
+    global outputs, stopparsing
+    outputs = open_output_files(build_output_files(filestamp, str(os.getpid())))
+    stopparsing = stopevent
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    multiprocessing.util.Finalize(None, close_output_files, args=(outputs,), exitpriority=10)
+    multiprocessing.util.Finalize(None, close_db_connection, exitpriority=10)
+
+
+def is_db_connection_error(err):
+    # Returns True if a pyodbc error reports a lost connection
+    # (SQLSTATE class 08)
+    return len(err.args) > 0 and str(err.args[0]).startswith('08')
+
+
+def iter_data_rows(lines, report, linenbr=0, hdrflg=0):
+    # Validates the data rows of a filing, yielding a (form type, row)
+    # tuple for each row as soon as it is validated. The form type is the
+    # key of the data file the row belongs in (OtherData for rows that
+    # can't be mapped). lines can be any iterable of lines from the
+    # filing. linenbr is the number of lines preceding the first line.
+    # Because some headers are multiple lines, all rows are ignored until
+    # a line that begins with the report type is found unless hdrflg is
+    # set to 1. When BATCHROWS is set, rows are yielded once a batch of
+    # their form type has been validated, so rows of different form types
+    # can be yielded out of order.
+    imageid = report['imageid']
+    hdrver = report['hdrver']
+    fullrpttype = report['fullrpttype']
+    formtp = report['formtp']
+    namedelim = report['namedelim']
+    dateformat = report['dateformat']
+    delim = report['delimiter']
+
+    # Form type, column plan, validator and report type resolved for
+    # this file, keyed by record type code
+    dispatch = {}
+
+    # Rows waiting to be validated by validate_batch, keyed by form type.
+    # Their currency and integer fields are left to the batch.
+    batches = {}
+    validators = rowvalidators
+    if BATCHROWS > 0:
+        validators = batchvalidators
+
+    # Iterate through the lines
+    for line in lines:
+        linenbr += 1
+        # Skip blank lines
+        if line.strip() == '':
+            continue
 
+        # Clean up the line and convert it to a list
+        line, data = split_data_line(line, delim)
 
-def load_rpt_hdrs(rpttype, imageid, rowdata, filehdr, outputhdrs, DBCONNSTR):
-    errfile = RPTERRDIR + 'ErrorMessages.log'
-    # Create stored procedure call to load header data into database
-    sql = 'EXEC dbo.usp_AddRptHdr_' + rpttype + ' ' + str(imageid) + ', '
+        # If hdrflag == 0, see if this is header line; if not, continue
+        if hdrflg == 0:
+            if data[0] == formtp:
+                hdrflg = 1
+            continue
 
-    # Add report header data values
-    # Ignore full names
-    for hdr in outputhdrs:
-        if hdr == 'TrsFullName' or hdr == 'SignFullName' or hdr == 'AgtFullName' or hdr == 'CustFullName' or hdr == 'CandFullName':
+        # This is a data row. Look up the row's form type, column plan
+        # and validator, which are resolved once for each record type
+        # code (SA11AI, SB23, SC/10 and so on) found in the file.
+        if data[0] in dispatch:
+            formtype, plan, validator, rpttype = dispatch[data[0]]
+        else:
+            formtype = get_form_type(data[0])
+            plan = None
+            if formtype != '':
+                plan = get_column_plan(formtype, hdrver)
+            validator = validators.get(formtype)
+            # F1S rows don't include the report type
+            rpttype = fullrpttype
+            if formtype == 'F1S':
+                rpttype = None
+            dispatch[data[0]] = formtype, plan, validator, rpttype
+
+        # Write the row to the other data file if row's form type or
+        # headers not found and skip to next line
+        if plan is None:
+            yield 'OtherData', [imageid, hdrver, 'line: ' + str(linenbr), line]
             continue
-        data = rowdata[hdr]
-        if data == None or data == '':
-            data = 'NULL'
-        elif data == 'nullstring':
-            data = "''"
-        sql += data + ', '
 
-    # Add file header data values
-    sql += str(filehdr['Ver']) + ', '
-    sql += clean_sql_text(filehdr['SftNm'], '', "'") + ', '
-    sql += clean_sql_text(filehdr['SftVer'], '', "'") + ', '
-    sql += clean_sql_text(filehdr['RptID'], '', "'") + ', '
-    sql += clean_sql_text(filehdr['RptNbr'], '', "'") + ', '
-    sql += clean_sql_text(filehdr['HdrCmnt'], '', "'")
-
-    # Replace empty strings with NULL
-    while sql.find(', ,') != -1:
-        sql = sql.replace(', ,', ', NULL,')
-    if sql.endswith(', '):
-        sql += 'NULL'
-
-    # Create SQL Server connection
-    conn = pyodbc.connect(DBCONNSTR)
-    cursor = conn.cursor()
-
-    # Excecute stored procedure
-    cursor.execute(sql)
-    sqlresult = cursor.fetchone()[0]
-    conn.commit()
-    conn.close()
+        # Skip rows, such as report headers, that have no validator
+        if validator is None:
+            continue
+
+        # Populate data row dictionary
+        linedata = populate_data_row(data, plan)
+
+        # Call function to verify data is valid before loading into database
+        linedata = validator(linedata, imageid, linenbr, namedelim, dateformat)
+
+        # Hold the row until a full batch of its form type has been read
+        if BATCHROWS > 0:
+            if formtype not in batches:
+                batches[formtype] = plan, rpttype, []
+            batch = batches[formtype][2]
+            batch.append((linenbr, linedata))
+            if len(batch) >= BATCHROWS:
+                validate_batch(formtype, batch, imageid)
+                for rownbr, linedata in batch:
+                    yield formtype, build_data_row(linedata, plan[2], imageid, rpttype)
+                del batch[:]
+            continue
+
+        # Create list for the data row
+        yield formtype, build_data_row(linedata, plan[2], imageid, rpttype)
+
+    # Validate the rows left in partial batches
+    for formtype, (plan, rpttype, batch) in sorted(batches.items()):
+        if batch:
+            validate_batch(formtype, batch, imageid)
+            for rownbr, linedata in batch:
+                yield formtype, build_data_row(linedata, plan[2], imageid, rpttype)
+
+
+def iter_records(fecfile, imageid=None):
+    # Parses a single electronic filing without loading its report header
+    # into the database or writing any data files, so the parser can be
+    # used from other programs. fecfile can be the path to a filing or
+    # any file-like object or iterable housing its lines, such as a
+    # StringIO buffer. imageid defaults to the number in the filename.
+    # Lazily yields a (form type, header version, row) tuple for each
+    # validated data row. The form type is the key of the data file the
+    # row belongs in (OtherData for rows that can't be mapped). Nothing is
+    # yielded for unsupported report types. Values that can't be
+    # validated are logged to the error logs as usual. The log entries
+    # are written once the filing has been read, when an error stops it
+    # or when the generator is closed early.
+    try:
+        if isinstance(fecfile, basestring):
+            if imageid is None:
+                imageid = int(os.path.basename(fecfile).replace('.fec', ''))
+            with open(fecfile, 'rb') as datafile:
+                for record in iter_records(datafile, imageid):
+                    yield record
+            return
+
+        if imageid is None:
+            imageid = int(os.path.basename(getattr(fecfile, 'name', '0')).replace('.fec', ''))
+        if imageid in BADREPORTS:
+            return
+
+        lines = iter(fecfile)
+        filehdr, rpthdr, linenbr = read_report_headers(lines)
+        report = parse_report_header(imageid, filehdr, rpthdr, sniff_dialect(rpthdr))
+        if report is None:
+            return
+
+        # Start with the report header so data rows are found the same way
+        # they are when a filing is parsed from disk
+        for formtype, row in iter_data_rows(itertools.chain([rpthdr], lines), report, linenbr - 1):
+            yield formtype, report['hdrver'], row
+    finally:
+        flush_error_logs()
+
+
+def load_rpt_hdrs(calls, DBCONNSTR):
+    # Loads report headers into the database using the stored procedure
+    # calls built by build_rpt_hdr_call. Up to HDRBATCHSIZE calls are
+    # sent to the database in each round trip. Returns the result of
+    # each call: -1 when the report already exists in the database and
+    # -2 when the stored procedure failed to load the header.
+    errfile = RPTERRDIR + 'ErrorMessages.log'
+    sqlresults = []
+    batch = []
+    nparams = 0
+    for x, call in enumerate(calls):
+        batch.append(call)
+        nparams += len(call[2])
+        if x + 1 == len(calls) or len(batch) == HDRBATCHSIZE or nparams + len(calls[x + 1][2]) > MAXSQLPARAMS:
+            # Excecute stored procedures
+            sql = '; '.join([batchcall[1] for batchcall in batch])
+            params = []
+            for batchcall in batch:
+                params.extend(batchcall[2])
+            sqlresults.extend(execute_db_sql(sql, params, DBCONNSTR, len(batch)))
+            batch = []
+            nparams = 0
 
     # Display error messages
-    if sqlresult == -1:
-        add_entry_to_error_log(errfile, str(imageid) + '.fec already ' \
-                                                       'exists in the FEC database. Data ' \
-                                                       'from this file will not be imported, ' \
-                                                       'and the file has been moved to the ' \
-                                                       'Review directory.')
-    elif sqlresult == -2:
-        add_entry_to_error_log(errfile, 'The stored procedure ' \
-                                        'returned an error when this Python ' \
-                                        'script attempted to load the header ' \
-                                        'for ' + str(imageid) + '. The data ' \
-                                                                'was not loaded into the database, ' \
-                                                                'and the file has been moved to the ' \
-                                                                'Review directory. The stored ' \
-                                                                'procedure call which failed was: ' + sql
-                               )
-    return sqlresult
+    for (imageid, sql, params), sqlresult in zip(calls, sqlresults):
+        if sqlresult == -1:
+            add_entry_to_error_log(errfile, str(imageid) + '.fec already ' \
+                                                           'exists in the FEC database. Data ' \
+                                                           'from this file will not be imported, ' \
+                                                           'and the file has been moved to the ' \
+                                                           'Review directory.')
+        elif sqlresult == -2:
+            add_entry_to_error_log(errfile, 'The stored procedure ' \
+                                            'returned an error when this Python ' \
+                                            'script attempted to load the header ' \
+                                            'for ' + str(imageid) + '. The data ' \
+                                                                    'was not loaded into the database, ' \
+                                                                    'and the file has been moved to the ' \
+                                                                    'Review directory. The stored ' \
+                                                                    'procedure call which failed was: ' + format_sql_call(sql, params)
+                                   )
+    return sqlresults
+
+
+def mark_output_files(outputs):
+    # Returns the current length of each file handle housed in outputs,
+    # keyed like outputs, so rows written afterward can be discarded by
+    # truncate_output_files
+    offsets = {}
+    for key, outputfile in outputs.items():
+        offsets[key] = outputfile.tell()
+    return offsets
+
+
+def merge_error_counts(counts):
+    # Adds error counts returned by a worker process to this process's counts
+    for errortype, count in counts.items():
+        errorcounts[errortype] = errorcounts.get(errortype, 0) + count
+
+
+def merge_name_cache_stats(stats):
+    # Adds name cache counts returned by a worker process to this
+    # process's counts
+    for stat, count in stats.items():
+        namecachestats[stat] += count
+
+
+def merge_output_shards(outputfiles, shards=None):
+    # Appends output shards to the data files housed in outputfiles,
+    # then deletes the shards. shards is a list of dictionaries built by
+    # build_output_files, which are appended in order. When shards is
+    # omitted, the shards written by worker processes are merged.
+    for key, outputfile in outputfiles.items():
+        if shards is None:
+            shardfiles = sorted(glob.glob(outputfile.replace('.txt', '_*.txt')))
+        else:
+            shardfiles = [shard[key] for shard in shards if os.path.isfile(shard[key])]
+        if len(shardfiles) == 0:
+            continue
+        with open(outputfile, 'a+b') as output:
+            for shard in shardfiles:
+                with open(shard, 'rb') as shardfile:
+                    shutil.copyfileobj(shardfile, output)
+                os.remove(shard)
+
+
+def normalize_date(val, dateformat):
+    # Converts a date string to M/D/CCYY, returning None if the date is
+    # invalid. Dates with slashes or dashes are parsed as M/D/(CC)YY;
+    # all other dates are parsed using dateformat.
+    try:
+        if val.find('/') != -1 or val.find('-') != -1:
+            if val.find('/') != -1:
+                sep = '/'
+            else:
+                sep = '-'
+            month = ''
+            day = ''
+            year = ''
+            if val[val.find(sep) + 1:].find(sep) != -1:
+                x1 = val.find(sep)
+                x2 = x1 + val[x1 + 1:].find(sep) + 1
+                month = val[:x1].lstrip('0')
+                day = val[x1 + 1:x2].lstrip('0')
+                year = val[x2 + 1:]
+                if int(year) < 10:
+                    year = '0' + year
+                if int(year) < 100:
+                    year = '20' + year
+                if int(year) > curryear:
+                    year = '19' + year[-2:]
+        else:
+            monthpos, daypos, yearpos, yearlen = compile_date_format(dateformat)
+            month = val[monthpos:monthpos + 2]
+            day = val[daypos:daypos + 2]
+            if yearlen == 4:
+                year = val[yearpos:yearpos + 4]
+            elif yearlen == 2:
+                year = '20' + val[yearpos:yearpos + 2]
+                if int(year) > curryear:
+                    year = '19' + val[-2:]
+            else:
+                return None
+    except ValueError:
+        return None
+
+    # Validate the date the same way time.strptime(datestring, '%m/%d/%Y')
+    # does: the fields must match its patterns and form a real date
+    datestring = month + '/' + day + '/' + year
+    match = datepattern.match(datestring)
+    if match is None:
+        return None
+    try:
+        datetime.date(int(match.group(3)), int(match.group(1)), int(match.group(2)))
+    except ValueError:
+        return None
+    return datestring
+
+
+def open_error_log(logfile):
+    # Opens logfile unbuffered and in append mode. When ERRORLOGFORMAT is
+    # 'tsv', a bad value log created by this call starts with a header
+    # row listing ERRORLOGFIELDS. The log is created exclusively, so only
+    # one process writes the header.
+    if ERRORLOGFORMAT == 'tsv' and logfile in valuelogs:
+        try:
+            fd = os.open(logfile, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_APPEND | getattr(os, 'O_BINARY', 0))
+        except OSError as err:
+            if err.errno != errno.EEXIST:
+                raise
+        else:
+            handle = os.fdopen(fd, 'ab', 0)
+            handle.write('\t'.join(ERRORLOGFIELDS) + '\n')
+            return handle
+    return open(logfile, 'ab', 0)
+
+
+def open_output_files(outputfiles):
+    # Opens each data file housed in outputfiles for appending and
+    # returns a dictionary of file handles keyed like outputfiles. Each
+    # handle buffers up to OUTPUTBUFSIZE bytes, so memory use does not
+    # grow with the size of a filing. Each handle is positioned at the
+    # end of its file so tell() reports the file's length on every
+    # platform.
+    outputs = {}
+    for key, outputfile in outputfiles.items():
+        outputs[key] = open(outputfile, 'ab', OUTPUTBUFSIZE)
+        outputs[key].seek(0, os.SEEK_END)
+    return outputs
 
 
 def parse_data_row(data, delim):
-    # There are many cases where a field begins with " but is cut off or
-    # otherwise ends with no closing ". This causes multiple fields to
-    # be joined together and the parsing to fail. For that reason, I'm
-    # using csv module only for comma delimiters.
+    # Quotation marks matter only in comma-delimited files, which are
+    # split by split_comma_line.
     if delim == ',':
-        for x in csv.reader([data], SRCDELIMITER=',', quotechar='"'):
-            data = x
+        data = split_comma_line(data)
     else:
         data = data.split(delim)
         data[:] = (datum.strip('" ') for datum in data)
@@ -1436,4602 +3402,784 @@ def parse_data_row(data, delim):
     return data
 
 
-def parse_full_name(data, delimiter):
-    fullname = data.split(delimiter)
-    for name in fullname:
-        name = name.strip(' "')
-    if len(fullname) == 1:
-        fullname[0] = clean_sql_text(fullname[0])
-        fullname.append('')
-        fullname.append('')
-        fullname.append('')
-        fullname.append('')
-    elif len(fullname) == 2:
-        fullname[0] = clean_sql_text(fullname[0])
-        fullname[1] = clean_sql_text(fullname[1])
-        fullname.append('')
-        fullname.append('')
-        fullname.append('')
-    elif len(fullname) == 3:
-        fullname[0] = clean_sql_text(fullname[0])
-        fullname[1] = clean_sql_text(fullname[1])
-        fullname.insert(2, '')
-        fullname[3] = clean_sql_text(fullname[3])
-        fullname.append('')
-    elif len(fullname) == 4:
-        fullname[0] = clean_sql_text(fullname[0])
-        fullname[1] = clean_sql_text(fullname[1])
-        fullname.insert(2, '')
-        fullname[3] = clean_sql_text(fullname[3])
-        fullname[4] = clean_sql_text(fullname[4])
-    elif len(fullname) == 5:
-        fullname[0] = clean_sql_text(fullname[0])
-        fullname[1] = clean_sql_text(fullname[1])
-        fullname[2] = clean_sql_text(fullname[2])
-        fullname[3] = clean_sql_text(fullname[3])
-        fullname[4] = clean_sql_text(fullname[4])
-    else:
-        while len(fullname) < 5:
-            fullname.append('')
-        fullname = fullname[:5]
-        fullname[0] = clean_sql_text(data.replace(delimiter, ', '))
-        fullname[1] = ''
-        fullname[2] = ''
-        fullname[3] = ''
-        fullname[4] = ''
+def parse_data_rows(lines, report, outputs, linenbr=0, hdrflg=0):
+    # Validates the data rows of a filing using iter_data_rows and writes
+    # each row to the file handles housed in outputs, which is built by
+    # open_output_files.
+    for formtype, row in iter_data_rows(lines, report, linenbr, hdrflg):
+        write_data_row(outputs[formtype], row)
 
-    # Copy entire name to last name field if any other field is too long
-    if len(fullname[1]) > 35 or len(fullname[2]) > 20 or len(fullname[3]) > 20 or len(fullname[4]) > 15:
-        fullname[0] = clean_sql_text(data.replace(delimiter, ', '))
-        fullname[1] = ''
-        fullname[2] = ''
-        fullname[3] = ''
-        fullname[4] = ''
 
+def parse_full_name(data, delimiter):
+    # Returns the last, first and middle names, prefix and suffix in a
+    # full name. Donors tend to appear many times in a filing, so the
+    # parts are interned and cached for up to NAMECACHESIZE names, with
+    # the least recently used names discarded first.
+    key = (data, delimiter)
+    try:
+        fullname = namecache.pop(key)
+        namecachestats['hits'] += 1
+    except KeyError:
+        fullname = tuple([intern(name) for name in split_full_name(data, delimiter)])
+        namecachestats['misses'] += 1
+        if len(namecache) >= NAMECACHESIZE:
+            namecache.popitem(False)
+    namecache[key] = fullname
     return fullname
 
 
-def populate_data_row_dict(data, headers, output):
-    for x in range(len(headers)):
-        if headers[x] in output.keys() and x < len(
-                data):  # 100235 (F3X, v5.0) missing last 12 cols after treas sign date
-            output[headers[x]] = data[x].strip().replace('\t', ' ').strip(' "\n')
-    return output
-
+def parse_large_report(fecfile, outputfiles, filestamp, pool, nranges):
+    # Splits the data rows of a large filing into byte ranges, parses the
+    # ranges in parallel using pool and appends each range's rows to the
+    # files housed in outputfiles in their original order. The filing is
+    # then moved to the Processed directory.
+    report = prepare_report(fecfile)
+    if report is None:
+        return
 
-def check_rpt_hdrs_f3(image, data, namedelim='', dateformat='CCYYMMDD'):
-    # FormTp
-    data['FormTp'] = clean_sql_text(data['FormTp'], 'nullstring', "'")
+    # The byte ranges are found by split_report, and each is read by its
+    # own worker
+    del report['rpthdr']
 
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'], 'nullstring', "'")
+    tasks = []
+    try:
+        for x, (start, end, linenbr) in enumerate(split_report(fecfile, report, nranges)):
+            shardfiles = build_output_files(filestamp, str(report['imageid']) + '_' + str(x))
+            tasks.append((fecfile, report, start, end, linenbr, shardfiles))
+
+        results = pool.map(parse_report_range, tasks)
+        for shardfiles, counts, namestats in results:
+            merge_error_counts(counts)
+            merge_name_cache_stats(namestats)
+        merge_output_shards(outputfiles, [result[0] for result in results])
+    except:
+        # Don't leave partial output behind for the worker shards merge
+        for task in tasks:
+            for shardfile in task[5].values():
+                if os.path.isfile(shardfile):
+                    os.remove(shardfile)
+
+        # The report header has already been loaded and can't be removed
+        # from the database. Log the filing so its rows can be loaded by
+        # hand rather than moved to the Review directory by the next run.
+        add_entry_to_error_log(RPTERRDIR + 'ErrorMessages.log',
+                               'The report header for ImageID ' + str(report['imageid']) + ' (' + fecfile +
+                               ') was loaded into the database, but its data rows were not parsed.')
+        flush_error_logs()
+        raise
 
-    # CommNm
-    data['CommNm'] = clean_sql_text(data['CommNm'], 'nullstring', "'")
+    # Move the file to the processed directory
+    shutil.move(fecfile, fecfile.replace(RPTSVDIR, RPTPROCDIR))
 
-    # AddrChg
-    data['AddrChg'] = convert_to_bit(clean_sql_text(data['AddrChg']))
 
-    # Addr1
-    data['Addr1'] = clean_sql_text(data['Addr1'], 'nullstring', "'")
+def parse_report(fecfile, report, outputs):
+    # Writes the data rows of a single electronic filing, prepared by
+    # prepare_reports, to the file handles housed in outputs. The file is
+    # reopened at the offset prepare_report_header recorded after the
+    # report header, and the rows are read starting with the report
+    # header so data rows are found the same way iter_records finds
+    # them. The filing is then moved to the Processed directory. If the
+    # filing can't be parsed, the rows already written for it are
+    # removed from the data files, so a filing's rows are written in
+    # full or not at all.
+    offsets = mark_output_files(outputs)
+    try:
+        with open(fecfile, 'rb') as datafile:
+            datafile.seek(report.pop('dataoffset'))
+            lines = itertools.chain([report.pop('rpthdr')], datafile)
+            parse_data_rows(lines, report, outputs, report['hdrlines'] - 1)
 
-    # Addr2
-    data['Addr2'] = clean_sql_text(data['Addr2'], '', "'")
+        # Make sure all rows are written before the file is moved
+        flush_output_files(outputs)
+    except:
+        truncate_output_files(outputs, offsets)
+        raise
+    finally:
+        flush_error_logs()
 
-    # City
-    data['City'] = clean_sql_text(data['City'], 'nullstring', "'")
+    # Move the file to the processed directory
+    shutil.move(fecfile, fecfile.replace(RPTSVDIR, RPTPROCDIR))
 
-    # StAbbr
-    data['StAbbr'] = clean_sql_text(data['StAbbr'], 'nullstring', "'")
 
-    # Zip
-    data['Zip'] = clean_sql_text(data['Zip'], 'nullstring', "'")
+def parse_report_header(imageid, filehdr, rpthdr, dialect):
+    # Parses and validates the file header and report header of an
+    # electronic filing using the filing's dialect profile. Returns a
+    # dictionary describing the report, including the stored procedure
+    # call that loads its report header, or None when the report type is
+    # not supported.
+    delimiter = dialect['delimiter']
 
-    # ElecSt
-    data['ElecSt'] = clean_sql_text(data['ElecSt'], 'nullstring', "'")
+    # Extract report type from report header
+    fullrpttype = rpthdr[:rpthdr.find(delimiter)].lstrip(' "').rstrip(' "')
+    rpttype = fullrpttype.rstrip('ANT')
 
-    # ElecDist
-    data['ElecDist'] = convert_to_tinyint(data['ElecDist'], image, 'ElecDist', 'Header', 0, 'F3', '')
+    # If report type not supported, proceed to next file; otherwise
+    # retrieve header version
+    if rpttype not in rpttypes:
+        return None
+    else:
+        hdrver = ''
+        if filehdr.lower().find('fec_ver_#') != -1:  # FEC_VER_#, FEC_Ver_#
+            hdrver = filehdr[filehdr.lower().find('fec_ver_#') + 9:].lstrip(' =')
+            hdrver = float(hdrver[:hdrver.find('\n')].strip(' "'))
+        else:
+            hdrver = float(filehdr.split(delimiter)[2].strip(' "'))
 
-    # RptCd
-    data['RptCd'] = clean_sql_text(data['RptCd'], 'nullstring', "'")
+    # Now that we know the form type and header version, we are going
+    # to build the header data row to insert into the database.
 
-    # ElecCd
-    data['ElecCd'] = clean_sql_text(data['ElecCd'], '', "'")
+    # First, fetch file headers. Custom code needed for versions 1 and 2.
+    filehdrdata = {'ImageID': imageid,
+                   'RecType': 'HDR',
+                   'EFType': 'FEC',
+                   'Ver': hdrver,
+                   'SftNm': '',
+                   'SftVer': '',
+                   'RptID': '',
+                   'RptNbr': '0',
+                   'HdrCmnt': '',
+                   'NmDelim': '',
+                   'DecNoDec': 'DEC',
+                   'DtFmt': 'CCYYMMDD'}
 
-    # ElecDt
-    data['ElecDt'] = "'" + convert_to_date(data['ElecDt'], dateformat, image, 'ElecDt', 'Header', 0, 'F3', '') + "'"
-    if data['ElecDt'] == "''":
-        data['ElecDt'] = 'NULL'
+    if hdrver < 3.0:
+        # Custom code for multiline headers (versions 1 and 2)
+        # Set default name delimiter to ^
+        filehdrdata['NmDelim'] = '^'
+        filehdr = filehdr.split('\n')
+        for hdr in filehdr:
+            line = hdr.strip()
+            if line.lower().startswith('soft_name'):
+                filehdrdata['SftNm'] = line[line.find('=') + 1:].strip(' "')
+            elif line.lower().startswith('soft_ver'):
+                filehdrdata['SftVer'] = line[line.find('=') + 1:].strip(' "')
+            elif line.lower().startswith('control'):
+                filehdrdata['RptID'] = line[line.find('=') + 1:].strip(' "')
+            elif line.lower().startswith('namedelim'):
+                filehdrdata['NmDelim'] = line[line.find('=') + 1:].strip(' "')
+            elif line.lower().startswith('dec/nodec'):
+                filehdrdata['DecNoDec'] = line[line.find('=') + 1:].strip(' "')
+            elif line.lower().startswith('date_fmat'):
+                filehdrdata['DtFmt'] = line[line.find('=') + 1:].strip(' "')
+            elif line.lower().find('comment') != -1:
+                filehdrdata['HdrCmnt'] = line[line.find('=') + 1:].strip(' "')
 
-    # StateOfElec
-    data['StateOfElec'] = clean_sql_text(data['StateOfElec'], 'nullstring', "'")
+    else:
+        rowhdrs = get_row_headers('Hdr', hdrver)
 
-    # CovgFmDt
-    data['CovgFmDt'] = "'" + convert_to_date(data['CovgFmDt'], dateformat, image, 'CovgFmDt', 'Header', 0, 'F3',
-                                             '') + "'"
-    if data['CovgFmDt'] == "''":
-        data['CovgFmDt'] = 'NULL'
+        # Parse file header row
+        filehdr = parse_data_row(filehdr, delimiter)
 
-    # CovgToDt
-    data['CovgToDt'] = "'" + convert_to_date(data['CovgToDt'], dateformat, image, 'CovgToDt', 'Header', 0, 'F3',
-                                             '') + "'"
-    if data['CovgToDt'] == "''":
-        data['CovgToDt'] = 'NULL'
+        # Iterate through file header row and populate header dictionary
+        for x in range(len(rowhdrs)):
+            if rowhdrs[x] in filehdrdata.keys() and x < len(
+                    filehdr):  # Checking len because sometimes header comment omitted
+                filehdrdata[rowhdrs[x]] = filehdr[x].strip().replace(OUTPUTDELIMITER, ' ').strip(' "\n')
 
-    # TrsFullName
-    if data['TrsFullName'] != '':
-        if data['TrsLName'] != '' or data['TrsFName'] != '' or data['TrsMName'] != '' or data['TrsPfx'] != '' or data[
-            'TrsSfx'] != '':
-            add_entry_to_error_log(RPTERRDIR + 'ErrorMessages.log', 'Treasurer full name (' + data[
-                'TrsFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            treas = parse_full_name(data['TrsFullName'], namedelim)
-            data['TrsLName'] = treas[0]
-            data['TrsFName'] = treas[1]
-            data['TrsMName'] = treas[2]
-            data['TrsPfx'] = treas[3]
-            data['TrsSfx'] = treas[4]
-        else:
-            data['TrsLName'] = data['TrsFullName']
+    # First, change hdrver to int when < 4
+    if hdrver < 4:
+        hdrver = int(hdrver)
 
-    # TrsLName
-    data['TrsLName'] = clean_sql_text(data['TrsLName'], 'nullstring', "'")
+    # Get output headers
+    rpthdrdata = {}
+    for hdr in outputhdrs[rpttype]:
+        rpthdrdata[hdr] = ''
 
-    # TrsFName
-    data['TrsFName'] = clean_sql_text(data['TrsFName'], '', "'")
+    # Get headers for report header row
+    rowhdrs = get_row_headers(rpttype, hdrver)
 
-    # TrsMName
-    data['TrsMName'] = clean_sql_text(data['TrsMName'], '', "'")
+    # Parse report header row
+    rpthdr = parse_data_row(rpthdr, delimiter)
 
-    # TrsPfx
-    data['TrsPfx'] = clean_sql_text(data['TrsPfx'], '', "'")
+    # Iterate through report header row and populate report header dictionary
+    for x in range(len(rowhdrs)):
+        if rowhdrs[x] in rpthdrdata.keys() and x < len(
+                rpthdr):  # 100235 (F3X, v5.0) missing last 12 cols after treas sign date
+            rpthdrdata[rowhdrs[x]] = rpthdr[x].strip().replace(OUTPUTDELIMITER, ' ').strip(' "\n')
 
-    # TrsSfx
-    data['TrsSfx'] = clean_sql_text(data['TrsSfx'], '', "'")
+    # Attempt to determine name delimiter if missing
+    if filehdrdata['NmDelim'] == '':
+        if 'TrsFullName' in rpthdrdata.keys():
+            if rpthdrdata['TrsFullName'].find('^') != -1:
+                filehdrdata['NmDelim'] = '^'
+            elif rpthdrdata['TrsFullName'].find(',') != -1:
+                filehdrdata['NmDelim'] = ','
 
-    # SignDt
-    data['SignDt'] = "'" + convert_to_date(data['SignDt'], dateformat, image, 'SignDt', 'Header', 0, 'F3', '') + "'"
-    if data['SignDt'] == "''":
-        data['SignDt'] = 'NULL'
+    # Call function to verify data is valid
+    if rpttype in rpthdrvalidators:
+        rpthdrdata = rpthdrvalidators[rpttype](imageid, rpthdrdata, filehdrdata['NmDelim'], filehdrdata['DtFmt'])
+
+    return {'imageid': imageid,
+            'hdrver': hdrver,
+            'fullrpttype': fullrpttype,
+            'formtp': rpthdrdata['FormTp'].strip(" '"),
+            'namedelim': filehdrdata['NmDelim'],
+            'dateformat': filehdrdata['DtFmt'],
+            'delimiter': delimiter,
+            'hdrcall': build_rpt_hdr_call(rpttype, imageid, rpthdrdata, filehdrdata, outputhdrs[rpttype])}
+
+
+def parse_report_range(task):
+    # Parses one byte range of a large filing in a worker process and
+    # writes its data rows to the range's own output shards. task is a
+    # tuple built by parse_large_report. Returns the shard files, the
+    # error counts and the name cache counts for the range.
+    fecfile, report, start, end, linenbr, shardfiles = task
+    outputs = open_output_files(shardfiles)
+    try:
+        with open(fecfile, 'rb') as datafile:
+            parse_data_rows(read_byte_range(datafile, start, end), report, outputs, linenbr, 1)
+    except SystemExit as err:
+        raise RuntimeError('Unable to parse ' + fecfile + ': ' + str(err.code))
+    finally:
+        close_output_files(outputs)
+        flush_error_logs()
+    return shardfiles, take_error_counts(), take_name_cache_stats()
+
+
+def parse_report_worker(fecfiles):
+    # Parses a group of filings in a worker process, writing data rows to
+    # the worker's own output shards. Returns the error counts and the
+    # name cache counts for the group.
+    # Groups are skipped once the run has been aborted, so the workers
+    # finish quickly and the reports they have parsed can be merged.
+    try:
+        if not stopparsing.is_set():
+            parse_reports(fecfiles, outputs)
+    except SystemExit as err:
+        # The validators call sys.exit when they encounter data they
+        # can't handle. Raise an exception instead so the pool reports
+        # the error to the main process rather than losing the worker.
+        raise RuntimeError('Unable to parse ' + ', '.join(fecfiles) + ': ' + str(err.code))
+    finally:
+        flush_error_logs()
+    return take_error_counts(), take_name_cache_stats()
+
+
+def parse_reports(fecfiles, outputs):
+    # Parses a group of electronic filings, loading their report headers
+    # into the database together and writing their data rows to the file
+    # handles housed in outputs. Each filing is then moved to the
+    # Processed, Review or Hold directory.
+    reports = prepare_reports(fecfiles)
+    for x, (fecfile, report) in enumerate(reports):
+        if report is None:
+            continue
+        try:
+            parse_report(fecfile, report, outputs)
+        except:
+            # Every header in the group has already been loaded, and the
+            # headers can't be removed from the database. Log the filings
+            # whose rows won't be parsed, so they can be loaded by hand
+            # rather than moved to the Review directory by the next run.
+            unparsed = [reports[y][0] for y in range(x, len(reports)) if reports[y][1] is not None]
+            add_entry_to_error_log(RPTERRDIR + 'ErrorMessages.log',
+                                   'The report headers for the following files were loaded into the database, '
+                                   'but their data rows were not parsed: ' + ', '.join(unparsed))
+            flush_error_logs()
+            raise
+
+
+def populate_data_row(data, plan):
+    # Returns a list housing a value for every output header of the
+    # row's form type, filled from the fields of the data row using the
+    # column plan. Headers the row doesn't house are left blank. Rows
+    # with all the columns the plan expects are filled by its itemgetter
+    # in a single call.
+    if len(data) >= plan[4]:
+        return list(plan[3](data + ['']))
+    output = [''] * plan[0]
+    ncols = len(data)
+    for x, y in plan[1]:
+        if x < ncols:  # 100235 (F3X, v5.0) missing last 12 cols after treas sign date
+            output[y] = data[x]
+    return output
 
-    # TotConts_P_6a
-    data['TotConts_P_6a'] = ck_curr_val(data['TotConts_P_6a'], image, 'TotConts_P_6a', 'Header', 0)
-
-    # TotContRfds_P_6b
-    data['TotContRfds_P_6b'] = ck_curr_val(data['TotContRfds_P_6b'], image, 'TotContRfds_P_6b', 'Header', 0)
-
-    # NetConts_P_6c
-    data['NetConts_P_6c'] = ck_curr_val(data['NetConts_P_6c'], image, 'NetConts_P_6c', 'Header', 0)
-
-    # TotOpExps_P_7a
-    data['TotOpExps_P_7a'] = ck_curr_val(data['TotOpExps_P_7a'], image, 'TotOpExps_P_7a', 'Header', 0)
-
-    # TotOffsetOpExps_P_7b
-    data['TotOffsetOpExps_P_7b'] = ck_curr_val(data['TotOffsetOpExps_P_7b'], image, 'TotOffsetOpExps_P_7b', 'Header', 0)
-
-    # NetOpExps_P_7c
-    data['NetOpExps_P_7c'] = ck_curr_val(data['NetOpExps_P_7c'], image, 'NetOpExps_P_7c', 'Header', 0)
-
-    # CashClose_P_8
-    data['CashClose_P_8'] = ck_curr_val(data['CashClose_P_8'], image, 'CashClose_P_8', 'Header', 0)
-
-    # DebtsTo_P_9
-    data['DebtsTo_P_9'] = ck_curr_val(data['DebtsTo_P_9'], image, 'DebtsTo_P_9', 'Header', 0)
-
-    # DebtsBy_P_10
-    data['DebtsBy_P_10'] = ck_curr_val(data['DebtsBy_P_10'], image, 'DebtsBy_P_10', 'Header', 0)
-
-    # IndContsItem_P_11a1
-    data['IndContsItem_P_11a1'] = ck_curr_val(data['IndContsItem_P_11a1'], image, 'IndContsItem_P_11a1', 'Header', 0)
-
-    # IndContsUnitem_P_11a2
-    data['IndContsUnitem_P_11a2'] = ck_curr_val(data['IndContsUnitem_P_11a2'], image, 'IndContsUnitem_P_11a2', 'Header',
-                                                0)
-
-    # IndContsTot_P_11a3
-    data['IndContsTot_P_11a3'] = ck_curr_val(data['IndContsTot_P_11a3'], image, 'IndContsTot_P_11a3', 'Header', 0)
-
-    # PolPtyCommConts_P_11b
-    data['PolPtyCommConts_P_11b'] = ck_curr_val(data['PolPtyCommConts_P_11b'], image, 'PolPtyCommConts_P_11b', 'Header',
-                                                0)
-
-    # OthPolCommConts_P_11c
-    data['OthPolCommConts_P_11c'] = ck_curr_val(data['OthPolCommConts_P_11c'], image, 'OthPolCommConts_P_11c', 'Header',
-                                                0)
-
-    # CandConts_P_11d
-    data['CandConts_P_11d'] = ck_curr_val(data['CandConts_P_11d'], image, 'CandConts_P_11d', 'Header', 0)
-
-    # TotConts_P_11e
-    data['TotConts_P_11e'] = ck_curr_val(data['TotConts_P_11e'], image, 'TotConts_P_11e', 'Header', 0)
-
-    # TranFmOthAuthComms_P_12
-    data['TranFmOthAuthComms_P_12'] = ck_curr_val(data['TranFmOthAuthComms_P_12'], image, 'TranFmOthAuthComms_P_12',
-                                                  'Header', 0)
-
-    # CandLoans_P_13a
-    data['CandLoans_P_13a'] = ck_curr_val(data['CandLoans_P_13a'], image, 'CandLoans_P_13a', 'Header', 0)
-
-    # OthLoans_P_13b
-    data['OthLoans_P_13b'] = ck_curr_val(data['OthLoans_P_13b'], image, 'OthLoans_P_13b', 'Header', 0)
-
-    # TotLoans_P_13c
-    data['TotLoans_P_13c'] = ck_curr_val(data['TotLoans_P_13c'], image, 'TotLoans_P_13c', 'Header', 0)
-
-    # OffsetOpExps_P_14
-    data['OffsetOpExps_P_14'] = ck_curr_val(data['OffsetOpExps_P_14'], image, 'OffsetOpExps_P_14', 'Header', 0)
-
-    # OthRcpts_P_15
-    data['OthRcpts_P_15'] = ck_curr_val(data['OthRcpts_P_15'], image, 'OthRcpts_P_15', 'Header', 0)
-
-    # TotRcpts_P_16
-    data['TotRcpts_P_16'] = ck_curr_val(data['TotRcpts_P_16'], image, 'TotRcpts_P_16', 'Header', 0)
-
-    # OpExps_P_17
-    data['OpExps_P_17'] = ck_curr_val(data['OpExps_P_17'], image, 'OpExps_P_17', 'Header', 0)
-
-    # TranToOthAuthComms_P_18
-    data['TranToOthAuthComms_P_18'] = ck_curr_val(data['TranToOthAuthComms_P_18'], image, 'TranToOthAuthComms_P_18',
-                                                  'Header', 0)
-
-    # CandLoansRepaid_P_19a
-    data['CandLoansRepaid_P_19a'] = ck_curr_val(data['CandLoansRepaid_P_19a'], image, 'CandLoansRepaid_P_19a', 'Header',
-                                                0)
-
-    # OthLoansRepaid_P_19b
-    data['OthLoansRepaid_P_19b'] = ck_curr_val(data['OthLoansRepaid_P_19b'], image, 'OthLoansRepaid_P_19b', 'Header', 0)
-
-    # TotLoansRepaid_P_19c
-    data['TotLoansRepaid_P_19c'] = ck_curr_val(data['TotLoansRepaid_P_19c'], image, 'TotLoansRepaid_P_19c', 'Header', 0)
-
-    # RefundsInd_P_20a
-    data['RefundsInd_P_20a'] = ck_curr_val(data['RefundsInd_P_20a'], image, 'RefundsInd_P_20a', 'Header', 0)
-
-    # RefundsPolPtyComms_P_20b
-    data['RefundsPolPtyComms_P_20b'] = ck_curr_val(data['RefundsPolPtyComms_P_20b'], image, 'RefundsPolPtyComms_P_20b',
-                                                   'Header', 0)
-
-    # RefundsOthPolComms_P_20c
-    data['RefundsOthPolComms_P_20c'] = ck_curr_val(data['RefundsOthPolComms_P_20c'], image, 'RefundsOthPolComms_P_20c',
-                                                   'Header', 0)
-
-    # TotRefunds_P_20d
-    data['TotRefunds_P_20d'] = ck_curr_val(data['TotRefunds_P_20d'], image, 'TotRefunds_P_20d', 'Header', 0)
-
-    # OthDisb_P_21
-    data['OthDisb_P_21'] = ck_curr_val(data['OthDisb_P_21'], image, 'OthDisb_P_21', 'Header', 0)
-
-    # TotDisb_P_22
-    data['TotDisb_P_22'] = ck_curr_val(data['TotDisb_P_22'], image, 'TotDisb_P_22', 'Header', 0)
-
-    # CashBegin_P_23
-    data['CashBegin_P_23'] = ck_curr_val(data['CashBegin_P_23'], image, 'CashBegin_P_23', 'Header', 0)
-
-    # TotRcpts_P_24
-    data['TotRcpts_P_24'] = ck_curr_val(data['TotRcpts_P_24'], image, 'TotRcpts_P_24', 'Header', 0)
-
-    # Subtotal_P_25
-    data['Subtotal_P_25'] = ck_curr_val(data['Subtotal_P_25'], image, 'Subtotal_P_25', 'Header', 0)
-
-    # TotDisb_P_26
-    data['TotDisb_P_26'] = ck_curr_val(data['TotDisb_P_26'], image, 'TotDisb_P_26', 'Header', 0)
-
-    # CashClose_P_27
-    data['CashClose_P_27'] = ck_curr_val(data['CashClose_P_27'], image, 'CashClose_P_27', 'Header', 0)
-
-    # TotConts_T_6a
-    data['TotConts_T_6a'] = ck_curr_val(data['TotConts_T_6a'], image, 'TotConts_T_6a', 'Header', 0)
-
-    # TotContRfds_T_6b
-    data['TotContRfds_T_6b'] = ck_curr_val(data['TotContRfds_T_6b'], image, 'TotContRfds_T_6b', 'Header', 0)
-
-    # NetConts_T_6c
-    data['NetConts_T_6c'] = ck_curr_val(data['NetConts_T_6c'], image, 'NetConts_T_6c', 'Header', 0)
-
-    # TotOpExps_T_7a
-    data['TotOpExps_T_7a'] = ck_curr_val(data['TotOpExps_T_7a'], image, 'TotOpExps_T_7a', 'Header', 0)
-
-    # TotOffsetOpExps_T_7b
-    data['TotOffsetOpExps_T_7b'] = ck_curr_val(data['TotOffsetOpExps_T_7b'], image, 'TotOffsetOpExps_T_7b', 'Header', 0)
-
-    # NetOpExps_T_7c
-    data['NetOpExps_T_7c'] = ck_curr_val(data['NetOpExps_T_7c'], image, 'NetOpExps_T_7c', 'Header', 0)
-
-    # IndContsItem_T_11a1
-    data['IndContsItem_T_11a1'] = ck_curr_val(data['IndContsItem_T_11a1'], image, 'IndContsItem_T_11a1', 'Header', 0)
-
-    # IndContsUnitem_T_11a2
-    data['IndContsUnitem_T_11a2'] = ck_curr_val(data['IndContsUnitem_T_11a2'], image, 'IndContsUnitem_T_11a2', 'Header',
-                                                0)
-
-    # IndContsTot_T_11a3
-    data['IndContsTot_T_11a3'] = ck_curr_val(data['IndContsTot_T_11a3'], image, 'IndContsTot_T_11a3', 'Header', 0)
-
-    # PolPtyCommConts_T_11b
-    data['PolPtyCommConts_T_11b'] = ck_curr_val(data['PolPtyCommConts_T_11b'], image, 'PolPtyCommConts_T_11b', 'Header',
-                                                0)
-
-    # OthPolCommConts_T_11c
-    data['OthPolCommConts_T_11c'] = ck_curr_val(data['OthPolCommConts_T_11c'], image, 'OthPolCommConts_T_11c', 'Header',
-                                                0)
-
-    # CandConts_T_11d
-    data['CandConts_T_11d'] = ck_curr_val(data['CandConts_T_11d'], image, 'CandConts_T_11d', 'Header', 0)
-
-    # TotConts_T_11e
-    data['TotConts_T_11e'] = ck_curr_val(data['TotConts_T_11e'], image, 'TotConts_T_11e', 'Header', 0)
-
-    # TranFmOthAuthComms_T_12
-    data['TranFmOthAuthComms_T_12'] = ck_curr_val(data['TranFmOthAuthComms_T_12'], image, 'TranFmOthAuthComms_T_12',
-                                                  'Header', 0)
-
-    # CandLoans_T_13a
-    data['CandLoans_T_13a'] = ck_curr_val(data['CandLoans_T_13a'], image, 'CandLoans_T_13a', 'Header', 0)
-
-    # OthLoans_T_13b
-    data['OthLoans_T_13b'] = ck_curr_val(data['OthLoans_T_13b'], image, 'OthLoans_T_13b', 'Header', 0)
-
-    # TotLoans_T_13c
-    data['TotLoans_T_13c'] = ck_curr_val(data['TotLoans_T_13c'], image, 'TotLoans_T_13c', 'Header', 0)
-
-    # OffsetOpExps_T_14
-    data['OffsetOpExps_T_14'] = ck_curr_val(data['OffsetOpExps_T_14'], image, 'OffsetOpExps_T_14', 'Header', 0)
-
-    # OthRcpts_T_15
-    data['OthRcpts_T_15'] = ck_curr_val(data['OthRcpts_T_15'], image, 'OthRcpts_T_15', 'Header', 0)
-
-    # TotRcpts_T_16
-    data['TotRcpts_T_16'] = ck_curr_val(data['TotRcpts_T_16'], image, 'TotRcpts_T_16', 'Header', 0)
-
-    # OpExps_T_17
-    data['OpExps_T_17'] = ck_curr_val(data['OpExps_T_17'], image, 'OpExps_T_17', 'Header', 0)
-
-    # TranToOthAuthComms_T_18
-    data['TranToOthAuthComms_T_18'] = ck_curr_val(data['TranToOthAuthComms_T_18'], image, 'TranToOthAuthComms_T_18',
-                                                  'Header', 0)
-
-    # CandLoansRepaid_T_19a
-    data['CandLoansRepaid_T_19a'] = ck_curr_val(data['CandLoansRepaid_T_19a'], image, 'CandLoansRepaid_T_19a', 'Header',
-                                                0)
-
-    # OthLoansRepaid_T_19b
-    data['OthLoansRepaid_T_19b'] = ck_curr_val(data['OthLoansRepaid_T_19b'], image, 'OthLoansRepaid_T_19b', 'Header', 0)
-
-    # TotLoansRepaid_T_19c
-    data['TotLoansRepaid_T_19c'] = ck_curr_val(data['TotLoansRepaid_T_19c'], image, 'TotLoansRepaid_T_19c', 'Header', 0)
-
-    # RefundsInd_T_20a
-    data['RefundsInd_T_20a'] = ck_curr_val(data['RefundsInd_T_20a'], image, 'RefundsInd_T_20a', 'Header', 0)
-
-    # RefundsPolPtyComms_T_20b
-    data['RefundsPolPtyComms_T_20b'] = ck_curr_val(data['RefundsPolPtyComms_T_20b'], image, 'RefundsPolPtyComms_T_20b',
-                                                   'Header', 0)
-
-    # RefundsOthPolComms_T_20c
-    data['RefundsOthPolComms_T_20c'] = ck_curr_val(data['RefundsOthPolComms_T_20c'], image, 'RefundsOthPolComms_T_20c',
-                                                   'Header', 0)
-
-    # TotRefunds_T_20d
-    data['TotRefunds_T_20d'] = ck_curr_val(data['TotRefunds_T_20d'], image, 'TotRefunds_T_20d', 'Header', 0)
-
-    # OthDisb_T_21
-    data['OthDisb_T_21'] = ck_curr_val(data['OthDisb_T_21'], image, 'OthDisb_T_21', 'Header', 0)
-
-    # TotDisb_T_22
-    data['TotDisb_T_22'] = ck_curr_val(data['TotDisb_T_22'], image, 'TotDisb_T_22', 'Header', 0)
-
-    return data
-
-
-def check_rpt_hdrs_f3l(image, data, namedelim='', dateformat='CCYYMMDD'):
-    # FormTp
-    data['FormTp'] = clean_sql_text(data['FormTp'], 'nullstring', "'")
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'], 'nullstring', "'")
-
-    # CommNm
-    data['CommNm'] = clean_sql_text(data['CommNm'], 'nullstring', "'")
-
-    # AddrChg
-    data['AddrChg'] = convert_to_bit(clean_sql_text(data['AddrChg']))
-
-    # Addr1
-    data['Addr1'] = clean_sql_text(data['Addr1'], 'nullstring', "'")
-
-    # Addr2
-    data['Addr2'] = clean_sql_text(data['Addr2'], '', "'")
-
-    # City
-    data['City'] = clean_sql_text(data['City'], 'nullstring', "'")
-
-    # StAbbr
-    data['StAbbr'] = clean_sql_text(data['StAbbr'], 'nullstring', "'")
-
-    # Zip
-    data['Zip'] = clean_sql_text(data['Zip'], 'nullstring', "'")
-
-    # ElecSt
-    data['ElecSt'] = clean_sql_text(data['ElecSt'], 'nullstring', "'")
-
-    # ElecDist
-    data['ElecDist'] = convert_to_tinyint(data['ElecDist'], image, 'ElecDist', 'Header', 0, 'F3', '')
-
-    # RptCd
-    data['RptCd'] = clean_sql_text(data['RptCd'], 'nullstring', "'")
-
-    # ElecDt
-    data['ElecDt'] = "'" + convert_to_date(data['ElecDt'], dateformat, image, 'ElecDt', 'Header', 0, 'F3', '') + "'"
-    if data['ElecDt'] == "''":
-        data['ElecDt'] = 'NULL'
-
-    # StateOfElec
-    data['StateOfElec'] = clean_sql_text(data['StateOfElec'], 'nullstring', "'")
-
-    # flgInclSemiAnnPrd
-    data['flgInclSemiAnnPrd'] = convert_to_bit(clean_sql_text(data['flgInclSemiAnnPrd']))
-
-    # CovgFmDt
-    data['CovgFmDt'] = "'" + convert_to_date(data['CovgFmDt'], dateformat, image, 'CovgFmDt', 'Header', 0, 'F3',
-                                             '') + "'"
-    if data['CovgFmDt'] == "''":
-        data['CovgFmDt'] = 'NULL'
-
-    # CovgToDt
-    data['CovgToDt'] = "'" + convert_to_date(data['CovgToDt'], dateformat, image, 'CovgToDt', 'Header', 0, 'F3',
-                                             '') + "'"
-    if data['CovgToDt'] == "''":
-        data['CovgToDt'] = 'NULL'
-
-    # flgInclSemiAnnJanJun
-    data['flgInclSemiAnnJanJun'] = convert_to_bit(clean_sql_text(data['flgInclSemiAnnJanJun']))
-
-    # flgInclSemiAnnJulDec
-    data['flgInclSemiAnnJulDec'] = convert_to_bit(clean_sql_text(data['flgInclSemiAnnJulDec']))
-
-    # TotRptBundContribs
-    data['TotRptBundContribs'] = ck_curr_val(data['TotRptBundContribs'], image, 'TotRptBundContribs', 'Header', 0)
-
-    # SemiAnnBundContribs
-    data['SemiAnnBundContribs'] = ck_curr_val(data['SemiAnnBundContribs'], image, 'SemiAnnBundContribs', 'Header', 0)
-
-    # TrsLName
-    data['TrsLName'] = clean_sql_text(data['TrsLName'], 'nullstring', "'")
-
-    # TrsFName
-    data['TrsFName'] = clean_sql_text(data['TrsFName'], '', "'")
-
-    # TrsMName
-    data['TrsMName'] = clean_sql_text(data['TrsMName'], '', "'")
-
-    # TrsPfx
-    data['TrsPfx'] = clean_sql_text(data['TrsPfx'], '', "'")
-
-    # TrsSfx
-    data['TrsSfx'] = clean_sql_text(data['TrsSfx'], '', "'")
-
-    # SignDt
-    data['SignDt'] = "'" + convert_to_date(data['SignDt'], dateformat, image, 'SignDt', 'Header', 0, 'F3', '') + "'"
-    if data['SignDt'] == "''":
-        data['SignDt'] = 'NULL'
-
-    return data
-
-
-def check_rpt_hdrs_f3p(image, data, namedelim='', dateformat='CCYYMMDD'):
-    # FormTp
-    data['FormTp'] = clean_sql_text(data['FormTp'], 'nullstring', "'")
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'], 'nullstring', "'")
-
-    # CommNm
-    data['CommNm'] = clean_sql_text(data['CommNm'], 'nullstring', "'")
-
-    # AddrChg
-    data['AddrChg'] = convert_to_bit(clean_sql_text(data['AddrChg']))
-
-    # Addr1
-    data['Addr1'] = clean_sql_text(data['Addr1'], 'nullstring', "'")
-
-    # Addr2
-    data['Addr2'] = clean_sql_text(data['Addr2'], '', "'")
-
-    # City
-    data['City'] = clean_sql_text(data['City'], 'nullstring', "'")
-
-    # StAbbr
-    data['StAbbr'] = clean_sql_text(data['StAbbr'], 'nullstring', "'")
-
-    # Zip
-    data['Zip'] = clean_sql_text(data['Zip'], 'nullstring', "'")
-
-    # PrimElec
-    data['PrimElec'] = convert_to_bit(clean_sql_text(data['PrimElec']))
-
-    # GenElec
-    data['GenElec'] = convert_to_bit(clean_sql_text(data['GenElec']))
-
-    # RptCd
-    data['RptCd'] = clean_sql_text(data['RptCd'], 'nullstring', "'")
-
-    # ElecCd
-    data['ElecCd'] = clean_sql_text(data['ElecCd'], '', "'")
-
-    # ElecDt
-    data['ElecDt'] = "'" + convert_to_date(data['ElecDt'], dateformat, image, 'ElecDt', 'Header', 0, 'F3P', '') + "'"
-    if data['ElecDt'] == "''":
-        data['ElecDt'] = 'NULL'
-
-    # ElecSt
-    data['ElecSt'] = clean_sql_text(data['ElecSt'], 'nullstring', "'")
-
-    # CovgFmDt
-    data['CovgFmDt'] = "'" + convert_to_date(data['CovgFmDt'], dateformat, image, 'CovgFmDt', 'Header', 0, 'F3P',
-                                             '') + "'"
-    if data['CovgFmDt'] == "''":
-        data['CovgFmDt'] = 'NULL'
-
-    # CovgToDt
-    data['CovgToDt'] = "'" + convert_to_date(data['CovgToDt'], dateformat, image, 'CovgToDt', 'Header', 0, 'F3P',
-                                             '') + "'"
-    if data['CovgToDt'] == "''":
-        data['CovgToDt'] = 'NULL'
-
-    # TrsFullName
-    if data['TrsFullName'] != '':
-        if data['TrsLName'] != '' or data['TrsFName'] != '' or data['TrsMName'] != '' or data['TrsPfx'] != '' or data[
-            'TrsSfx'] != '':
-            AddEntryToErrorLog('Treasurer full name (' + data[
-                'TrsFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            treas = parse_full_name(data['TrsFullName'], namedelim)
-            data['TrsLName'] = treas[0]
-            data['TrsFName'] = treas[1]
-            data['TrsMName'] = treas[2]
-            data['TrsPfx'] = treas[3]
-            data['TrsSfx'] = treas[4]
-        else:
-            data['TrsLName'] = data['TrsFullName']
-
-    # TrsLName
-    data['TrsLName'] = clean_sql_text(data['TrsLName'], 'nullstring', "'")
-
-    # TrsFName
-    data['TrsFName'] = clean_sql_text(data['TrsFName'], '', "'")
-
-    # TrsMName
-    data['TrsMName'] = clean_sql_text(data['TrsMName'], '', "'")
-
-    # TrsPfx
-    data['TrsPfx'] = clean_sql_text(data['TrsPfx'], '', "'")
-
-    # TrsSfx
-    data['TrsSfx'] = clean_sql_text(data['TrsSfx'], '', "'")
-
-    # SignDt
-    data['SignDt'] = "'" + convert_to_date(data['SignDt'], dateformat, image, 'SignDt', 'Header', 0, 'F3P', '') + "'"
-    if data['SignDt'] == "''":
-        data['SignDt'] = 'NULL'
-
-    # CashBegin_P_6
-    data['CashBegin_P_6'] = ck_curr_val(data['CashBegin_P_6'], image, 'CashBegin_P_6', 'Header', 0)
-
-    # TotRcpts_P_7
-    data['TotRcpts_P_7'] = ck_curr_val(data['TotRcpts_P_7'], image, 'TotRcpts_P_7', 'Header', 0)
-
-    # Subtotal_P_8
-    data['Subtotal_P_8'] = ck_curr_val(data['Subtotal_P_8'], image, 'Subtotal_P_8', 'Header', 0)
-
-    # TotDisb_P_9
-    data['TotDisb_P_9'] = ck_curr_val(data['TotDisb_P_9'], image, 'TotDisb_P_9', 'Header', 0)
-
-    # CashClose_P_10
-    data['CashClose_P_10'] = ck_curr_val(data['CashClose_P_10'], image, 'CashClose_P_10', 'Header', 0)
-
-    # DebtsTo_P_11
-    data['DebtsTo_P_11'] = ck_curr_val(data['DebtsTo_P_11'], image, 'DebtsTo_P_11', 'Header', 0)
-
-    # DebtsBy_P_12
-    data['DebtsBy_P_12'] = ck_curr_val(data['DebtsBy_P_12'], image, 'DebtsBy_P_12', 'Header', 0)
-
-    # LmtdExps_P_13
-    data['LmtdExps_P_13'] = ck_curr_val(data['LmtdExps_P_13'], image, 'LmtdExps_P_13', 'Header', 0)
-
-    # NetConts_P_14
-    data['NetConts_P_14'] = ck_curr_val(data['NetConts_P_14'], image, 'NetConts_P_14', 'Header', 0)
-
-    # NetOpExps_P_15
-    data['NetOpExps_P_15'] = ck_curr_val(data['NetOpExps_P_15'], image, 'NetOpExps_P_15', 'Header', 0)
-
-    # FedFnds_P_16
-    data['FedFnds_P_16'] = ck_curr_val(data['FedFnds_P_16'], image, 'FedFnds_P_16', 'Header', 0)
-
-    # IndContsItem_P_17a1
-    data['IndContsItem_P_17a1'] = ck_curr_val(data['IndContsItem_P_17a1'], image, 'IndContsItem_P_17a1', 'Header', 0)
-
-    # IndContsUnitem_P_17a2
-    data['IndContsUnitem_P_17a2'] = ck_curr_val(data['IndContsUnitem_P_17a2'], image, 'IndContsUnitem_P_17a2', 'Header',
-                                                0)
-
-    # IndContsTot_P_17a3
-    data['IndContsTot_P_17a3'] = ck_curr_val(data['IndContsTot_P_17a3'], image, 'IndContsTot_P_17a3', 'Header', 0)
-
-    # PolPtyCommConts_P_17b
-    data['PolPtyCommConts_P_17b'] = ck_curr_val(data['PolPtyCommConts_P_17b'], image, 'PolPtyCommConts_P_17b', 'Header',
-                                                0)
-
-    # OthPolCommConts_P_17c
-    data['OthPolCommConts_P_17c'] = ck_curr_val(data['OthPolCommConts_P_17c'], image, 'OthPolCommConts_P_17c', 'Header',
-                                                0)
-
-    # CandConts_P_17d
-    data['CandConts_P_17d'] = ck_curr_val(data['CandConts_P_17d'], image, 'CandConts_P_17d', 'Header', 0)
-
-    # TotConts_P_17e
-    data['TotConts_P_17e'] = ck_curr_val(data['TotConts_P_17e'], image, 'TotConts_P_17e', 'Header', 0)
-
-    # TranFmPtyComms_P_18
-    data['TranFmPtyComms_P_18'] = ck_curr_val(data['TranFmPtyComms_P_18'], image, 'TranFmPtyComms_P_18', 'Header', 0)
-
-    # CandLoans_P_19a
-    data['CandLoans_P_19a'] = ck_curr_val(data['CandLoans_P_19a'], image, 'CandLoans_P_19a', 'Header', 0)
-
-    # OthLoans_P_19b
-    data['OthLoans_P_19b'] = ck_curr_val(data['OthLoans_P_19b'], image, 'OthLoans_P_19b', 'Header', 0)
-
-    # TotLoans_P_19c
-    data['TotLoans_P_19c'] = ck_curr_val(data['TotLoans_P_19c'], image, 'TotLoans_P_19c', 'Header', 0)
-
-    # OptgOffsets_P_20a
-    data['OptgOffsets_P_20a'] = ck_curr_val(data['OptgOffsets_P_20a'], image, 'OptgOffsets_P_20a', 'Header', 0)
-
-    # FndrsgOffsets_P_20b
-    data['FndrsgOffsets_P_20b'] = ck_curr_val(data['FndrsgOffsets_P_20b'], image, 'FndrsgOffsets_P_20b', 'Header', 0)
-
-    # LegalAcctgOffsets_P_20c
-    data['LegalAcctgOffsets_P_20c'] = ck_curr_val(data['LegalAcctgOffsets_P_20c'], image, 'LegalAcctgOffsets_P_20c',
-                                                  'Header', 0)
-
-    # TotOffsets_P_20d
-    data['TotOffsets_P_20d'] = ck_curr_val(data['TotOffsets_P_20d'], image, 'TotOffsets_P_20d', 'Header', 0)
-
-    # OthRcpts_P_21
-    data['OthRcpts_P_21'] = ck_curr_val(data['OthRcpts_P_21'], image, 'OthRcpts_P_21', 'Header', 0)
-
-    # TotRcpts_P_22
-    data['TotRcpts_P_22'] = ck_curr_val(data['TotRcpts_P_22'], image, 'TotRcpts_P_22', 'Header', 0)
-
-    # OpExps_P_23
-    data['OpExps_P_23'] = ck_curr_val(data['OpExps_P_23'], image, 'OpExps_P_23', 'Header', 0)
-
-    # TranToOthAuthComms_P_24
-    data['TranToOthAuthComms_P_24'] = ck_curr_val(data['TranToOthAuthComms_P_24'], image, 'TranToOthAuthComms_P_24',
-                                                  'Header', 0)
-
-    # FndrsgDisb_P_25
-    data['FndrsgDisb_P_25'] = ck_curr_val(data['FndrsgDisb_P_25'], image, 'FndrsgDisb_P_25', 'Header', 0)
-
-    # LegalAcctgDisb_P_26
-    data['LegalAcctgDisb_P_26'] = ck_curr_val(data['LegalAcctgDisb_P_26'], image, 'LegalAcctgDisb_P_26', 'Header', 0)
-
-    # CandLoansRepaid_P_27a
-    data['CandLoansRepaid_P_27a'] = ck_curr_val(data['CandLoansRepaid_P_27a'], image, 'CandLoansRepaid_P_27a', 'Header',
-                                                0)
-
-    # OthLoansRepaid_P_27b
-    data['OthLoansRepaid_P_27b'] = ck_curr_val(data['OthLoansRepaid_P_27b'], image, 'OthLoansRepaid_P_27b', 'Header', 0)
-
-    # TotLoansRepaid_P_27c
-    data['TotLoansRepaid_P_27c'] = ck_curr_val(data['TotLoansRepaid_P_27c'], image, 'TotLoansRepaid_P_27c', 'Header', 0)
-
-    # RefundsInd_P_28a
-    data['RefundsInd_P_28a'] = ck_curr_val(data['RefundsInd_P_28a'], image, 'RefundsInd_P_28a', 'Header', 0)
-
-    # RefundsPolPtyComms_P_28b
-    data['RefundsPolPtyComms_P_28b'] = ck_curr_val(data['RefundsPolPtyComms_P_28b'], image, 'RefundsPolPtyComms_P_28b',
-                                                   'Header', 0)
-
-    # RefundsOthPolComms_P_28c
-    data['RefundsOthPolComms_P_28c'] = ck_curr_val(data['RefundsOthPolComms_P_28c'], image, 'RefundsOthPolComms_P_28c',
-                                                   'Header', 0)
-
-    # TotRefunds_P_28d
-    data['TotRefunds_P_28d'] = ck_curr_val(data['TotRefunds_P_28d'], image, 'TotRefunds_P_28d', 'Header', 0)
-
-    # OthDisb_P_29
-    data['OthDisb_P_29'] = ck_curr_val(data['OthDisb_P_29'], image, 'OthDisb_P_29', 'Header', 0)
-
-    # TotDisb_P_30
-    data['TotDisb_P_30'] = ck_curr_val(data['TotDisb_P_30'], image, 'TotDisb_P_30', 'Header', 0)
-
-    # ItmsToBeLiq_P_31
-    data['ItmsToBeLiq_P_31'] = ck_curr_val(data['ItmsToBeLiq_P_31'], image, 'ItmsToBeLiq_P_31', 'Header', 0)
-
-    # Alabama_P
-    data['Alabama_P'] = ck_curr_val(data['Alabama_P'], image, 'Alabama_P', 'Header', 0)
-
-    # Alaska_P
-    data['Alaska_P'] = ck_curr_val(data['Alaska_P'], image, 'Alaska_P', 'Header', 0)
-
-    # Arizona_P
-    data['Arizona_P'] = ck_curr_val(data['Arizona_P'], image, 'Arizona_P', 'Header', 0)
-
-    # Arkansas_P
-    data['Arkansas_P'] = ck_curr_val(data['Arkansas_P'], image, 'Arkansas_P', 'Header', 0)
-
-    # California_P
-    data['California_P'] = ck_curr_val(data['California_P'], image, 'California_P', 'Header', 0)
-
-    # Colorado_P
-    data['Colorado_P'] = ck_curr_val(data['Colorado_P'], image, 'Colorado_P', 'Header', 0)
-
-    # Connecticut_P
-    data['Connecticut_P'] = ck_curr_val(data['Connecticut_P'], image, 'Connecticut_P', 'Header', 0)
-
-    # Delaware_P
-    data['Delaware_P'] = ck_curr_val(data['Delaware_P'], image, 'Delaware_P', 'Header', 0)
-
-    # DistCol_P
-    data['DistCol_P'] = ck_curr_val(data['DistCol_P'], image, 'DistCol_P', 'Header', 0)
-
-    # Florida_P
-    data['Florida_P'] = ck_curr_val(data['Florida_P'], image, 'Florida_P', 'Header', 0)
-
-    # Georgia_P
-    data['Georgia_P'] = ck_curr_val(data['Georgia_P'], image, 'Georgia_P', 'Header', 0)
-
-    # Hawaii_P
-    data['Hawaii_P'] = ck_curr_val(data['Hawaii_P'], image, 'Hawaii_P', 'Header', 0)
-
-    # Idaho_P
-    data['Idaho_P'] = ck_curr_val(data['Idaho_P'], image, 'Idaho_P', 'Header', 0)
-
-    # Illinois_P
-    data['Illinois_P'] = ck_curr_val(data['Illinois_P'], image, 'Illinois_P', 'Header', 0)
-
-    # Indiana_P
-    data['Indiana_P'] = ck_curr_val(data['Indiana_P'], image, 'Indiana_P', 'Header', 0)
-
-    # Iowa_P
-    data['Iowa_P'] = ck_curr_val(data['Iowa_P'], image, 'Iowa_P', 'Header', 0)
-
-    # Kansas_P
-    data['Kansas_P'] = ck_curr_val(data['Kansas_P'], image, 'Kansas_P', 'Header', 0)
-
-    # Kentucky_P
-    data['Kentucky_P'] = ck_curr_val(data['Kentucky_P'], image, 'Kentucky_P', 'Header', 0)
-
-    # Louisiana_P
-    data['Louisiana_P'] = ck_curr_val(data['Louisiana_P'], image, 'Louisiana_P', 'Header', 0)
-
-    # Maine_P
-    data['Maine_P'] = ck_curr_val(data['Maine_P'], image, 'Maine_P', 'Header', 0)
-
-    # Maryland_P
-    data['Maryland_P'] = ck_curr_val(data['Maryland_P'], image, 'Maryland_P', 'Header', 0)
-
-    # Massachusetts_P
-    data['Massachusetts_P'] = ck_curr_val(data['Massachusetts_P'], image, 'Massachusetts_P', 'Header', 0)
-
-    # Michigan_P
-    data['Michigan_P'] = ck_curr_val(data['Michigan_P'], image, 'Michigan_P', 'Header', 0)
-
-    # Minnesota_P
-    data['Minnesota_P'] = ck_curr_val(data['Minnesota_P'], image, 'Minnesota_P', 'Header', 0)
-
-    # Mississippi_P
-    data['Mississippi_P'] = ck_curr_val(data['Mississippi_P'], image, 'Mississippi_P', 'Header', 0)
-
-    # Missouri_P
-    data['Missouri_P'] = ck_curr_val(data['Missouri_P'], image, 'Missouri_P', 'Header', 0)
-
-    # Montana_P
-    data['Montana_P'] = ck_curr_val(data['Montana_P'], image, 'Montana_P', 'Header', 0)
-
-    # Nebraska_P
-    data['Nebraska_P'] = ck_curr_val(data['Nebraska_P'], image, 'Nebraska_P', 'Header', 0)
-
-    # Nevada_P
-    data['Nevada_P'] = ck_curr_val(data['Nevada_P'], image, 'Nevada_P', 'Header', 0)
-
-    # NewHampshire_P
-    data['NewHampshire_P'] = ck_curr_val(data['NewHampshire_P'], image, 'NewHampshire_P', 'Header', 0)
-
-    # NewJersey_P
-    data['NewJersey_P'] = ck_curr_val(data['NewJersey_P'], image, 'NewJersey_P', 'Header', 0)
-
-    # NewMexico_P
-    data['NewMexico_P'] = ck_curr_val(data['NewMexico_P'], image, 'NewMexico_P', 'Header', 0)
-
-    # NewYork_P
-    data['NewYork_P'] = ck_curr_val(data['NewYork_P'], image, 'NewYork_P', 'Header', 0)
-
-    # NorthCarolina_P
-    data['NorthCarolina_P'] = ck_curr_val(data['NorthCarolina_P'], image, 'NorthCarolina_P', 'Header', 0)
-
-    # NorthDakota_P
-    data['NorthDakota_P'] = ck_curr_val(data['NorthDakota_P'], image, 'NorthDakota_P', 'Header', 0)
-
-    # Ohio_P
-    data['Ohio_P'] = ck_curr_val(data['Ohio_P'], image, 'Ohio_P', 'Header', 0)
-
-    # Oklahoma_P
-    data['Oklahoma_P'] = ck_curr_val(data['Oklahoma_P'], image, 'Oklahoma_P', 'Header', 0)
-
-    # Oregon_P
-    data['Oregon_P'] = ck_curr_val(data['Oregon_P'], image, 'Oregon_P', 'Header', 0)
-
-    # Pennsylvania_P
-    data['Pennsylvania_P'] = ck_curr_val(data['Pennsylvania_P'], image, 'Pennsylvania_P', 'Header', 0)
-
-    # RhodeIsland_P
-    data['RhodeIsland_P'] = ck_curr_val(data['RhodeIsland_P'], image, 'RhodeIsland_P', 'Header', 0)
-
-    # SouthCarolina_P
-    data['SouthCarolina_P'] = ck_curr_val(data['SouthCarolina_P'], image, 'SouthCarolina_P', 'Header', 0)
-
-    # SouthDakota_P
-    data['SouthDakota_P'] = ck_curr_val(data['SouthDakota_P'], image, 'SouthDakota_P', 'Header', 0)
-
-    # Tennessee_P
-    data['Tennessee_P'] = ck_curr_val(data['Tennessee_P'], image, 'Tennessee_P', 'Header', 0)
-
-    # Texas_P
-    data['Texas_P'] = ck_curr_val(data['Texas_P'], image, 'Texas_P', 'Header', 0)
-
-    # Utah_P
-    data['Utah_P'] = ck_curr_val(data['Utah_P'], image, 'Utah_P', 'Header', 0)
-
-    # Vermont_P
-    data['Vermont_P'] = ck_curr_val(data['Vermont_P'], image, 'Vermont_P', 'Header', 0)
-
-    # Virginia_P
-    data['Virginia_P'] = ck_curr_val(data['Virginia_P'], image, 'Virginia_P', 'Header', 0)
-
-    # Washington_P
-    data['Washington_P'] = ck_curr_val(data['Washington_P'], image, 'Washington_P', 'Header', 0)
-
-    # WestVirginia_P
-    data['WestVirginia_P'] = ck_curr_val(data['WestVirginia_P'], image, 'WestVirginia_P', 'Header', 0)
-
-    # Wisconsin_P
-    data['Wisconsin_P'] = ck_curr_val(data['Wisconsin_P'], image, 'Wisconsin_P', 'Header', 0)
-
-    # Wyoming_P
-    data['Wyoming_P'] = ck_curr_val(data['Wyoming_P'], image, 'Wyoming_P', 'Header', 0)
-
-    # PuertoRico_P
-    data['PuertoRico_P'] = ck_curr_val(data['PuertoRico_P'], image, 'PuertoRico_P', 'Header', 0)
-
-    # Guam_P
-    data['Guam_P'] = ck_curr_val(data['Guam_P'], image, 'Guam_P', 'Header', 0)
-
-    # VirginIslands_P
-    data['VirginIslands_P'] = ck_curr_val(data['VirginIslands_P'], image, 'VirginIslands_P', 'Header', 0)
-
-    # TotAllocs_P
-    data['TotAllocs_P'] = ck_curr_val(data['TotAllocs_P'], image, 'TotAllocs_P', 'Header', 0)
-
-    # FedFnds_T_16
-    data['FedFnds_T_16'] = ck_curr_val(data['FedFnds_T_16'], image, 'FedFnds_T_16', 'Header', 0)
-
-    # IndContsItem_T_17a1
-    data['IndContsItem_T_17a1'] = ck_curr_val(data['IndContsItem_T_17a1'], image, 'IndContsItem_T_17a1', 'Header', 0)
-
-    # IndContsUnitem_T_17a2
-    data['IndContsUnitem_T_17a2'] = ck_curr_val(data['IndContsUnitem_T_17a2'], image, 'IndContsUnitem_T_17a2', 'Header',
-                                                0)
-
-    # IndContsTot_T_17a3
-    data['IndContsTot_T_17a3'] = ck_curr_val(data['IndContsTot_T_17a3'], image, 'IndContsTot_T_17a3', 'Header', 0)
-
-    # PolPtyCommConts_T_17b
-    data['PolPtyCommConts_T_17b'] = ck_curr_val(data['PolPtyCommConts_T_17b'], image, 'PolPtyCommConts_T_17b', 'Header',
-                                                0)
-
-    # OthPolCommConts_T_17c
-    data['OthPolCommConts_T_17c'] = ck_curr_val(data['OthPolCommConts_T_17c'], image, 'OthPolCommConts_T_17c', 'Header',
-                                                0)
-
-    # CandConts_T_17d
-    data['CandConts_T_17d'] = ck_curr_val(data['CandConts_T_17d'], image, 'CandConts_T_17d', 'Header', 0)
-
-    # TotConts_T_17e
-    data['TotConts_T_17e'] = ck_curr_val(data['TotConts_T_17e'], image, 'TotConts_T_17e', 'Header', 0)
-
-    # TranFmPtyComms_T_18
-    data['TranFmPtyComms_T_18'] = ck_curr_val(data['TranFmPtyComms_T_18'], image, 'TranFmPtyComms_T_18', 'Header', 0)
-
-    # CandLoans_T_19a
-    data['CandLoans_T_19a'] = ck_curr_val(data['CandLoans_T_19a'], image, 'CandLoans_T_19a', 'Header', 0)
-
-    # OthLoans_T_19b
-    data['OthLoans_T_19b'] = ck_curr_val(data['OthLoans_T_19b'], image, 'OthLoans_T_19b', 'Header', 0)
-
-    # TotLoans_T_19c
-    data['TotLoans_T_19c'] = ck_curr_val(data['TotLoans_T_19c'], image, 'TotLoans_T_19c', 'Header', 0)
-
-    # OptgOffsets_T_20a
-    data['OptgOffsets_T_20a'] = ck_curr_val(data['OptgOffsets_T_20a'], image, 'OptgOffsets_T_20a', 'Header', 0)
-
-    # FndrsgOffsets_T_20b
-    data['FndrsgOffsets_T_20b'] = ck_curr_val(data['FndrsgOffsets_T_20b'], image, 'FndrsgOffsets_T_20b', 'Header', 0)
-
-    # LegalAcctgOffsets_T_20c
-    data['LegalAcctgOffsets_T_20c'] = ck_curr_val(data['LegalAcctgOffsets_T_20c'], image, 'LegalAcctgOffsets_T_20c',
-                                                  'Header', 0)
-
-    # TotOffsets_T_20d
-    data['TotOffsets_T_20d'] = ck_curr_val(data['TotOffsets_T_20d'], image, 'TotOffsets_T_20d', 'Header', 0)
-
-    # OthRcpts_T_21
-    data['OthRcpts_T_21'] = ck_curr_val(data['OthRcpts_T_21'], image, 'OthRcpts_T_21', 'Header', 0)
-
-    # TotRcpts_T_22
-    data['TotRcpts_T_22'] = ck_curr_val(data['TotRcpts_T_22'], image, 'TotRcpts_T_22', 'Header', 0)
-
-    # OpExps_T_23
-    data['OpExps_T_23'] = ck_curr_val(data['OpExps_T_23'], image, 'OpExps_T_23', 'Header', 0)
-
-    # TranToOthAuthComms_T_24
-    data['TranToOthAuthComms_T_24'] = ck_curr_val(data['TranToOthAuthComms_T_24'], image, 'TranToOthAuthComms_T_24',
-                                                  'Header', 0)
-
-    # FndrsgDisb_T_25
-    data['FndrsgDisb_T_25'] = ck_curr_val(data['FndrsgDisb_T_25'], image, 'FndrsgDisb_T_25', 'Header', 0)
-
-    # LegalAcctgDisb_T_26
-    data['LegalAcctgDisb_T_26'] = ck_curr_val(data['LegalAcctgDisb_T_26'], image, 'LegalAcctgDisb_T_26', 'Header', 0)
-
-    # CandLoansRepaid_T_27a
-    data['CandLoansRepaid_T_27a'] = ck_curr_val(data['CandLoansRepaid_T_27a'], image, 'CandLoansRepaid_T_27a', 'Header',
-                                                0)
-
-    # OthLoansRepaid_T_27b
-    data['OthLoansRepaid_T_27b'] = ck_curr_val(data['OthLoansRepaid_T_27b'], image, 'OthLoansRepaid_T_27b', 'Header', 0)
-
-    # TotLoansRepaid_T_27c
-    data['TotLoansRepaid_T_27c'] = ck_curr_val(data['TotLoansRepaid_T_27c'], image, 'TotLoansRepaid_T_27c', 'Header', 0)
-
-    # RefundsInd_T_28a
-    data['RefundsInd_T_28a'] = ck_curr_val(data['RefundsInd_T_28a'], image, 'RefundsInd_T_28a', 'Header', 0)
-
-    # RefundsPolPtyComms_T_28b
-    data['RefundsPolPtyComms_T_28b'] = ck_curr_val(data['RefundsPolPtyComms_T_28b'], image, 'RefundsPolPtyComms_T_28b',
-                                                   'Header', 0)
-
-    # RefundsOthPolComms_T_28c
-    data['RefundsOthPolComms_T_28c'] = ck_curr_val(data['RefundsOthPolComms_T_28c'], image, 'RefundsOthPolComms_T_28c',
-                                                   'Header', 0)
-
-    # TotRefunds_T_28d
-    data['TotRefunds_T_28d'] = ck_curr_val(data['TotRefunds_T_28d'], image, 'TotRefunds_T_28d', 'Header', 0)
-
-    # OthDisb_T_29
-    data['OthDisb_T_29'] = ck_curr_val(data['OthDisb_T_29'], image, 'OthDisb_T_29', 'Header', 0)
-
-    # TotDisb_T_30
-    data['TotDisb_T_30'] = ck_curr_val(data['TotDisb_T_30'], image, 'TotDisb_T_30', 'Header', 0)
-
-    # Alabama_T
-    data['Alabama_T'] = ck_curr_val(data['Alabama_T'], image, 'Alabama_T', 'Header', 0)
-
-    # Alaska_T
-    data['Alaska_T'] = ck_curr_val(data['Alaska_T'], image, 'Alaska_T', 'Header', 0)
-
-    # Arizona_T
-    data['Arizona_T'] = ck_curr_val(data['Arizona_T'], image, 'Arizona_T', 'Header', 0)
-
-    # Arkansas_T
-    data['Arkansas_T'] = ck_curr_val(data['Arkansas_T'], image, 'Arkansas_T', 'Header', 0)
-
-    # California_T
-    data['California_T'] = ck_curr_val(data['California_T'], image, 'California_T', 'Header', 0)
-
-    # Colorado_T
-    data['Colorado_T'] = ck_curr_val(data['Colorado_T'], image, 'Colorado_T', 'Header', 0)
-
-    # Connecticut_T
-    data['Connecticut_T'] = ck_curr_val(data['Connecticut_T'], image, 'Connecticut_T', 'Header', 0)
-
-    # Delaware_T
-    data['Delaware_T'] = ck_curr_val(data['Delaware_T'], image, 'Delaware_T', 'Header', 0)
-
-    # DistCol_T
-    data['DistCol_T'] = ck_curr_val(data['DistCol_T'], image, 'DistCol_T', 'Header', 0)
-
-    # Florida_T
-    data['Florida_T'] = ck_curr_val(data['Florida_T'], image, 'Florida_T', 'Header', 0)
-
-    # Georgia_T
-    data['Georgia_T'] = ck_curr_val(data['Georgia_T'], image, 'Georgia_T', 'Header', 0)
-
-    # Hawaii_T
-    data['Hawaii_T'] = ck_curr_val(data['Hawaii_T'], image, 'Hawaii_T', 'Header', 0)
-
-    # Idaho_T
-    data['Idaho_T'] = ck_curr_val(data['Idaho_T'], image, 'Idaho_T', 'Header', 0)
-
-    # Illinois_T
-    data['Illinois_T'] = ck_curr_val(data['Illinois_T'], image, 'Illinois_T', 'Header', 0)
-
-    # Indiana_T
-    data['Indiana_T'] = ck_curr_val(data['Indiana_T'], image, 'Indiana_T', 'Header', 0)
-
-    # Iowa_T
-    data['Iowa_T'] = ck_curr_val(data['Iowa_T'], image, 'Iowa_T', 'Header', 0)
-
-    # Kansas_T
-    data['Kansas_T'] = ck_curr_val(data['Kansas_T'], image, 'Kansas_T', 'Header', 0)
-
-    # Kentucky_T
-    data['Kentucky_T'] = ck_curr_val(data['Kentucky_T'], image, 'Kentucky_T', 'Header', 0)
-
-    # Louisiana_T
-    data['Louisiana_T'] = ck_curr_val(data['Louisiana_T'], image, 'Louisiana_T', 'Header', 0)
-
-    # Maine_T
-    data['Maine_T'] = ck_curr_val(data['Maine_T'], image, 'Maine_T', 'Header', 0)
-
-    # Maryland_T
-    data['Maryland_T'] = ck_curr_val(data['Maryland_T'], image, 'Maryland_T', 'Header', 0)
-
-    # Massachusetts_T
-    data['Massachusetts_T'] = ck_curr_val(data['Massachusetts_T'], image, 'Massachusetts_T', 'Header', 0)
-
-    # Michigan_T
-    data['Michigan_T'] = ck_curr_val(data['Michigan_T'], image, 'Michigan_T', 'Header', 0)
-
-    # Minnesota_T
-    data['Minnesota_T'] = ck_curr_val(data['Minnesota_T'], image, 'Minnesota_T', 'Header', 0)
-
-    # Mississippi_T
-    data['Mississippi_T'] = ck_curr_val(data['Mississippi_T'], image, 'Mississippi_T', 'Header', 0)
-
-    # Missouri_T
-    data['Missouri_T'] = ck_curr_val(data['Missouri_T'], image, 'Missouri_T', 'Header', 0)
-
-    # Montana_T
-    data['Montana_T'] = ck_curr_val(data['Montana_T'], image, 'Montana_T', 'Header', 0)
-
-    # Nebraska_T
-    data['Nebraska_T'] = ck_curr_val(data['Nebraska_T'], image, 'Nebraska_T', 'Header', 0)
-
-    # Nevada_T
-    data['Nevada_T'] = ck_curr_val(data['Nevada_T'], image, 'Nevada_T', 'Header', 0)
-
-    # NewHampshire_T
-    data['NewHampshire_T'] = ck_curr_val(data['NewHampshire_T'], image, 'NewHampshire_T', 'Header', 0)
-
-    # NewJersey_T
-    data['NewJersey_T'] = ck_curr_val(data['NewJersey_T'], image, 'NewJersey_T', 'Header', 0)
-
-    # NewMexico_T
-    data['NewMexico_T'] = ck_curr_val(data['NewMexico_T'], image, 'NewMexico_T', 'Header', 0)
-
-    # NewYork_T
-    data['NewYork_T'] = ck_curr_val(data['NewYork_T'], image, 'NewYork_T', 'Header', 0)
-
-    # NorthCarolina_T
-    data['NorthCarolina_T'] = ck_curr_val(data['NorthCarolina_T'], image, 'NorthCarolina_T', 'Header', 0)
-
-    # NorthDakota_T
-    data['NorthDakota_T'] = ck_curr_val(data['NorthDakota_T'], image, 'NorthDakota_T', 'Header', 0)
-
-    # Ohio_T
-    data['Ohio_T'] = ck_curr_val(data['Ohio_T'], image, 'Ohio_T', 'Header', 0)
-
-    # Oklahoma_T
-    data['Oklahoma_T'] = ck_curr_val(data['Oklahoma_T'], image, 'Oklahoma_T', 'Header', 0)
-
-    # Oregon_T
-    data['Oregon_T'] = ck_curr_val(data['Oregon_T'], image, 'Oregon_T', 'Header', 0)
-
-    # Pennsylvania_T
-    data['Pennsylvania_T'] = ck_curr_val(data['Pennsylvania_T'], image, 'Pennsylvania_T', 'Header', 0)
-
-    # RhodeIsland_T
-    data['RhodeIsland_T'] = ck_curr_val(data['RhodeIsland_T'], image, 'RhodeIsland_T', 'Header', 0)
-
-    # SouthCarolina_T
-    data['SouthCarolina_T'] = ck_curr_val(data['SouthCarolina_T'], image, 'SouthCarolina_T', 'Header', 0)
-
-    # SouthDakota_T
-    data['SouthDakota_T'] = ck_curr_val(data['SouthDakota_T'], image, 'SouthDakota_T', 'Header', 0)
-
-    # Tennessee_T
-    data['Tennessee_T'] = ck_curr_val(data['Tennessee_T'], image, 'Tennessee_T', 'Header', 0)
-
-    # Texas_T
-    data['Texas_T'] = ck_curr_val(data['Texas_T'], image, 'Texas_T', 'Header', 0)
-
-    # Utah_T
-    data['Utah_T'] = ck_curr_val(data['Utah_T'], image, 'Utah_T', 'Header', 0)
-
-    # Vermont_T
-    data['Vermont_T'] = ck_curr_val(data['Vermont_T'], image, 'Vermont_T', 'Header', 0)
-
-    # Virginia_T
-    data['Virginia_T'] = ck_curr_val(data['Virginia_T'], image, 'Virginia_T', 'Header', 0)
-
-    # Washington_T
-    data['Washington_T'] = ck_curr_val(data['Washington_T'], image, 'Washington_T', 'Header', 0)
-
-    # WestVirginia_T
-    data['WestVirginia_T'] = ck_curr_val(data['WestVirginia_T'], image, 'WestVirginia_T', 'Header', 0)
-
-    # Wisconsin_T
-    data['Wisconsin_T'] = ck_curr_val(data['Wisconsin_T'], image, 'Wisconsin_T', 'Header', 0)
-
-    # Wyoming_T
-    data['Wyoming_T'] = ck_curr_val(data['Wyoming_T'], image, 'Wyoming_T', 'Header', 0)
-
-    # PuertoRico_T
-    data['PuertoRico_T'] = ck_curr_val(data['PuertoRico_T'], image, 'PuertoRico_T', 'Header', 0)
-
-    # Guam_T
-    data['Guam_T'] = ck_curr_val(data['Guam_T'], image, 'Guam_T', 'Header', 0)
-
-    # VirginIslands_T
-    data['VirginIslands_T'] = ck_curr_val(data['VirginIslands_T'], image, 'VirginIslands_T', 'Header', 0)
-
-    # TotAllocs_T
-    data['TotAllocs_T'] = ck_curr_val(data['TotAllocs_T'], image, 'TotAllocs_T', 'Header', 0)
-
-    return data
-
-
-def check_rpt_hdrs_f3x(image, data, namedelim='', dateformat='CCYYMMDD'):
-    # FormTp
-    data['FormTp'] = clean_sql_text(data['FormTp'], 'nullstring', "'")
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'], 'nullstring', "'")
-
-    # CommNm
-    data['CommNm'] = clean_sql_text(data['CommNm'], 'nullstring', "'")
-
-    # AddrChg
-    data['AddrChg'] = convert_to_bit(clean_sql_text(data['AddrChg']))
-
-    # Addr1
-    data['Addr1'] = clean_sql_text(data['Addr1'], 'nullstring', "'")
-
-    # Addr2
-    data['Addr2'] = clean_sql_text(data['Addr2'], '', "'")
-
-    # City
-    data['City'] = clean_sql_text(data['City'], 'nullstring', "'")
-
-    # StAbbr
-    data['StAbbr'] = clean_sql_text(data['StAbbr'], 'nullstring', "'")
-
-    # Zip
-    data['Zip'] = clean_sql_text(data['Zip'], 'nullstring', "'")
-
-    # RptCd
-    data['RptCd'] = clean_sql_text(data['RptCd'], 'nullstring', "'")
-
-    # ElecCd
-    data['ElecCd'] = clean_sql_text(data['ElecCd'], '', "'")
-
-    # ElecDt
-    data['ElecDt'] = "'" + convert_to_date(data['ElecDt'], dateformat, image, 'ElecDt', 'Header', 0, 'F3X', '') + "'"
-    if data['ElecDt'] == "''":
-        data['ElecDt'] = 'NULL'
-
-    # ElecSt
-    data['ElecSt'] = clean_sql_text(data['ElecSt'], 'nullstring', "'")
-
-    # CovgFmDt
-    data['CovgFmDt'] = "'" + convert_to_date(data['CovgFmDt'], dateformat, image, 'CovgFmDt', 'Header', 0, 'F3X',
-                                             '') + "'"
-    if data['CovgFmDt'] == "''":
-        data['CovgFmDt'] = 'NULL'
-
-    # CovgToDt
-    data['CovgToDt'] = "'" + convert_to_date(data['CovgToDt'], dateformat, image, 'CovgToDt', 'Header', 0, 'F3X',
-                                             '') + "'"
-    if data['CovgToDt'] == "''":
-        data['CovgToDt'] = 'NULL'
-
-    # flgQualComm
-    data['flgQualComm'] = convert_to_bit(clean_sql_text(data['flgQualComm'], '', "'"))
-
-    # TrsFullName
-    if data['TrsFullName'] != '':
-        if data['TrsLName'] != '' or data['TrsFName'] != '' or data['TrsMName'] != '' or data['TrsPfx'] != '' or data[
-            'TrsSfx'] != '':
-            AddEntryToErrorLog('Treasurer full name (' + data[
-                'TrsFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            treas = parse_full_name(data['TrsFullName'], namedelim)
-            data['TrsLName'] = treas[0]
-            data['TrsFName'] = treas[1]
-            data['TrsMName'] = treas[2]
-            data['TrsPfx'] = treas[3]
-            data['TrsSfx'] = treas[4]
-        else:
-            data['TrsLName'] = data['TrsFullName']
-
-    # TrsLName
-    data['TrsLName'] = clean_sql_text(data['TrsLName'], 'nullstring', "'")
-
-    # TrsFName
-    data['TrsFName'] = clean_sql_text(data['TrsFName'], '', "'")
-
-    # TrsMName
-    data['TrsMName'] = clean_sql_text(data['TrsMName'], '', "'")
-
-    # TrsPfx
-    data['TrsPfx'] = clean_sql_text(data['TrsPfx'], '', "'")
-
-    # TrsSfx
-    data['TrsSfx'] = clean_sql_text(data['TrsSfx'], '', "'")
-
-    # SignDt
-    data['SignDt'] = "'" + convert_to_date(data['SignDt'], dateformat, image, 'SignDt', 'Header', 0, 'F3X', '') + "'"
-    if data['SignDt'] == "''":
-        data['SignDt'] = 'NULL'
-
-    # CashBegin_P_6b
-    data['CashBegin_P_6b'] = ck_curr_val(data['CashBegin_P_6b'], image, 'CashBegin_P_6b', 'Header', 0)
-
-    # TotRcpts_P_6c
-    data['TotRcpts_P_6c'] = ck_curr_val(data['TotRcpts_P_6c'], image, 'TotRcpts_P_6c', 'Header', 0)
-
-    # Subtotal_P_6d
-    data['Subtotal_P_6d'] = ck_curr_val(data['Subtotal_P_6d'], image, 'Subtotal_P_6d', 'Header', 0)
-
-    # TotDisb_P_7
-    data['TotDisb_P_7'] = ck_curr_val(data['TotDisb_P_7'], image, 'TotDisb_P_7', 'Header', 0)
-
-    # CashClose_P_8
-    data['CashClose_P_8'] = ck_curr_val(data['CashClose_P_8'], image, 'CashClose_P_8', 'Header', 0)
-
-    # DebtsTo_P_9
-    data['DebtsTo_P_9'] = ck_curr_val(data['DebtsTo_P_9'], image, 'DebtsTo_P_9', 'Header', 0)
-
-    # DebtsBy_P_10
-    data['DebtsBy_P_10'] = ck_curr_val(data['DebtsBy_P_10'], image, 'DebtsBy_P_10', 'Header', 0)
-
-    # IndContsItem_P_11a1
-    data['IndContsItem_P_11a1'] = ck_curr_val(data['IndContsItem_P_11a1'], image, 'IndContsItem_P_11a1', 'Header', 0)
-
-    # IndContsUnitem_P_11a2
-    data['IndContsUnitem_P_11a2'] = ck_curr_val(data['IndContsUnitem_P_11a2'], image, 'IndContsUnitem_P_11a2', 'Header',
-                                                0)
-
-    # IndContsTot_P_11a3
-    data['IndContsTot_P_11a3'] = ck_curr_val(data['IndContsTot_P_11a3'], image, 'IndContsTot_P_11a3', 'Header', 0)
-
-    # PolPtyCommConts_P_11b
-    data['PolPtyCommConts_P_11b'] = ck_curr_val(data['PolPtyCommConts_P_11b'], image, 'PolPtyCommConts_P_11b', 'Header',
-                                                0)
-
-    # OthPolCommConts_P_11c
-    data['OthPolCommConts_P_11c'] = ck_curr_val(data['OthPolCommConts_P_11c'], image, 'OthPolCommConts_P_11c', 'Header',
-                                                0)
-
-    # TotConts_P_11d
-    data['TotConts_P_11d'] = ck_curr_val(data['TotConts_P_11d'], image, 'TotConts_P_11d', 'Header', 0)
-
-    # TranFmPtyComms_P_12
-    data['TranFmPtyComms_P_12'] = ck_curr_val(data['TranFmPtyComms_P_12'], image, 'TranFmPtyComms_P_12', 'Header', 0)
-
-    # AllLoansRcvd_P_13
-    data['AllLoansRcvd_P_13'] = ck_curr_val(data['AllLoansRcvd_P_13'], image, 'AllLoansRcvd_P_13', 'Header', 0)
-
-    # LoanPymtsRcvd_P_14
-    data['LoanPymtsRcvd_P_14'] = ck_curr_val(data['LoanPymtsRcvd_P_14'], image, 'LoanPymtsRcvd_P_14', 'Header', 0)
-
-    # RefundOffsets_P_15
-    data['RefundOffsets_P_15'] = ck_curr_val(data['RefundOffsets_P_15'], image, 'RefundOffsets_P_15', 'Header', 0)
-
-    # RefundsFedConts_P_16
-    data['RefundsFedConts_P_16'] = ck_curr_val(data['RefundsFedConts_P_16'], image, 'RefundsFedConts_P_16', 'Header', 0)
-
-    # OthFedRcptsDvds_P_17
-    data['OthFedRcptsDvds_P_17'] = ck_curr_val(data['OthFedRcptsDvds_P_17'], image, 'OthFedRcptsDvds_P_17', 'Header', 0)
-
-    # TranFmNonFedAcctH3_P_18a
-    data['TranFmNonFedAcctH3_P_18a'] = ck_curr_val(data['TranFmNonFedAcctH3_P_18a'], image, 'TranFmNonFedAcctH3_P_18a',
-                                                   'Header', 0)
-
-    # TranFmNonFedAcctH5_P_18b
-    data['TranFmNonFedAcctH5_P_18b'] = ck_curr_val(data['TranFmNonFedAcctH5_P_18b'], image, 'TranFmNonFedAcctH5_P_18b',
-                                                   'Header', 0)
-
-    # TotNonFedTrans_P_18c
-    data['TotNonFedTrans_P_18c'] = ck_curr_val(data['TotNonFedTrans_P_18c'], image, 'TotNonFedTrans_P_18c', 'Header', 0)
-
-    # TotRcpts_P_19
-    data['TotRcpts_P_19'] = ck_curr_val(data['TotRcpts_P_19'], image, 'TotRcpts_P_19', 'Header', 0)
-
-    # TotFedRcpts_P_20
-    data['TotFedRcpts_P_20'] = ck_curr_val(data['TotFedRcpts_P_20'], image, 'TotFedRcpts_P_20', 'Header', 0)
-
-    # OpExpsFedShr_P_21a1
-    data['OpExpsFedShr_P_21a1'] = ck_curr_val(data['OpExpsFedShr_P_21a1'], image, 'OpExpsFedShr_P_21a1', 'Header', 0)
-
-    # OpExpsNonFedShr_P_21a2
-    data['OpExpsNonFedShr_P_21a2'] = ck_curr_val(data['OpExpsNonFedShr_P_21a2'], image, 'OpExpsNonFedShr_P_21a2',
-                                                 'Header', 0)
-
-    # OpExpsOthFed_P_21b
-    data['OpExpsOthFed_P_21b'] = ck_curr_val(data['OpExpsOthFed_P_21b'], image, 'OpExpsOthFed_P_21b', 'Header', 0)
-
-    # TotOpExps_P_21c
-    data['TotOpExps_P_21c'] = ck_curr_val(data['TotOpExps_P_21c'], image, 'TotOpExps_P_21c', 'Header', 0)
-
-    # TranToPtyComms_P_22
-    data['TranToPtyComms_P_22'] = ck_curr_val(data['TranToPtyComms_P_22'], image, 'TranToPtyComms_P_22', 'Header', 0)
-
-    # ContsToFedCandsComms_P_23
-    data['ContsToFedCandsComms_P_23'] = ck_curr_val(data['ContsToFedCandsComms_P_23'], image,
-                                                    'ContsToFedCandsComms_P_23', 'Header', 0)
-
-    # IndtExps_P_24
-    data['IndtExps_P_24'] = ck_curr_val(data['IndtExps_P_24'], image, 'IndtExps_P_24', 'Header', 0)
-
-    # CoordExpsByPtyComms_P_25
-    data['CoordExpsByPtyComms_P_25'] = ck_curr_val(data['CoordExpsByPtyComms_P_25'], image, 'CoordExpsByPtyComms_P_25',
-                                                   'Header', 0)
-
-    # LoansRepaid_P_26
-    data['LoansRepaid_P_26'] = ck_curr_val(data['LoansRepaid_P_26'], image, 'LoansRepaid_P_26', 'Header', 0)
-
-    # LoansMade_P_27
-    data['LoansMade_P_27'] = ck_curr_val(data['LoansMade_P_27'], image, 'LoansMade_P_27', 'Header', 0)
-
-    # RefundsInd_P_28a
-    data['RefundsInd_P_28a'] = ck_curr_val(data['RefundsInd_P_28a'], image, 'RefundsInd_P_28a', 'Header', 0)
-
-    # RefundsPolPtyComms_P_28b
-    data['RefundsPolPtyComms_P_28b'] = ck_curr_val(data['RefundsPolPtyComms_P_28b'], image, 'RefundsPolPtyComms_P_28b',
-                                                   'Header', 0)
-
-    # RefundsOthPolComms_P_28c
-    data['RefundsOthPolComms_P_28c'] = ck_curr_val(data['RefundsOthPolComms_P_28c'], image, 'RefundsOthPolComms_P_28c',
-                                                   'Header', 0)
-
-    # TotContRefunds_P_28d
-    data['TotContRefunds_P_28d'] = ck_curr_val(data['TotContRefunds_P_28d'], image, 'TotContRefunds_P_28d', 'Header', 0)
-
-    # OthDisb_P_29
-    data['OthDisb_P_29'] = ck_curr_val(data['OthDisb_P_29'], image, 'OthDisb_P_29', 'Header', 0)
-
-    # ShrdElecActivityFedShr_P_30a1
-    data['ShrdElecActivityFedShr_P_30a1'] = ck_curr_val(data['ShrdElecActivityFedShr_P_30a1'], image,
-                                                        'ShrdElecActivityFedShr_P_30a1', 'Header', 0)
-
-    # ShrdElecActivityNonFedShr_P_30a2
-    data['ShrdElecActivityNonFedShr_P_30a2'] = ck_curr_val(data['ShrdElecActivityNonFedShr_P_30a2'], image,
-                                                           'ShrdElecActivityNonFedShr_P_30a2', 'Header', 0)
-
-    # NonAllocFedElecActivity_P_30b
-    data['NonAllocFedElecActivity_P_30b'] = ck_curr_val(data['NonAllocFedElecActivity_P_30b'], image,
-                                                        'NonAllocFedElecActivity_P_30b', 'Header', 0)
-
-    # TotFedElecActivity_P_30c
-    data['TotFedElecActivity_P_30c'] = ck_curr_val(data['TotFedElecActivity_P_30c'], image, 'TotFedElecActivity_P_30c',
-                                                   'Header', 0)
-
-    # TotDisb_P_31
-    data['TotDisb_P_31'] = ck_curr_val(data['TotDisb_P_31'], image, 'TotDisb_P_31', 'Header', 0)
-
-    # TotFedDisb_P_32
-    data['TotFedDisb_P_32'] = ck_curr_val(data['TotFedDisb_P_32'], image, 'TotFedDisb_P_32', 'Header', 0)
-
-    # TotConts_P_33
-    data['TotConts_P_33'] = ck_curr_val(data['TotConts_P_33'], image, 'TotConts_P_33', 'Header', 0)
-
-    # TotContRefunds_P_34
-    data['TotContRefunds_P_34'] = ck_curr_val(data['TotContRefunds_P_34'], image, 'TotContRefunds_P_34', 'Header', 0)
-
-    # NetConts_P_35
-    data['NetConts_P_35'] = ck_curr_val(data['NetConts_P_35'], image, 'NetConts_P_35', 'Header', 0)
-
-    # TotFedOpExps_P_36
-    data['TotFedOpExps_P_36'] = ck_curr_val(data['TotFedOpExps_P_36'], image, 'TotFedOpExps_P_36', 'Header', 0)
-
-    # TotOffsetsOpExp_P_37
-    data['TotOffsetsOpExp_P_37'] = ck_curr_val(data['TotOffsetsOpExp_P_37'], image, 'TotOffsetsOpExp_P_37', 'Header', 0)
-
-    # NetOpExps_P_38
-    data['NetOpExps_P_38'] = ck_curr_val(data['NetOpExps_P_38'], image, 'NetOpExps_P_38', 'Header', 0)
-
-    # CashBegin_T_6a
-    data['CashBegin_T_6a'] = ck_curr_val(data['CashBegin_T_6a'], image, 'CashBegin_T_6a', 'Header', 0)
-
-    # CashBeginYr
-    data['CashBeginYr'] = ck_curr_val(data['CashBeginYr'], image, 'CashBeginYr', 'Header', 0)
-
-    # TotRcpts_T_6c
-    data['TotRcpts_T_6c'] = ck_curr_val(data['TotRcpts_T_6c'], image, 'TotRcpts_T_6c', 'Header', 0)
-
-    # Subtotal_T_6d
-    data['Subtotal_T_6d'] = ck_curr_val(data['Subtotal_T_6d'], image, 'Subtotal_T_6d', 'Header', 0)
-
-    # TotDisb_T_7
-    data['TotDisb_T_7'] = ck_curr_val(data['TotDisb_T_7'], image, 'TotDisb_T_7', 'Header', 0)
-
-    # CashClose_T_8
-    data['CashClose_T_8'] = ck_curr_val(data['CashClose_T_8'], image, 'CashClose_T_8', 'Header', 0)
-
-    # IndContsItem_T_11a1
-    data['IndContsItem_T_11a1'] = ck_curr_val(data['IndContsItem_T_11a1'], image, 'IndContsItem_T_11a1', 'Header', 0)
-
-    # IndContsUnitem_T_11a2
-    data['IndContsUnitem_T_11a2'] = ck_curr_val(data['IndContsUnitem_T_11a2'], image, 'IndContsUnitem_T_11a2', 'Header',
-                                                0)
-
-    # IndContsTot_T_11a3
-    data['IndContsTot_T_11a3'] = ck_curr_val(data['IndContsTot_T_11a3'], image, 'IndContsTot_T_11a3', 'Header', 0)
-
-    # PolPtyCommConts_T_11b
-    data['PolPtyCommConts_T_11b'] = ck_curr_val(data['PolPtyCommConts_T_11b'], image, 'PolPtyCommConts_T_11b', 'Header',
-                                                0)
-
-    # OthPolCommConts_T_11c
-    data['OthPolCommConts_T_11c'] = ck_curr_val(data['OthPolCommConts_T_11c'], image, 'OthPolCommConts_T_11c', 'Header',
-                                                0)
-
-    # TotConts_T_11d
-    data['TotConts_T_11d'] = ck_curr_val(data['TotConts_T_11d'], image, 'TotConts_T_11d', 'Header', 0)
-
-    # TranFmPtyComms_T_12
-    data['TranFmPtyComms_T_12'] = ck_curr_val(data['TranFmPtyComms_T_12'], image, 'TranFmPtyComms_T_12', 'Header', 0)
-
-    # AllLoansRcvd_T_13
-    data['AllLoansRcvd_T_13'] = ck_curr_val(data['AllLoansRcvd_T_13'], image, 'AllLoansRcvd_T_13', 'Header', 0)
-
-    # LoanPymtsRcvd_T_14
-    data['LoanPymtsRcvd_T_14'] = ck_curr_val(data['LoanPymtsRcvd_T_14'], image, 'LoanPymtsRcvd_T_14', 'Header', 0)
-
-    # RefundOffsets_T_15
-    data['RefundOffsets_T_15'] = ck_curr_val(data['RefundOffsets_T_15'], image, 'RefundOffsets_T_15', 'Header', 0)
-
-    # RefundsFedConts_T_16
-    data['RefundsFedConts_T_16'] = ck_curr_val(data['RefundsFedConts_T_16'], image, 'RefundsFedConts_T_16', 'Header', 0)
-
-    # OthFedRcptsDvds_T_17
-    data['OthFedRcptsDvds_T_17'] = ck_curr_val(data['OthFedRcptsDvds_T_17'], image, 'OthFedRcptsDvds_T_17', 'Header', 0)
-
-    # TranFmNonFedAcctH3_T_18a
-    data['TranFmNonFedAcctH3_T_18a'] = ck_curr_val(data['TranFmNonFedAcctH3_T_18a'], image, 'TranFmNonFedAcctH3_T_18a',
-                                                   'Header', 0)
-
-    # TranFmNonFedAcctH5_T_18b
-    data['TranFmNonFedAcctH5_T_18b'] = ck_curr_val(data['TranFmNonFedAcctH5_T_18b'], image, 'TranFmNonFedAcctH5_T_18b',
-                                                   'Header', 0)
-
-    # TotNonFedTrans_T_18c
-    data['TotNonFedTrans_T_18c'] = ck_curr_val(data['TotNonFedTrans_T_18c'], image, 'TotNonFedTrans_T_18c', 'Header', 0)
-
-    # TotRcpts_T_19
-    data['TotRcpts_T_19'] = ck_curr_val(data['TotRcpts_T_19'], image, 'TotRcpts_T_19', 'Header', 0)
-
-    # TotFedRcpts_T_20
-    data['TotFedRcpts_T_20'] = ck_curr_val(data['TotFedRcpts_T_20'], image, 'TotFedRcpts_T_20', 'Header', 0)
-
-    # OpExpsFedShr_T_21a1
-    data['OpExpsFedShr_T_21a1'] = ck_curr_val(data['OpExpsFedShr_T_21a1'], image, 'OpExpsFedShr_T_21a1', 'Header', 0)
-
-    # OpExpsNonFedShr_T_21a2
-    data['OpExpsNonFedShr_T_21a2'] = ck_curr_val(data['OpExpsNonFedShr_T_21a2'], image, 'OpExpsNonFedShr_T_21a2',
-                                                 'Header', 0)
-
-    # OpExpsOthFed_T_21b
-    data['OpExpsOthFed_T_21b'] = ck_curr_val(data['OpExpsOthFed_T_21b'], image, 'OpExpsOthFed_T_21b', 'Header', 0)
-
-    # TotOpExps_T_21c
-    data['TotOpExps_T_21c'] = ck_curr_val(data['TotOpExps_T_21c'], image, 'TotOpExps_T_21c', 'Header', 0)
-
-    # TranToPtyComms_T_22
-    data['TranToPtyComms_T_22'] = ck_curr_val(data['TranToPtyComms_T_22'], image, 'TranToPtyComms_T_22', 'Header', 0)
-
-    # ContsToFedCandsComms_T_23
-    data['ContsToFedCandsComms_T_23'] = ck_curr_val(data['ContsToFedCandsComms_T_23'], image,
-                                                    'ContsToFedCandsComms_T_23', 'Header', 0)
-
-    # IndtExps_T_24
-    data['IndtExps_T_24'] = ck_curr_val(data['IndtExps_T_24'], image, 'IndtExps_T_24', 'Header', 0)
-
-    # CoordExpsByPtyComms_T_25
-    data['CoordExpsByPtyComms_T_25'] = ck_curr_val(data['CoordExpsByPtyComms_T_25'], image, 'CoordExpsByPtyComms_T_25',
-                                                   'Header', 0)
-
-    # LoansRepaid_T_26
-    data['LoansRepaid_T_26'] = ck_curr_val(data['LoansRepaid_T_26'], image, 'LoansRepaid_T_26', 'Header', 0)
-
-    # LoansMade_T_27
-    data['LoansMade_T_27'] = ck_curr_val(data['LoansMade_T_27'], image, 'LoansMade_T_27', 'Header', 0)
-
-    # RefundsInd_T_28a
-    data['RefundsInd_T_28a'] = ck_curr_val(data['RefundsInd_T_28a'], image, 'RefundsInd_T_28a', 'Header', 0)
-
-    # RefundsPolPtyComms_T_28b
-    data['RefundsPolPtyComms_T_28b'] = ck_curr_val(data['RefundsPolPtyComms_T_28b'], image, 'RefundsPolPtyComms_T_28b',
-                                                   'Header', 0)
-
-    # RefundsOthPolComms_T_28c
-    data['RefundsOthPolComms_T_28c'] = ck_curr_val(data['RefundsOthPolComms_T_28c'], image, 'RefundsOthPolComms_T_28c',
-                                                   'Header', 0)
-
-    # TotContRefunds_T_28d
-    data['TotContRefunds_T_28d'] = ck_curr_val(data['TotContRefunds_T_28d'], image, 'TotContRefunds_T_28d', 'Header', 0)
-
-    # OthDisb_T_29
-    data['OthDisb_T_29'] = ck_curr_val(data['OthDisb_T_29'], image, 'OthDisb_T_29', 'Header', 0)
-
-    # ShrdElecActivityFedShr_T_30a1
-    data['ShrdElecActivityFedShr_T_30a1'] = ck_curr_val(data['ShrdElecActivityFedShr_T_30a1'], image,
-                                                        'ShrdElecActivityFedShr_T_30a1', 'Header', 0)
-
-    # ShrdElecActivityNonFedShr_T_30a2
-    data['ShrdElecActivityNonFedShr_T_30a2'] = ck_curr_val(data['ShrdElecActivityNonFedShr_T_30a2'], image,
-                                                           'ShrdElecActivityNonFedShr_T_30a2', 'Header', 0)
-
-    # NonAllocFedElecActivity_T_30b
-    data['NonAllocFedElecActivity_T_30b'] = ck_curr_val(data['NonAllocFedElecActivity_T_30b'], image,
-                                                        'NonAllocFedElecActivity_T_30b', 'Header', 0)
-
-    # TotFedElecActivity_T_30c
-    data['TotFedElecActivity_T_30c'] = ck_curr_val(data['TotFedElecActivity_T_30c'], image, 'TotFedElecActivity_T_30c',
-                                                   'Header', 0)
-
-    # TotDisb_T_31
-    data['TotDisb_T_31'] = ck_curr_val(data['TotDisb_T_31'], image, 'TotDisb_T_31', 'Header', 0)
-
-    # TotFedDisb_T_32
-    data['TotFedDisb_T_32'] = ck_curr_val(data['TotFedDisb_T_32'], image, 'TotFedDisb_T_32', 'Header', 0)
-
-    # TotConts_T_33
-    data['TotConts_T_33'] = ck_curr_val(data['TotConts_T_33'], image, 'TotConts_T_33', 'Header', 0)
-
-    # TotContRefunds_T_34
-    data['TotContRefunds_T_34'] = ck_curr_val(data['TotContRefunds_T_34'], image, 'TotContRefunds_T_34', 'Header', 0)
-
-    # NetConts_T_35
-    data['NetConts_T_35'] = ck_curr_val(data['NetConts_T_35'], image, 'NetConts_T_35', 'Header', 0)
-
-    # TotFedOpExps_T_36
-    data['TotFedOpExps_T_36'] = ck_curr_val(data['TotFedOpExps_T_36'], image, 'TotFedOpExps_T_36', 'Header', 0)
-
-    # TotOffsetsOpExp_T_37
-    data['TotOffsetsOpExp_T_37'] = ck_curr_val(data['TotOffsetsOpExp_T_37'], image, 'TotOffsetsOpExp_T_37', 'Header', 0)
-
-    # NetOpExps_T_38
-    data['NetOpExps_T_38'] = ck_curr_val(data['NetOpExps_T_38'], image, 'NetOpExps_T_38', 'Header', 0)
-
-    return data
-
-
-def check_rpt_hdrs_f1(image, data, namedelim='', dateformat='CCYYMMDD'):
-    # FormTp
-    data['FormTp'] = clean_sql_text(data['FormTp'], 'nullstring', "'")
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'], 'nullstring', "'")
-
-    # flgChgCommNm
-    data['flgChgCommNm'] = convert_to_bit(clean_sql_text(data['flgChgCommNm']))
-
-    # CommNm
-    data['CommNm'] = clean_sql_text(data['CommNm'], 'nullstring', "'")
-
-    # flgAddrChg
-    data['flgAddrChg'] = convert_to_bit(clean_sql_text(data['flgAddrChg']))
-
-    # Addr1
-    data['Addr1'] = clean_sql_text(data['Addr1'], 'nullstring', "'")
-
-    # Addr2
-    data['Addr2'] = clean_sql_text(data['Addr2'], '', "'")
-
-    # City
-    data['City'] = clean_sql_text(data['City'], 'nullstring', "'")
-
-    # StAbbr
-    data['StAbbr'] = clean_sql_text(data['StAbbr'], 'nullstring', "'")
-
-    # Zip
-    data['Zip'] = clean_sql_text(data['Zip'], 'nullstring', "'")
-
-    # flgChgCommEmail
-    data['flgChgCommEmail'] = convert_to_bit(clean_sql_text(data['flgChgCommEmail']))
-
-    # CommEmail
-    data['CommEmail'] = clean_sql_text(data['CommEmail'], '', "'")
-
-    # flgChgCommUrl
-    data['flgChgCommUrl'] = convert_to_bit(clean_sql_text(data['flgChgCommUrl']))
-
-    # CommUrl
-    data['CommUrl'] = clean_sql_text(data['CommUrl'], 'nullstring', "'")
-
-    # SubmDt
-    data['SubmDt'] = "'" + convert_to_date(data['SubmDt'], dateformat, image, 'SubmDt', 'Header', 0, 'F1', '') + "'"
-    if data['SubmDt'] == "''":
-        data['SubmDt'] = 'NULL'
-
-    # SignFullName
-    if data['SignFullName'] != '':
-        if data['SignLName'] != '' or data['SignFName'] != '' or data['SignMName'] != '' or data['SignPfx'] != '' or \
-                        data['SignSfx'] != '':
-            AddEntryToErrorLog('Signer full name (' + data[
-                'SignFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            treas = parse_full_name(data['SignFullName'], namedelim)
-            data['SignLName'] = treas[0]
-            data['SignFName'] = treas[1]
-            data['SignMName'] = treas[2]
-            data['SignPfx'] = treas[3]
-            data['SignSfx'] = treas[4]
-        else:
-            data['SignLName'] = data['SignFullName']
-
-    # SignLName
-    data['SignLName'] = clean_sql_text(data['SignLName'], 'nullstring', "'")
-
-    # SignFName
-    data['SignFName'] = clean_sql_text(data['SignFName'], '', "'")
-
-    # SignMName
-    data['SignMName'] = clean_sql_text(data['SignMName'], '', "'")
-
-    # SignPfx
-    data['SignPfx'] = clean_sql_text(data['SignPfx'], '', "'")
-
-    # SignSfx
-    data['SignSfx'] = clean_sql_text(data['SignSfx'], '', "'")
-
-    # SignDt
-    data['SignDt'] = "'" + convert_to_date(data['SignDt'], dateformat, image, 'SignDt', 'Header', 0, 'F1', '') + "'"
-    if data['SignDt'] == "''":
-        data['SignDt'] = 'NULL'
-
-    # CommTp
-    data['CommTp'] = clean_sql_text(data['CommTp'], 'nullstring', "'")
-
-    # CandID
-    data['CandID'] = clean_sql_text(data['CandID'], 'nullstring', "'")
-
-    # CandFullName
-    if data['CandFullName'] != '':
-        if data['CandLName'] != '' or data['CandFName'] != '' or data['CandMName'] != '' or data['CandPfx'] != '' or \
-                        data['CandSfx'] != '':
-            AddEntryToErrorLog('Candidate full name (' + data[
-                'CandFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            treas = parse_full_name(data['CandFullName'], namedelim)
-            data['CandLName'] = treas[0]
-            data['CandFName'] = treas[1]
-            data['CandMName'] = treas[2]
-            data['CandPfx'] = treas[3]
-            data['CandSfx'] = treas[4]
-        else:
-            data['CandLName'] = data['CandFullName']
-
-    # CandLName
-    data['CandLName'] = clean_sql_text(data['CandLName'], '', "'")
-
-    # CandFName
-    data['CandFName'] = clean_sql_text(data['CandFName'], '', "'")
-
-    # CandMName
-    data['CandMName'] = clean_sql_text(data['CandMName'], '', "'")
-
-    # CandPfx
-    data['CandPfx'] = clean_sql_text(data['CandPfx'], '', "'")
-
-    # CandSfx
-    data['CandSfx'] = clean_sql_text(data['CandSfx'], '', "'")
-
-    # CandOff
-    data['CandOff'] = clean_sql_text(data['CandOff'], 'nullstring', "'")
-
-    # CandStAbbr
-    data['CandStAbbr'] = clean_sql_text(data['CandStAbbr'], 'nullstring', "'")
-
-    # CandDist
-    data['CandDist'] = convert_to_tinyint(data['CandDist'], image, 'CandDist', 'N/A', 0, 'F1', 'N/A')
-
-    # PtyCd
-    data['PtyCd'] = clean_sql_text(data['PtyCd'], 'nullstring', "'")
-
-    # PtyTp
-    data['PtyTp'] = clean_sql_text(data['PtyTp'], 'nullstring', "'")
-
-    # PACTp
-    data['PACTp'] = clean_sql_text(data['PACTp'], 'nullstring', "'")
-
-    # flgLobRegPAC_ConnOrg_5e
-    data['flgLobRegPAC_ConnOrg_5e'] = convert_to_bit(clean_sql_text(data['flgLobRegPAC_ConnOrg_5e']))
-
-    # flgLobRegPAC_MultCands_5f
-    data['flgLobRegPAC_MultCands_5f'] = convert_to_bit(clean_sql_text(data['flgLobRegPAC_MultCands_5f']))
-
-    # flgLdspPAC_5f
-    data['flgLdspPAC_5f'] = convert_to_bit(clean_sql_text(data['flgLdspPAC_5f']))
-
-    # AffCommID
-    data['AffCommID'] = clean_sql_text(data['AffCommID'], 'nullstring', "'")
-
-    # AffCommNm
-    data['AffCommNm'] = clean_sql_text(data['AffCommNm'], '', "'")
-
-    # AffCandID
-    data['AffCandID'] = clean_sql_text(data['AffCandID'], 'nullstring', "'")
-
-    # AffCandLName
-    data['AffCandLName'] = clean_sql_text(data['AffCandLName'], '', "'")
-
-    # AffCandFName
-    data['AffCandFName'] = clean_sql_text(data['AffCandFName'], '', "'")
-
-    # AffCandMName
-    data['AffCandMName'] = clean_sql_text(data['AffCandMName'], '', "'")
-
-    # AffCandPfx
-    data['AffCandPfx'] = clean_sql_text(data['AffCandPfx'], '', "'")
-
-    # AffCandSfx
-    data['AffCandSfx'] = clean_sql_text(data['AffCandSfx'], '', "'")
-
-    # AffAddr1
-    data['AffAddr1'] = clean_sql_text(data['AffAddr1'], '', "'")
-
-    # AffAddr2
-    data['AffAddr2'] = clean_sql_text(data['AffAddr2'], '', "'")
-
-    # AffCity
-    data['AffCity'] = clean_sql_text(data['AffCity'], '', "'")
-
-    # AffStAbbr
-    data['AffStAbbr'] = clean_sql_text(data['AffStAbbr'], 'nullstring', "'")
-
-    # AffZip
-    data['AffZip'] = clean_sql_text(data['AffZip'], '', "'")
-
-    # AffRelCd
-    data['AffRelCd'] = clean_sql_text(data['AffRelCd'], 'nullstring', "'").upper()
-
-    # CustFullName
-    if data['CustFullName'] != '':
-        if data['CustLName'] != '' or data['CustFName'] != '' or data['CustMName'] != '' or data['CustPfx'] != '' or \
-                        data['CustSfx'] != '':
-            AddEntryToErrorLog('Custodian full name (' + data[
-                'CustFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            treas = parse_full_name(data['CustFullName'], namedelim)
-            data['CustLName'] = treas[0]
-            data['CustFName'] = treas[1]
-            data['CustMName'] = treas[2]
-            data['CustPfx'] = treas[3]
-            data['CustSfx'] = treas[4]
-        else:
-            data['CustLName'] = data['CustFullName']
-
-    # CustLName
-    data['CustLName'] = clean_sql_text(data['CustLName'], '', "'")
-
-    # CustFName
-    data['CustFName'] = clean_sql_text(data['CustFName'], '', "'")
-
-    # CustMName
-    data['CustMName'] = clean_sql_text(data['CustMName'], '', "'")
-
-    # CustPfx
-    data['CustPfx'] = clean_sql_text(data['CustPfx'], '', "'")
-
-    # CustSfx
-    data['CustSfx'] = clean_sql_text(data['CustSfx'], '', "'")
-
-    # CustAddr1
-    data['CustAddr1'] = clean_sql_text(data['CustAddr1'], '', "'")
-
-    # CustAddr2
-    data['CustAddr2'] = clean_sql_text(data['CustAddr2'], '', "'")
-
-    # CustCity
-    data['CustCity'] = clean_sql_text(data['CustCity'], '', "'")
-
-    # CustStAbbr
-    data['CustStAbbr'] = clean_sql_text(data['CustStAbbr'], 'nullstring', "'")
-
-    # CustZip
-    data['CustZip'] = clean_sql_text(data['CustZip'], '', "'")
-
-    # CustTitle
-    data['CustTitle'] = clean_sql_text(data['CustTitle'], '', "'")
-
-    # CustPhone
-    data['CustPhone'] = clean_sql_text(data['CustPhone'], '', "'")
-
-    # TrsFullName
-    if data['TrsFullName'] != '':
-        if data['TrsLName'] != '' or data['TrsFName'] != '' or data['TrsMName'] != '' or data['TrsPfx'] != '' or data[
-            'TrsSfx'] != '':
-            AddEntryToErrorLog('Treasurer full name (' + data[
-                'TrsFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            treas = parse_full_name(data['TrsFullName'], namedelim)
-            data['TrsLName'] = treas[0]
-            data['TrsFName'] = treas[1]
-            data['TrsMName'] = treas[2]
-            data['TrsPfx'] = treas[3]
-            data['TrsSfx'] = treas[4]
-        else:
-            data['TrsLName'] = data['TrsFullName']
-
-    # TrsLName
-    data['TrsLName'] = clean_sql_text(data['TrsLName'], '', "'")
-
-    # TrsFName
-    data['TrsFName'] = clean_sql_text(data['TrsFName'], '', "'")
-
-    # TrsMName
-    data['TrsMName'] = clean_sql_text(data['TrsMName'], '', "'")
-
-    # TrsPfx
-    data['TrsPfx'] = clean_sql_text(data['TrsPfx'], '', "'")
-
-    # TrsSfx
-    data['TrsSfx'] = clean_sql_text(data['TrsSfx'], '', "'")
-
-    # TrsAddr1
-    data['TrsAddr1'] = clean_sql_text(data['TrsAddr1'], '', "'")
-
-    # TrsAddr2
-    data['TrsAddr2'] = clean_sql_text(data['TrsAddr2'], '', "'")
-
-    # TrsCity
-    data['TrsCity'] = clean_sql_text(data['TrsCity'], '', "'")
-
-    # TrsStAbbr
-    data['TrsStAbbr'] = clean_sql_text(data['TrsStAbbr'], 'nullstring', "'")
-
-    # TrsZip
-    data['TrsZip'] = clean_sql_text(data['TrsZip'], '', "'")
-
-    # TrsTitle
-    data['TrsTitle'] = clean_sql_text(data['TrsTitle'], '', "'")
-
-    # TrsPhone
-    data['TrsPhone'] = clean_sql_text(data['TrsPhone'], '', "'")
-
-    # AgtFullName
-    if data['AgtFullName'] != '':
-        if data['AgtLName'] != '' or data['AgtFName'] != '' or data['AgtMName'] != '' or data['AgtPfx'] != '' or data[
-            'AgtSfx'] != '':
-            AddEntryToErrorLog('Agent full name (' + data[
-                'AgtFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            treas = parse_full_name(data['AgtFullName'], namedelim)
-            data['AgtLName'] = treas[0]
-            data['AgtFName'] = treas[1]
-            data['AgtMName'] = treas[2]
-            data['AgtPfx'] = treas[3]
-            data['AgtSfx'] = treas[4]
-        else:
-            data['AgtLName'] = data['AgtFullName']
-
-    # AgtLName
-    data['AgtLName'] = clean_sql_text(data['AgtLName'], '', "'")
-
-    # AgtFName
-    data['AgtFName'] = clean_sql_text(data['AgtFName'], '', "'")
-
-    # AgtMName
-    data['AgtMName'] = clean_sql_text(data['AgtMName'], '', "'")
-
-    # AgtPfx
-    data['AgtPfx'] = clean_sql_text(data['AgtPfx'], '', "'")
-
-    # AgtSfx
-    data['AgtSfx'] = clean_sql_text(data['AgtSfx'], '', "'")
-
-    # AgtAddr1
-    data['AgtAddr1'] = clean_sql_text(data['AgtAddr1'], '', "'")
-
-    # AgtAddr2
-    data['AgtAddr2'] = clean_sql_text(data['AgtAddr2'], '', "'")
-
-    # AgtCity
-    data['AgtCity'] = clean_sql_text(data['AgtCity'], '', "'")
-
-    # AgtStAbbr
-    data['AgtStAbbr'] = clean_sql_text(data['AgtStAbbr'], 'nullstring', "'")
-
-    # AgtZip
-    data['AgtZip'] = clean_sql_text(data['AgtZip'], '', "'")
-
-    # AgtTitle
-    data['AgtTitle'] = clean_sql_text(data['AgtTitle'], '', "'")
-
-    # AgtPhone
-    data['AgtPhone'] = clean_sql_text(data['AgtPhone'], '', "'")
-
-    # Bank1Nm
-    data['Bank1Nm'] = clean_sql_text(data['Bank1Nm'], '', "'")
-
-    # Bank1Addr1
-    data['Bank1Addr1'] = clean_sql_text(data['Bank1Addr1'], '', "'")
-
-    # Bank1Addr2
-    data['Bank1Addr2'] = clean_sql_text(data['Bank1Addr2'], '', "'")
-
-    # Bank1City
-    data['Bank1City'] = clean_sql_text(data['Bank1City'], '', "'")
-
-    # Bank1StAbbr
-    data['Bank1StAbbr'] = clean_sql_text(data['Bank1StAbbr'], 'nullstring', "'")
-
-    # Bank1Zip
-    data['Bank1Zip'] = clean_sql_text(data['Bank1Zip'], '', "'")
-
-    # Bank2Nm
-    data['Bank2Nm'] = clean_sql_text(data['Bank2Nm'], '', "'")
-
-    # Bank2Addr1
-    data['Bank2Addr1'] = clean_sql_text(data['Bank2Addr1'], '', "'")
-
-    # Bank2Addr2
-    data['Bank2Addr2'] = clean_sql_text(data['Bank2Addr2'], '', "'")
-
-    # Bank2City
-    data['Bank2City'] = clean_sql_text(data['Bank2City'], '', "'")
-
-    # Bank2StAbbr
-    data['Bank2StAbbr'] = clean_sql_text(data['Bank2StAbbr'], 'nullstring', "'")
-
-    # Bank2Zip
-    data['Bank2Zip'] = clean_sql_text(data['Bank2Zip'], '', "'")
-
-    return data
-
-
-def check_row_data_f1s(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # FormTp
-    data['FormTp'] = clean_sql_text(data['FormTp'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # JtFndCommNm
-    data['JtFndCommNm'] = clean_sql_text(data['JtFndCommNm'])
-
-    # JtFundCommID
-    data['JtFundCommID'] = clean_sql_text(data['JtFundCommID'])
-
-    # AffCommID
-    data['AffCommID'] = clean_sql_text(data['AffCommID'])
-
-    # AffCommNm
-    data['AffCommNm'] = clean_sql_text(data['AffCommNm'])
-
-    # AffCandID
-    data['AffCandID'] = clean_sql_text(data['AffCandID'])
-
-    # AffLName
-    data['AffLName'] = clean_sql_text(data['AffLName'])
-
-    # AffFName
-    data['AffFName'] = clean_sql_text(data['AffFName'])
-
-    # AffMName
-    data['AffMName'] = clean_sql_text(data['AffMName'])
-
-    # AffPfx
-    data['AffPfx'] = clean_sql_text(data['AffPfx'])
-
-    # AffSfx
-    data['AffSfx'] = clean_sql_text(data['AffSfx'])
-
-    # AffAddr1
-    data['AffAddr1'] = clean_sql_text(data['AffAddr1'])
-
-    # AffAddr2
-    data['AffAddr2'] = clean_sql_text(data['AffAddr2'])
-
-    # AffCity
-    data['AffCity'] = clean_sql_text(data['AffCity'])
-
-    # AffStAbbr
-    data['AffStAbbr'] = clean_sql_text(data['AffStAbbr'])
-
-    # AffZip
-    data['AffZip'] = clean_sql_text(data['AffZip'])
-
-    # AffRelCd
-    data['AffRelCd'] = clean_sql_text(data['AffRelCd'])
-
-    # AgtLName
-    data['AgtLName'] = clean_sql_text(data['AgtLName'])
-
-    # AgtFName
-    data['AgtFName'] = clean_sql_text(data['AgtFName'])
-
-    # AgtMName
-    data['AgtMName'] = clean_sql_text(data['AgtMName'])
-
-    # AgtPfx
-    data['AgtPfx'] = clean_sql_text(data['AgtPfx'])
-
-    # AgtSfx
-    data['AgtSfx'] = clean_sql_text(data['AgtSfx'])
-
-    # AgtAddr1
-    data['AgtAddr1'] = clean_sql_text(data['AgtAddr1'])
-
-    # AgtAddr2
-    data['AgtAddr2'] = clean_sql_text(data['AgtAddr2'])
-
-    # AgtCity
-    data['AgtCity'] = clean_sql_text(data['AgtCity'])
-
-    # AgtStAbbr
-    data['AgtStAbbr'] = clean_sql_text(data['AgtStAbbr'])
-
-    # AgtZip
-    data['AgtZip'] = clean_sql_text(data['AgtZip'])
-
-    # AgtTitle
-    data['AgtTitle'] = clean_sql_text(data['AgtTitle'])
-
-    # AgtPhone
-    data['AgtPhone'] = clean_sql_text(data['AgtPhone'])
-
-    # BankNm
-    data['BankNm'] = clean_sql_text(data['BankNm'])
-
-    # BankAddr1
-    data['BankAddr1'] = clean_sql_text(data['BankAddr1'])
-
-    # BankAddr2
-    data['BankAddr2'] = clean_sql_text(data['BankAddr2'])
-
-    # BankCity
-    data['BankCity'] = clean_sql_text(data['BankCity'])
-
-    # BankStAbbr
-    data['BankStAbbr'] = clean_sql_text(data['BankStAbbr'])
-
-    # BankZip
-    data['BankZip'] = clean_sql_text(data['BankZip'])
-
-    return data
-
-
-def check_row_data_sch_a(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-    if len(data['TransID']) > 20:
-        print(("TransID field too long.", image, rownbr, data))
-        sys.exit(("TransID field too long.", image, rownbr, data))
-
-    # BkRefTransID
-    data['BkRefTransID'] = clean_sql_text(data['BkRefTransID'])
-
-    # BkRefSchdNm
-    data['BkRefSchdNm'] = clean_sql_text(data['BkRefSchdNm'])
-
-    # EntTp
-    data['EntTp'] = clean_sql_text(data['EntTp'])
-
-    # ContOrgNm
-    data['ContOrgNm'] = clean_sql_text(data['ContOrgNm'])
-
-    # ContFullName
-    if data['ContFullName'] != '':
-        if data['ContLName'] != '' or data['ContFName'] != '' or data['ContMName'] != '' or data['ContPfx'] != '' or \
-                        data['ContSfx'] != '':
-            AddEntryToErrorLog('Contributor full name (' + data[
-                'ContFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            name = parse_full_name(data['ContFullName'], namedelim)
-            data['ContLName'] = name[0]
-            data['ContFName'] = name[1]
-            data['ContMName'] = name[2]
-            data['ContPfx'] = name[3]
-            data['ContSfx'] = name[4]
-        else:
-            data['ContLName'] = data['ContFullName']
-
-    # ContLName
-    data['ContLName'] = clean_sql_text(data['ContLName'])
-
-    # ContFName
-    data['ContFName'] = clean_sql_text(data['ContFName'])
-
-    # ContMName
-    data['ContMName'] = clean_sql_text(data['ContMName'])
-
-    # ContPfx
-    data['ContPfx'] = clean_sql_text(data['ContPfx'])
-
-    # ContSfx
-    data['ContSfx'] = clean_sql_text(data['ContSfx'])
-
-    # Addr1
-    data['Addr1'] = clean_sql_text(data['Addr1'])
-
-    # Addr2
-    data['Addr2'] = clean_sql_text(data['Addr2'])
-
-    # City
-    data['City'] = clean_sql_text(data['City'])
-
-    # StAbbr
-    data['StAbbr'] = clean_sql_text(data['StAbbr'])
-    if len(data['StAbbr']) > 2:
-        print(("StAbbr field too long.", image, rownbr, data))
-        sys.exit(("StAbbr field too long.", image, rownbr, data))
-
-    # Zip
-    data['Zip'] = clean_sql_text(data['Zip'])
-
-    # ElecCd
-    data['ElecCd'] = clean_sql_text(data['ElecCd'])
-
-    # ElecDesc
-    data['ElecDesc'] = clean_sql_text(data['ElecDesc'])
-
-    # ContDt
-    data['ContDt'] = convert_to_date(data['ContDt'], dateformat, image, 'ContDt', data['LineNbr'], rownbr, 'SA',
-                                     data['TransID'])
-
-    # ContAmt
-    data['ContAmt'] = ck_curr_val(data['ContAmt'], image, 'ContAmt', data['LineNbr'], rownbr)
-
-    # ContAgg
-    data['ContAgg'] = ck_curr_val(data['ContAgg'], image, 'ContAgg', data['LineNbr'], rownbr)
-
-    # ContPurpCd
-    data['ContPurpCd'] = clean_sql_text(data['ContPurpCd'])
-
-    # ContPurpDesc
-    data['ContPurpDesc'] = clean_sql_text(data['ContPurpDesc'])
-
-    # Emp
-    data['Emp'] = clean_sql_text(data['Emp'])
-    if len(data['Emp']) > 38:
-        print(("Emp field too long.", image, rownbr, data))
-        sys.exit(("Emp field too long.", image, rownbr, data))
-
-    # Occ
-    data['Occ'] = clean_sql_text(data['Occ'])
-    if len(data['Occ']) > 38:
-        print(("Occ field too long.", image, rownbr, data))
-        sys.exit(("Occ field too long.", image, rownbr, data))
-
-    # DonorCommID
-    data['DonorCommID'] = clean_sql_text(data['DonorCommID'])
-    if len(data['DonorCommID']) > 11:
-        print(("DonorCommID field too long.", image, rownbr, data))
-        sys.exit(("DonorCommID field too long.", image, rownbr, data))
-
-    # DonorCommNm
-    data['DonorCommNm'] = clean_sql_text(data['DonorCommNm'])
-
-    # DonorCandID
-    data['DonorCandID'] = clean_sql_text(data['DonorCandID'])
-
-    # DonorCandFullName
-    if data['DonorCandFullName'] != '':
-        if data['DonorCandLName'] != '' or data['DonorCandFName'] != '' or data['DonorCandMName'] != '' or data[
-            'DonorCandPfx'] != '' or data['DonorCandSfx'] != '':
-            AddEntryToErrorLog('Donor candidater full name (' + data[
-                'DonorCandFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            name = parse_full_name(data['DonorCandFullName'], namedelim)
-            data['DonorCandLName'] = name[0]
-            data['DonorCandFName'] = name[1]
-            data['DonorCandMName'] = name[2]
-            data['DonorCandPfx'] = name[3]
-            data['DonorCandSfx'] = name[4]
-        else:
-            data['DonorCandLName'] = data['DonorCandFullName']
-
-    # DonorCandLName
-    data['DonorCandLName'] = clean_sql_text(data['DonorCandLName'])
-
-    # DonorCandFName
-    data['DonorCandFName'] = clean_sql_text(data['DonorCandFName'])
-
-    # DonorCandMName
-    data['DonorCandMName'] = clean_sql_text(data['DonorCandMName'])
-
-    # DonorCandPfx
-    data['DonorCandPfx'] = clean_sql_text(data['DonorCandPfx'])
-
-    # DonorCandSfx
-    data['DonorCandSfx'] = clean_sql_text(data['DonorCandSfx'])
-
-    # DonorCandOfc
-    data['DonorCandOfc'] = clean_sql_text(data['DonorCandOfc'])
-    if len(data['DonorCandOfc']) > 3:
-        print(("DonorCandOfc field too long.", image, rownbr, data))
-        sys.exit(("DonorCandOfc field too long.", image, rownbr, data))
-
-    # DonorCandSt
-    data['DonorCandSt'] = clean_sql_text(data['DonorCandSt'])
-
-    # DonorCandDist
-    data['DonorCandDist'] = convert_to_tinyint(data['DonorCandDist'], image, 'DonorCandDist', data['LineNbr'], rownbr,
-                                               'SA', data['TransID'])
-
-    # ConduitNm
-    data['ConduitNm'] = clean_sql_text(data['ConduitNm'])
-
-    # ConduitAddr1
-    data['ConduitAddr1'] = clean_sql_text(data['ConduitAddr1'])
-
-    # ConduitAddr2
-    data['ConduitAddr2'] = clean_sql_text(data['ConduitAddr2'])
-
-    # ConduitCity
-    data['ConduitCity'] = clean_sql_text(data['ConduitCity'])
-
-    # ConduitState
-    data['ConduitState'] = clean_sql_text(data['ConduitState'])
-
-    # ConduitZip
-    data['ConduitZip'] = clean_sql_text(data['ConduitZip'])
-
-    # MemoCd
-    data['MemoCd'] = convert_to_bit(clean_sql_text(data['MemoCd']))
-
-    # MemoTxt
-    data['MemoTxt'] = clean_sql_text(data['MemoTxt'])
-
-    # SIorSLRef
-    data['SIorSLRef'] = clean_sql_text(data['SIorSLRef'])
-
-    return data
-
-
-def check_row_data_sch_b(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # BkRefTransID
-    data['BkRefTransID'] = clean_sql_text(data['BkRefTransID'])
-
-    # BkRefSchdNm
-    data['BkRefSchdNm'] = clean_sql_text(data['BkRefSchdNm'])
-
-    # EntTp
-    data['EntTp'] = clean_sql_text(data['EntTp'])
-
-    # PayeeOrgNm
-    data['PayeeOrgNm'] = clean_sql_text(data['PayeeOrgNm'])
-
-    # PayeeFullName
-    if data['PayeeFullName'] != '':
-        if data['PayeeLName'] != '' or data['PayeeFName'] != '' or data['PayeeMName'] != '' or data['PayeePfx'] != '' or \
-                        data['PayeeSfx'] != '':
-            AddEntryToErrorLog('Payee full name (' + data[
-                'PayeeFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            name = parse_full_name(data['PayeeFullName'], namedelim)
-            data['PayeeLName'] = name[0]
-            data['PayeeFName'] = name[1]
-            data['PayeeMName'] = name[2]
-            data['PayeePfx'] = name[3]
-            data['PayeeSfx'] = name[4]
-        else:
-            data['PayeeLName'] = data['PayeeFullName']
-
-    # PayeeLName
-    data['PayeeLName'] = clean_sql_text(data['PayeeLName'])
-
-    # PayeeFName
-    data['PayeeFName'] = clean_sql_text(data['PayeeFName'])
-
-    # PayeeMName
-    data['PayeeMName'] = clean_sql_text(data['PayeeMName'])
-
-    # PayeePfx
-    data['PayeePfx'] = clean_sql_text(data['PayeePfx'])
-
-    # PayeeSfx
-    data['PayeeSfx'] = clean_sql_text(data['PayeeSfx'])
-
-    # PayeeAddr1
-    data['PayeeAddr1'] = clean_sql_text(data['PayeeAddr1'])
-
-    # PayeeAddr2
-    data['PayeeAddr2'] = clean_sql_text(data['PayeeAddr2'])
-
-    # PayeeCity
-    data['PayeeCity'] = clean_sql_text(data['PayeeCity'])
-
-    # PayeeState
-    data['PayeeState'] = clean_sql_text(data['PayeeState'])
-
-    # PayeeZip
-    data['PayeeZip'] = clean_sql_text(data['PayeeZip'])
-
-    # ElecCd
-    data['ElecCd'] = clean_sql_text(data['ElecCd'])
-
-    # ElecDesc
-    data['ElecDesc'] = clean_sql_text(data['ElecDesc'])
-
-    # ExpDt
-    data['ExpDt'] = convert_to_date(data['ExpDt'], dateformat, image, 'ExpDt', data['LineNbr'], rownbr, 'SB',
-                                    data['TransID'])
-
-    # ExpAmt
-    data['ExpAmt'] = ck_curr_val(data['ExpAmt'], image, 'ExpAmt', data['LineNbr'], rownbr)
-
-    # SemiAnnRefBundAmt
-    data['SemiAnnRefBundAmt'] = ck_curr_val(data['SemiAnnRefBundAmt'], image, 'SemiAnnRefBundAmt', data['LineNbr'],
-                                            rownbr)
-
-    # ExpPurpCd
-    data['ExpPurpCd'] = clean_sql_text(data['ExpPurpCd'])
-
-    # ExpPurpDesc
-    data['ExpPurpDesc'] = clean_sql_text(data['ExpPurpDesc'])
-
-    # ExpCatCd
-    data['ExpCatCd'] = clean_sql_text(data['ExpCatCd'])
-
-    # BenCommID
-    data['BenCommID'] = clean_sql_text(data['BenCommID'])
-
-    # BenCommNm
-    data['BenCommNm'] = clean_sql_text(data['BenCommNm'])
-
-    # BenCandID
-    data['BenCandID'] = clean_sql_text(data['BenCandID'])
-
-    # BenCandFullName
-    if data['BenCandFullName'] != '':
-        if data['BenCandLName'] != '' or data['BenCandFName'] != '' or data['BenCandMName'] != '' or data[
-            'BenCandPfx'] != '' or data['BenCandSfx'] != '':
-            AddEntryToErrorLog('Beneficiary candidate full name (' + data[
-                'BenCandFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            name = parse_full_name(data['BenCandFullName'], namedelim)
-            data['BenCandLName'] = name[0]
-            data['BenCandFName'] = name[1]
-            data['BenCandMName'] = name[2]
-            data['BenCandPfx'] = name[3]
-            data['BenCandSfx'] = name[4]
-        else:
-            data['BenCandLName'] = data['BenCandFullName']
-
-    # BenCandLName
-    data['BenCandLName'] = clean_sql_text(data['BenCandLName'])
-
-    # BenCandFName
-    data['BenCandFName'] = clean_sql_text(data['BenCandFName'])
-
-    # BenCandMName
-    data['BenCandMName'] = clean_sql_text(data['BenCandMName'])
-
-    # BenCandPfx
-    data['BenCandPfx'] = clean_sql_text(data['BenCandPfx'])
-
-    # BenCandSfx
-    data['BenCandSfx'] = clean_sql_text(data['BenCandSfx'])
-
-    # BenCandOfc
-    data['BenCandOfc'] = clean_sql_text(data['BenCandOfc'])
-
-    # BenCandState
-    data['BenCandState'] = clean_sql_text(data['BenCandState'])
-
-    # BenCandDist
-    # Sometimes this column just contains a second copy of the state abbreviation
-    # or NA
-    if data['BenCandDist'] == data['BenCandState']:
-        try:
-            float(data['BenCandDist'])
-        except:
-            data['BenCandDist'] = None
-    elif data['BenCandDist'] == 'NA' or data['BenCandDist'] == '**':
-        data['BenCandDist'] = None
-    data['BenCandDist'] = convert_to_tinyint(data['BenCandDist'], image, 'BenCandDist', data['LineNbr'], rownbr, 'SB',
-                                             data['TransID'])
-
-    # ConduitNm
-    data['ConduitNm'] = clean_sql_text(data['ConduitNm'])
-
-    # ConduitAddr1
-    data['ConduitAddr1'] = clean_sql_text(data['ConduitAddr1'])
-
-    # ConduitAddr2
-    data['ConduitAddr2'] = clean_sql_text(data['ConduitAddr2'])
-
-    # ConduitCity
-    data['ConduitCity'] = clean_sql_text(data['ConduitCity'])
-
-    # ConduitState
-    data['ConduitState'] = clean_sql_text(data['ConduitState'])
-
-    # ConduitZip
-    data['ConduitZip'] = clean_sql_text(data['ConduitZip'])
-
-    # MemoCd
-    data['MemoCd'] = convert_to_bit(clean_sql_text(data['MemoCd']))
-
-    # MemoTxt
-    data['MemoTxt'] = clean_sql_text(data['MemoTxt'])
-
-    # SIorSLRef
-    data['SIorSLRef'] = clean_sql_text(data['SIorSLRef'])
-
-    return data
-
-
-def check_row_data_sch_c(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # RctLnNbr
-    data['RctLnNbr'] = clean_sql_text(data['RctLnNbr'])
-
-    # EntTp
-    data['EntTp'] = clean_sql_text(data['EntTp'])
-
-    # LenderOrgName
-    data['LenderOrgName'] = clean_sql_text(data['LenderOrgName'])
-
-    # LenderLName
-    data['LenderLName'] = clean_sql_text(data['LenderLName'])
-
-    # LenderFName
-    data['LenderFName'] = clean_sql_text(data['LenderFName'])
-
-    # LenderMName
-    data['LenderMName'] = clean_sql_text(data['LenderMName'])
-
-    # LenderPfx
-    data['LenderPfx'] = clean_sql_text(data['LenderPfx'])
-
-    # LenderSfx
-    data['LenderSfx'] = clean_sql_text(data['LenderSfx'])
-
-    # LenderAddr1
-    data['LenderAddr1'] = clean_sql_text(data['LenderAddr1'])
-
-    # LenderAddr2
-    data['LenderAddr2'] = clean_sql_text(data['LenderAddr2'])
-
-    # LenderCity
-    data['LenderCity'] = clean_sql_text(data['LenderCity'])
-
-    # LenderState
-    data['LenderState'] = clean_sql_text(data['LenderState'])
-
-    # LenderZip
-    data['LenderZip'] = clean_sql_text(data['LenderZip'])
-
-    # ElecCd
-    data['ElecCd'] = clean_sql_text(data['ElecCd'])
-
-    # ElecDesc
-    data['ElecDesc'] = clean_sql_text(data['ElecDesc'])
-
-    # LoanAmt
-    data['LoanAmt'] = ck_curr_val(data['LoanAmt'], image, 'LoanAmt', data['LineNbr'], rownbr)
-
-    # PymtToDt
-    data['PymtToDt'] = ck_curr_val(data['PymtToDt'], image, 'PymtToDt', data['LineNbr'], rownbr)
-
-    # LoanBlnc
-    data['LoanBlnc'] = ck_curr_val(data['LoanBlnc'], image, 'LoanBlnc', data['LineNbr'], rownbr)
-
-    # IncurredDt
-    data['IncurredDt'] = convert_to_date(data['IncurredDt'], dateformat, image, 'IncurredDt', data['LineNbr'], rownbr,
-                                         'SC', data['TransID'])
-
-    # DueDt
-    data['DueDt'] = convert_to_date(data['DueDt'], dateformat, image, 'IncurredDt', data['LineNbr'], rownbr, 'SC',
-                                    data['TransID'])
-
-    # IntRt
-    data['IntRt'] = clean_sql_text(data['IntRt'])
-
-    # flgSecured
-    data['flgSecured'] = convert_to_bit(clean_sql_text(data['flgSecured']))
-
-    # flgPersFunds
-    data['flgPersFunds'] = convert_to_bit(clean_sql_text(data['flgPersFunds']))
-
-    # LenderCommID
-    data['LenderCommID'] = clean_sql_text(data['LenderCommID'])
-
-    # LenderCandID
-    data['LenderCandID'] = clean_sql_text(data['LenderCandID'])
-
-    # LenderCandLName
-    data['LenderCandLName'] = clean_sql_text(data['LenderCandLName'])
-
-    # LenderCandFName
-    data['LenderCandFName'] = clean_sql_text(data['LenderCandFName'])
-
-    # LenderCandMName
-    data['LenderCandMName'] = clean_sql_text(data['LenderCandMName'])
-
-    # LenderCandPfx
-    data['LenderCandPfx'] = clean_sql_text(data['LenderCandPfx'])
-
-    # LenderCandSfx
-    data['LenderCandSfx'] = clean_sql_text(data['LenderCandSfx'])
-
-    # LenderCandOfc
-    data['LenderCandOfc'] = clean_sql_text(data['LenderCandOfc'])
-
-    # LenderCandState
-    data['LenderCandState'] = clean_sql_text(data['LenderCandState'])
-
-    # LenderCandDist
-    data['LenderCandDist'] = convert_to_tinyint(data['LenderCandDist'], image, 'LenderCandDist', data['LineNbr'],
-                                                rownbr, 'SC', data['TransID'])
-
-    # MemoCd
-    data['MemoCd'] = convert_to_bit(clean_sql_text(data['MemoCd']))
-
-    # MemoTxt
-    data['MemoTxt'] = clean_sql_text(data['MemoTxt'])
-
-    return data
-
-
-def check_row_data_sch_c1(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # BkRefTransID
-    data['BkRefTransID'] = clean_sql_text(data['BkRefTransID'])
-
-    # Lender
-    data['Lender'] = clean_sql_text(data['Lender'])
-
-    # LenderAddr1
-    data['LenderAddr1'] = clean_sql_text(data['LenderAddr1'])
-
-    # LenderAddr2
-    data['LenderAddr2'] = clean_sql_text(data['LenderAddr2'])
-
-    # LenderCity
-    data['LenderCity'] = clean_sql_text(data['LenderCity'])
-
-    # LenderState
-    data['LenderState'] = clean_sql_text(data['LenderState'])
-
-    # LenderZip
-    data['LenderZip'] = clean_sql_text(data['LenderZip'])
-
-    # LoanAmt
-    data['LoanAmt'] = ck_curr_val(data['LoanAmt'], image, 'LoanAmt', data['LineNbr'], rownbr)
-
-    # IntRt
-    data['IntRt'] = clean_sql_text(data['IntRt'])
-
-    # IncurredDt
-    data['IncurredDt'] = convert_to_date(data['IncurredDt'], dateformat, image, 'IncurredDt', data['LineNbr'], rownbr,
-                                         'SC1', data['TransID'])
-
-    # DueDt
-    data['DueDt'] = convert_to_date(data['DueDt'], dateformat, image, 'DueDt', data['LineNbr'], rownbr, 'SC1',
-                                    data['TransID'])
-
-    # flgLoanRestructured
-    data['flgLoanRestructured'] = convert_to_bit(clean_sql_text(data['flgLoanRestructured']))
-
-    # OrigLoanDt
-    data['OrigLoanDt'] = convert_to_date(data['OrigLoanDt'], dateformat, image, 'OrigLoanDt', data['LineNbr'], rownbr,
-                                         'SC1', data['TransID'])
-
-    # CrdtAmtThisDraw
-    data['CrdtAmtThisDraw'] = ck_curr_val(data['CrdtAmtThisDraw'], image, 'CrdtAmtThisDraw', data['LineNbr'], rownbr)
-
-    # TotBlnc
-    data['TotBlnc'] = ck_curr_val(data['TotBlnc'], image, 'TotBlnc', data['LineNbr'], rownbr)
-
-    # flgOthersLiable
-    data['flgOthersLiable'] = convert_to_bit(clean_sql_text(data['flgOthersLiable']))
-
-    # flgCollateral
-    data['flgCollateral'] = convert_to_bit(clean_sql_text(data['flgCollateral']))
-
-    # CollateralDesc
-    data['CollateralDesc'] = clean_sql_text(data['CollateralDesc'])
-
-    # CollateralVal
-    data['CollateralVal'] = ck_curr_val(data['CollateralVal'], image, 'CollateralVal', data['LineNbr'], rownbr)
-
-    # flgPerfectedInt
-    data['flgPerfectedInt'] = convert_to_bit(clean_sql_text(data['flgPerfectedInt']))
-
-    # flgFutIncPledged
-    data['flgFutIncPledged'] = convert_to_bit(clean_sql_text(data['flgFutIncPledged']))
-
-    # FutIncDesc
-    data['FutIncDesc'] = clean_sql_text(data['FutIncDesc'])
-
-    # FutIncEstVal
-    data['FutIncEstVal'] = ck_curr_val(data['FutIncEstVal'], image, 'FutIncEstVal', data['LineNbr'], rownbr)
-
-    # DepAcctEstDt
-    data['DepAcctEstDt'] = convert_to_date(data['DepAcctEstDt'], dateformat, image, 'DepAcctEstDt', data['LineNbr'],
-                                           rownbr, 'SC1', data['TransID'])
-
-    # AcctLocName
-    data['AcctLocName'] = clean_sql_text(data['AcctLocName'])
-
-    # AcctLocAddr1
-    data['AcctLocAddr1'] = clean_sql_text(data['AcctLocAddr1'])
-
-    # AcctLocAddr2
-    data['AcctLocAddr2'] = clean_sql_text(data['AcctLocAddr2'])
-
-    # AcctLocCity
-    data['AcctLocCity'] = clean_sql_text(data['AcctLocCity'])
-
-    # AcctLocState
-    data['AcctLocState'] = clean_sql_text(data['AcctLocState'])
-
-    # AcctLocZip
-    data['AcctLocZip'] = clean_sql_text(data['AcctLocZip'])
-
-    # DepAcctAuthDt
-    data['DepAcctAuthDt'] = convert_to_date(data['DepAcctAuthDt'], dateformat, image, 'DepAcctAuthDt', data['LineNbr'],
-                                            rownbr, 'SC1', data['TransID'])
-
-    # LoanBasisDesc
-    data['LoanBasisDesc'] = clean_sql_text(data['LoanBasisDesc'])
-
-    # TrsFullName
-    if data['TrsFullName'] != '':
-        if data['TrsLName'] != '' or data['TrsFName'] != '' or data['TrsMName'] != '' or data['TrsPfx'] != '' or data[
-            'TrsSfx'] != '':
-            AddEntryToErrorLog('Treasurer full name (' + data[
-                'TrsFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            treas = parse_full_name(data['TrsFullName'], namedelim)
-            data['TrsLName'] = treas[0]
-            data['TrsFName'] = treas[1]
-            data['TrsMName'] = treas[2]
-            data['TrsPfx'] = treas[3]
-            data['TrsSfx'] = treas[4]
-        else:
-            data['TrsLName'] = data['TrsFullName']
-
-    # TrsLName
-    data['TrsLName'] = clean_sql_text(data['TrsLName'])
-
-    # TrsFName
-    data['TrsFName'] = clean_sql_text(data['TrsFName'])
-
-    # TrsMName
-    data['TrsMName'] = clean_sql_text(data['TrsMName'])
-
-    # TrsPfx
-    data['TrsPfx'] = clean_sql_text(data['TrsPfx'])
-
-    # TrsSfx
-    data['TrsSfx'] = clean_sql_text(data['TrsSfx'])
-
-    # TrsSignDt
-    data['TrsSignDt'] = convert_to_date(data['TrsSignDt'], dateformat, image, 'TrsSignDt', data['LineNbr'], rownbr,
-                                        'SC1', data['TransID'])
-
-    # LendRepFullName
-    if data['LendRepFullName'] != '':
-        if data['LendRepLName'] != '' or data['LendRepFName'] != '' or data['LendRepMName'] != '' or data[
-            'LendRepPfx'] != '' or data['LendRepSfx'] != '':
-            AddEntryToErrorLog('Treasurer full name (' + data[
-                'LendRepFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            treas = parse_full_name(data['LendRepFullName'], namedelim)
-            data['LendRepLName'] = treas[0]
-            data['LendRepFName'] = treas[1]
-            data['LendRepMName'] = treas[2]
-            data['LendRepPfx'] = treas[3]
-            data['LendRepSfx'] = treas[4]
-        else:
-            data['LendRepLName'] = data['LendRepFullName']
-
-    # LendRepLName
-    data['LendRepLName'] = clean_sql_text(data['LendRepLName'])
-
-    # LendRepFName
-    data['LendRepFName'] = clean_sql_text(data['LendRepFName'])
-
-    # LendRepMName
-    data['LendRepMName'] = clean_sql_text(data['LendRepMName'])
-
-    # LendRepPfx
-    data['LendRepPfx'] = clean_sql_text(data['LendRepPfx'])
-
-    # LendRepSfx
-    data['LendRepSfx'] = clean_sql_text(data['LendRepSfx'])
-
-    # LendRepTitle
-    data['LendRepTitle'] = clean_sql_text(data['LendRepTitle'])
-
-    # LendRepSignDt
-    data['LendRepSignDt'] = convert_to_date(data['LendRepSignDt'], dateformat, image, 'LendRepSignDt', data['LineNbr'],
-                                            rownbr, 'SC1', data['TransID'])
-
-    return data
-
-
-def check_row_data_sch_c2(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # BkRefTransID
-    data['BkRefTransID'] = clean_sql_text(data['BkRefTransID'])
-
-    # GuarFullName
-    if data['GuarFullName'] != '':
-        if data['GuarLName'] != '' or data['GuarFName'] != '' or data['GuarMName'] != '' or data['GuarPfx'] != '' or \
-                        data['GuarSfx'] != '':
-            AddEntryToErrorLog('Treasurer full name (' + data[
-                'GuarFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            guar = parse_full_name(data['GuarFullName'], namedelim)
-            data['GuarLName'] = guar[0]
-            data['GuarFName'] = guar[1]
-            data['GuarMName'] = guar[2]
-            data['GuarPfx'] = guar[3]
-            data['GuarSfx'] = guar[4]
-        else:
-            data['GuarLName'] = data['GuarFullName']
-
-    # GuarLName
-    data['GuarLName'] = clean_sql_text(data['GuarLName'])
-
-    # GuarFName
-    data['GuarFName'] = clean_sql_text(data['GuarFName'])
-
-    # GuarMName
-    data['GuarMName'] = clean_sql_text(data['GuarMName'])
-
-    # GuarPfx
-    data['GuarPfx'] = clean_sql_text(data['GuarPfx'])
-
-    # GuarSfx
-    data['GuarSfx'] = clean_sql_text(data['GuarSfx'])
-
-    # GuarAddr1
-    data['GuarAddr1'] = clean_sql_text(data['GuarAddr1'])
-
-    # GuarAddr2
-    data['GuarAddr2'] = clean_sql_text(data['GuarAddr2'])
-
-    # GuarCity
-    data['GuarCity'] = clean_sql_text(data['GuarCity'])
-
-    # GuarState
-    data['GuarState'] = clean_sql_text(data['GuarState'])
-
-    # GuarZip
-    data['GuarZip'] = clean_sql_text(data['GuarZip'])
-
-    # GuarEmp
-    data['GuarEmp'] = clean_sql_text(data['GuarEmp'])
-
-    # GuarOcc
-    data['GuarOcc'] = clean_sql_text(data['GuarOcc'])
-
-    # GuarAmt
-    data['GuarAmt'] = ck_curr_val(data['GuarAmt'], image, 'GuarAmt', data['LineNbr'], rownbr)
-
-    return data
-
-
-def check_row_data_sch_d(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # EntTp
-    data['EntTp'] = clean_sql_text(data['EntTp'])
-
-    # CreditorOrgName
-    data['CreditorOrgName'] = clean_sql_text(data['CreditorOrgName'])
-
-    # CreditorLName
-    data['CreditorLName'] = clean_sql_text(data['CreditorLName'])
-
-    # CreditorFName
-    data['CreditorFName'] = clean_sql_text(data['CreditorFName'])
-
-    # CreditorMName
-    data['CreditorMName'] = clean_sql_text(data['CreditorMName'])
-
-    # CreditorPfx
-    data['CreditorPfx'] = clean_sql_text(data['CreditorPfx'])
-
-    # CreditorSfx
-    data['CreditorSfx'] = clean_sql_text(data['CreditorSfx'])
-
-    # CreditorAddr1
-    data['CreditorAddr1'] = clean_sql_text(data['CreditorAddr1'])
-
-    # CreditorAddr2
-    data['CreditorAddr2'] = clean_sql_text(data['CreditorAddr2'])
-
-    # CreditorCity
-    data['CreditorCity'] = clean_sql_text(data['CreditorCity'])
-
-    # CreditorState
-    data['CreditorState'] = clean_sql_text(data['CreditorState'])
-
-    # CreditorZip
-    data['CreditorZip'] = clean_sql_text(data['CreditorZip'])
-
-    # DebtPurp
-    data['DebtPurp'] = clean_sql_text(data['DebtPurp'])
-
-    # BegBlnc_P
-    data['BegBlnc_P'] = ck_curr_val(data['BegBlnc_P'], image, 'BegBlnc_P', data['LineNbr'], rownbr)
-
-    # IncurAmt_P
-    data['IncurAmt_P'] = ck_curr_val(data['IncurAmt_P'], image, 'IncurAmt_P', data['LineNbr'], rownbr)
-
-    # PymtAmt_P
-    data['PymtAmt_P'] = ck_curr_val(data['PymtAmt_P'], image, 'PymtAmt_P', data['LineNbr'], rownbr)
-
-    # BalClose_P
-    data['BalClose_P'] = ck_curr_val(data['BalClose_P'], image, 'BalClose_P', data['LineNbr'], rownbr)
-
-    # CreditorCommID
-    data['CreditorCommID'] = clean_sql_text(data['CreditorCommID'])
-
-    # CreditorCandID
-    data['CreditorCandID'] = clean_sql_text(data['CreditorCandID'])
-
-    # CreditorCandFullName
-    data['CreditorCandFullName'] = clean_sql_text(data['CreditorCandFullName'])
-
-    # CreditorCandOfc
-    data['CreditorCandOfc'] = clean_sql_text(data['CreditorCandOfc'])
-
-    # CreditorCandState
-    data['CreditorCandState'] = clean_sql_text(data['CreditorCandState'])
-
-    # CreditorCandDist
-    data['CreditorCandDist'] = convert_to_tinyint(data['CreditorCandDist'], image, 'CreditorCandDist', data['LineNbr'],
-                                                  rownbr, 'SD', data['TransID'])
-
-    # ConduitName
-    data['ConduitName'] = clean_sql_text(data['ConduitName'])
-
-    # ConduitAddr1
-    data['ConduitAddr1'] = clean_sql_text(data['ConduitAddr1'])
-
-    # ConduitAddr2
-    data['ConduitAddr2'] = clean_sql_text(data['ConduitAddr2'])
-
-    # ConduitCity
-    data['ConduitCity'] = clean_sql_text(data['ConduitCity'])
-
-    # ConduitState
-    data['ConduitState'] = clean_sql_text(data['ConduitState'])
-
-    # ConduitZip
-    data['ConduitZip'] = clean_sql_text(data['ConduitZip'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    return data
-
-
-def check_row_data_sch_e(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # BkRefTransID
-    data['BkRefTransID'] = clean_sql_text(data['BkRefTransID'])
-
-    # BkRefSchdNm
-    data['BkRefSchdNm'] = clean_sql_text(data['BkRefSchdNm'])
-
-    # EntTp
-    data['EntTp'] = clean_sql_text(data['EntTp'])
-
-    # PayeeOrgNm
-    data['PayeeOrgNm'] = clean_sql_text(data['PayeeOrgNm'])
-
-    # PayeeFullName
-    if data['PayeeFullName'] != '':
-        if data['PayeeLName'] != '' or data['PayeeFName'] != '' or data['PayeeMName'] != '' or data['PayeePfx'] != '' or \
-                        data['PayeeSfx'] != '':
-            AddEntryToErrorLog('Payee full name (' + data[
-                'PayeeFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            name = parse_full_name(data['PayeeFullName'], namedelim)
-            data['PayeeLName'] = name[0]
-            data['PayeeFName'] = name[1]
-            data['PayeeMName'] = name[2]
-            data['PayeePfx'] = name[3]
-            data['PayeeSfx'] = name[4]
-        else:
-            data['PayeeLName'] = data['PayeeFullName']
-
-    # PayeeLName
-    data['PayeeLName'] = clean_sql_text(data['PayeeLName'])
-
-    # PayeeFName
-    data['PayeeFName'] = clean_sql_text(data['PayeeFName'])
-
-    # PayeeMName
-    data['PayeeMName'] = clean_sql_text(data['PayeeMName'])
-
-    # PayeePfx
-    data['PayeePfx'] = clean_sql_text(data['PayeePfx'])
-
-    # PayeeSfx
-    data['PayeeSfx'] = clean_sql_text(data['PayeeSfx'])
-
-    # PayeeAddr1
-    data['PayeeAddr1'] = clean_sql_text(data['PayeeAddr1'])
-
-    # PayeeAddr2
-    data['PayeeAddr2'] = clean_sql_text(data['PayeeAddr2'])
-
-    # PayeeCity
-    data['PayeeCity'] = clean_sql_text(data['PayeeCity'])
-
-    # PayeeStAbbr
-    data['PayeeStAbbr'] = clean_sql_text(data['PayeeStAbbr'])
-
-    # PayeeZip
-    data['PayeeZip'] = clean_sql_text(data['PayeeZip'])
-
-    # ElecCd
-    data['ElecCd'] = clean_sql_text(data['ElecCd'])
-
-    # ElecDesc
-    data['ElecDesc'] = clean_sql_text(data['ElecDesc'])
-
-    # DissmntnDt
-    data['DissmntnDt'] = convert_to_date(data['DissmntnDt'], dateformat, image, 'DissmntnDt', data['LineNbr'], rownbr,
-                                         'SE', data['TransID'])
-
-    # ExpDt
-    data['ExpDt'] = convert_to_date(data['ExpDt'], dateformat, image, 'ExpDt', data['LineNbr'], rownbr, 'SE',
-                                    data['TransID'])
-
-    # ExpAmt
-    data['ExpAmt'] = ck_curr_val(data['ExpAmt'], image, 'ExpAmt', data['LineNbr'], rownbr)
-
-    # ExpAgg
-    data['ExpAgg'] = ck_curr_val(data['ExpAgg'], image, 'ExpAgg', data['LineNbr'], rownbr)
-
-    # ExpPurpDesc
-    data['ExpPurpDesc'] = clean_sql_text(data['ExpPurpDesc'])
-
-    # ExpCatCd
-    data['ExpCatCd'] = clean_sql_text(data['ExpCatCd'])
-
-    # PayeeCommID
-    data['PayeeCommID'] = clean_sql_text(data['PayeeCommID'])
-
-    # SupOppCd
-    data['SupOppCd'] = clean_sql_text(data['SupOppCd'])
-
-    # SupOppCandID
-    data['SupOppCandID'] = clean_sql_text(data['SupOppCandID'])
-
-    # SupOppCandFullName
-    if data['SupOppCandFullName'] != '':
-        if data['SupOppCandLName'] != '' or data['SupOppCandFName'] != '' or data['SupOppCandMName'] != '' or data[
-            'SupOppCandPfx'] != '' or data['SupOppCandSfx'] != '':
-            AddEntryToErrorLog('Sup/Opp candidate full name (' + data[
-                'SupOppCandFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            name = parse_full_name(data['SupOppCandFullName'], namedelim)
-            data['SupOppCandLName'] = name[0]
-            data['SupOppCandFName'] = name[1]
-            data['SupOppCandMName'] = name[2]
-            data['SupOppCandPfx'] = name[3]
-            data['SupOppCandSfx'] = name[4]
-        else:
-            data['SupOppCandLName'] = data['SupOppCandFullName']
-
-    # SupOppCandLName
-    data['SupOppCandLName'] = clean_sql_text(data['SupOppCandLName'])
-
-    # SupOppCandFName
-    data['SupOppCandFName'] = clean_sql_text(data['SupOppCandFName'])
-
-    # SupOppCandMName
-    data['SupOppCandMName'] = clean_sql_text(data['SupOppCandMName'])
-
-    # SupOppCandPfx
-    data['SupOppCandPfx'] = clean_sql_text(data['SupOppCandPfx'])
-
-    # SupOppCandSfx
-    data['SupOppCandSfx'] = clean_sql_text(data['SupOppCandSfx'])
-
-    # SupOppCandOfc
-    data['SupOppCandOfc'] = clean_sql_text(data['SupOppCandOfc'])
-
-    # SupOppCandStAbbr
-    data['SupOppCandStAbbr'] = clean_sql_text(data['SupOppCandStAbbr'])
-
-    # SupOppCandDist
-    data['SupOppCandDist'] = convert_to_tinyint(data['SupOppCandDist'], image, 'SupOppCandDist', data['LineNbr'],
-                                                rownbr, 'SE', data['TransID'])
-
-    # CompFullName
-    if data['CompFullName'] != '':
-        if data['CompLName'] != '' or data['CompFName'] != '' or data['CompMName'] != '' or data['CompPfx'] != '' or \
-                        data['CompSfx'] != '':
-            AddEntryToErrorLog('Form completed by full name (' + data[
-                'CompFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            name = parse_full_name(data['CompFullName'], namedelim)
-            data['CompLName'] = name[0]
-            data['CompFName'] = name[1]
-            data['CompMName'] = name[2]
-            data['CompPfx'] = name[3]
-            data['CompSfx'] = name[4]
-        else:
-            data['CompLName'] = data['CompFullName']
-
-    # CompLName
-    data['CompLName'] = clean_sql_text(data['CompLName'])
-
-    # CompFName
-    data['CompFName'] = clean_sql_text(data['CompFName'])
-
-    # CompMName
-    data['CompMName'] = clean_sql_text(data['CompMName'])
-
-    # CompPfx
-    data['CompPfx'] = clean_sql_text(data['CompPfx'])
-
-    # CompSfx
-    data['CompSfx'] = clean_sql_text(data['CompSfx'])
-
-    # SignDt
-    data['SignDt'] = convert_to_date(data['SignDt'], dateformat, image, 'SignDt', data['LineNbr'], rownbr, 'SE',
-                                     data['TransID'])
-
-    # MemoCd
-    data['MemoCd'] = convert_to_bit(clean_sql_text(data['MemoCd']))
-
-    # MemoTxt
-    data['MemoTxt'] = clean_sql_text(data['MemoTxt'])
-
-    return data
-
-
-def check_row_data_sch_f(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # BkRefTransID
-    data['BkRefTransID'] = clean_sql_text(data['BkRefTransID'])
-
-    # BkRefSchdNm
-    data['BkRefSchdNm'] = clean_sql_text(data['BkRefSchdNm'])
-
-    # flgDesigCoordExp
-    data['flgDesigCoordExp'] = convert_to_bit(convert_to_bit(clean_sql_text(data['flgDesigCoordExp'])))
-
-    # DesigCommID
-    data['DesigCommID'] = clean_sql_text(data['DesigCommID'])
-
-    # DesigCommNm
-    data['DesigCommNm'] = clean_sql_text(data['DesigCommNm'])
-
-    # SubordCommID
-    data['SubordCommID'] = clean_sql_text(data['SubordCommID'])
-
-    # SubordCommNm
-    data['SubordCommNm'] = clean_sql_text(data['SubordCommNm'])
-
-    # SubordAddr1
-    data['SubordAddr1'] = clean_sql_text(data['SubordAddr1'])
-
-    # SubordAddr2
-    data['SubordAddr2'] = clean_sql_text(data['SubordAddr2'])
-
-    # SubordCity
-    data['SubordCity'] = clean_sql_text(data['SubordCity'])
-
-    # SubordStAbbr
-    data['SubordStAbbr'] = clean_sql_text(data['SubordStAbbr'])
-
-    # SubordZip
-    data['SubordZip'] = clean_sql_text(data['SubordZip'])
-
-    # EntTp
-    data['EntTp'] = clean_sql_text(data['EntTp'])
-
-    # PayeeOrgNm
-    data['PayeeOrgNm'] = clean_sql_text(data['PayeeOrgNm'])
-
-    # PayeeFullName
-    if data['PayeeFullName'] != '':
-        if data['PayeeLName'] != '' or data['PayeeFName'] != '' or data['PayeeMName'] != '' or data['PayeePfx'] != '' or \
-                        data['PayeeSfx'] != '':
-            AddEntryToErrorLog('Payee full name (' + data[
-                'PayeeFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            name = parse_full_name(data['PayeeFullName'], namedelim)
-            data['PayeeLName'] = name[0]
-            data['PayeeFName'] = name[1]
-            data['PayeeMName'] = name[2]
-            data['PayeePfx'] = name[3]
-            data['PayeeSfx'] = name[4]
-        else:
-            data['PayeeLName'] = data['PayeeFullName']
-
-    # PayeeLName
-    data['PayeeLName'] = clean_sql_text(data['PayeeLName'])
-
-    # PayeeFName
-    data['PayeeFName'] = clean_sql_text(data['PayeeFName'])
-
-    # PayeeMName
-    data['PayeeMName'] = clean_sql_text(data['PayeeMName'])
-
-    # PayeePfx
-    data['PayeePfx'] = clean_sql_text(data['PayeePfx'])
-
-    # PayeeSfx
-    data['PayeeSfx'] = clean_sql_text(data['PayeeSfx'])
-
-    # PayeeAddr1
-    data['PayeeAddr1'] = clean_sql_text(data['PayeeAddr1'])
-
-    # PayeeAddr2
-    data['PayeeAddr2'] = clean_sql_text(data['PayeeAddr2'])
-
-    # PayeeCity
-    data['PayeeCity'] = clean_sql_text(data['PayeeCity'])
-
-    # PayeeStAbbr
-    data['PayeeStAbbr'] = clean_sql_text(data['PayeeStAbbr'])
-
-    # PayeeZip
-    data['PayeeZip'] = clean_sql_text(data['PayeeZip'])
-
-    # ExpDt
-    data['ExpDt'] = convert_to_date(data['ExpDt'], dateformat, image, 'ExpDt', data['LineNbr'], rownbr, 'SF',
-                                    data['TransID'])
-
-    # ExpAmt
-    data['ExpAmt'] = ck_curr_val(data['ExpAmt'], image, 'ExpAmt', data['LineNbr'], rownbr)
-
-    # ExpAgg
-    data['ExpAgg'] = ck_curr_val(data['ExpAgg'], image, 'ExpAgg', data['LineNbr'], rownbr)
-
-    # ExpPurpCd
-    data['ExpPurpCd'] = clean_sql_text(data['ExpPurpCd'])
-
-    # ExpPurpDesc
-    data['ExpPurpDesc'] = clean_sql_text(data['ExpPurpDesc'])
-
-    # ExpCatCd
-    data['ExpCatCd'] = clean_sql_text(data['ExpCatCd'])
-
-    # PayeeCommID
-    data['PayeeCommID'] = clean_sql_text(data['PayeeCommID'])
-
-    # PayeeCandID
-    data['PayeeCandID'] = clean_sql_text(data['PayeeCandID'])
-
-    # PayeeCandFullName
-    if data['PayeeCandFullName'] != '':
-        if data['PayeeCandLName'] != '' or data['PayeeCandFName'] != '' or data['PayeeCandMName'] != '' or data[
-            'PayeeCandPfx'] != '' or data['PayeeCandSfx'] != '':
-            AddEntryToErrorLog('Payee candidate full name (' + data[
-                'PayeeCandFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            name = parse_full_name(data['PayeeCandFullName'], namedelim)
-            data['PayeeCandLName'] = name[0]
-            data['PayeeCandFName'] = name[1]
-            data['PayeeCandMName'] = name[2]
-            data['PayeeCandPfx'] = name[3]
-            data['PayeeCandSfx'] = name[4]
-        else:
-            data['PayeeCandLName'] = data['PayeeCandFullName']
-
-    # PayeeCandLName
-    data['PayeeCandLName'] = clean_sql_text(data['PayeeCandLName'])
-
-    # PayeeCandFName
-    data['PayeeCandFName'] = clean_sql_text(data['PayeeCandFName'])
-
-    # PayeeCandMName
-    data['PayeeCandMName'] = clean_sql_text(data['PayeeCandMName'])
-
-    # PayeeCandPfx
-    data['PayeeCandPfx'] = clean_sql_text(data['PayeeCandPfx'])
-
-    # PayeeCandSfx
-    data['PayeeCandSfx'] = clean_sql_text(data['PayeeCandSfx'])
-
-    # PayeeCandOfc
-    data['PayeeCandOfc'] = clean_sql_text(data['PayeeCandOfc'])
-
-    # PayeeCandStAbbr
-    data['PayeeCandStAbbr'] = clean_sql_text(data['PayeeCandStAbbr'])
-
-    # PayeeCandDist
-    data['PayeeCandDist'] = convert_to_tinyint(data['PayeeCandDist'], image, 'PayeeCandDist', data['LineNbr'], rownbr,
-                                               'SF', data['TransID'])
-
-    # MemoCd
-    data['MemoCd'] = convert_to_bit(clean_sql_text(data['MemoCd']))
-
-    # MemoTxt
-    data['MemoTxt'] = clean_sql_text(data['MemoTxt'])
-
-    return data
-
-
-def check_row_data_sch_h1(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # flgStLocFxPctPresOnly
-    data['flgStLocFxPctPresOnly'] = convert_to_bit(clean_sql_text(data['flgStLocFxPctPresOnly']))
-
-    # flgStLocFxPctPresAndSen
-    data['flgStLocFxPctPresAndSen'] = convert_to_bit(clean_sql_text(data['flgStLocFxPctPresAndSen']))
-
-    # flgStLocFxPctSenOnly
-    data['flgStLocFxPctSenOnly'] = convert_to_bit(clean_sql_text(data['flgStLocFxPctSenOnly']))
-
-    # flgStLocFxPctNonPresNonSen
-    data['flgStLocFxPctNonPresNonSen'] = convert_to_bit(clean_sql_text(data['flgStLocFxPctNonPresNonSen']))
-
-    # flgFlatMin50PctFed
-    data['flgFlatMin50PctFed'] = convert_to_bit(clean_sql_text(data['flgFlatMin50PctFed']))
-
-    # FedPct
-    data['FedPct'] = ck_curr_val(data['FedPct'], image, 'FedPct', data['LineNbr'], rownbr)
-
-    # NonFedPct
-    data['NonFedPct'] = ck_curr_val(data['NonFedPct'], image, 'NonFedPct', data['LineNbr'], rownbr)
-
-    # flgAdmRatio
-    data['flgAdmRatio'] = convert_to_bit(clean_sql_text(data['flgAdmRatio']))
-
-    # flgGenericVoterDrvRatio
-    data['flgGenericVoterDrvRatio'] = convert_to_bit(clean_sql_text(data['flgGenericVoterDrvRatio']))
-
-    # flgPubCommunRefPrtyRatio
-    data['flgPubCommunRefPrtyRatio'] = convert_to_bit(clean_sql_text(data['flgPubCommunRefPrtyRatio']))
-
-    return data
-
-
-def check_row_data_sch_h2(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # EventNm
-    data['EventNm'] = clean_sql_text(data['EventNm'])
-
-    # flgDirFndrsg
-    data['flgDirFndrsg'] = convert_to_bit(clean_sql_text(data['flgDirFndrsg']))
-
-    # flgDirCandSup
-    data['flgDirCandSup'] = convert_to_bit(clean_sql_text(data['flgDirCandSup']))
-
-    # RatioCd
-    data['RatioCd'] = clean_sql_text(data['RatioCd'])
-
-    # FedPct
-    data['FedPct'] = ck_curr_val(data['FedPct'], image, 'FedPct', data['LineNbr'], rownbr)
-
-    # NonFedPct
-    data['NonFedPct'] = ck_curr_val(data['NonFedPct'], image, 'NonFedPct', data['LineNbr'], rownbr)
-
-    return data
-
-
-def check_row_data_sch_h3(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # BkRefTransID
-    data['BkRefTransID'] = clean_sql_text(data['BkRefTransID'])
-
-    # AcctNm
-    data['AcctNm'] = clean_sql_text(data['AcctNm'])
-
-    # EventTp
-    data['EventTp'] = clean_sql_text(data['EventTp'])
-
-    # EventNm
-    data['EventNm'] = clean_sql_text(data['EventNm'])
-
-    # RcptDt
-    data['RcptDt'] = convert_to_date(data['RcptDt'], dateformat, image, 'RcptDt', data['LineNbr'], rownbr, 'H3',
-                                     data['TransID'])
-
-    # TotAmtTrans
-    data['TotAmtTrans'] = ck_curr_val(data['TotAmtTrans'], image, 'TotAmtTrans', data['LineNbr'], rownbr)
-
-    # TransAmt
-    data['TransAmt'] = ck_curr_val(data['TransAmt'], image, 'TransAmt', data['LineNbr'], rownbr)
-
-    return data
-
-
-def check_row_data_sch_h4(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # BkRefTransID
-    data['BkRefTransID'] = clean_sql_text(data['BkRefTransID'])
-
-    # BkRefSchdNm
-    data['BkRefSchdNm'] = clean_sql_text(data['BkRefSchdNm'])
-
-    # EntTp
-    data['EntTp'] = clean_sql_text(data['EntTp'])
-
-    # PayeeOrgNm
-    data['PayeeOrgNm'] = clean_sql_text(data['PayeeOrgNm'])
-
-    # PayeeFullName
-    if data['PayeeFullName'] != '':
-        if data['PayeeLName'] != '' or data['PayeeFName'] != '' or data['PayeeMName'] != '' or data['PayeePfx'] != '' or \
-                        data['PayeeSfx'] != '':
-            AddEntryToErrorLog('Payee full name (' + data[
-                'PayeeFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            name = parse_full_name(data['PayeeFullName'], namedelim)
-            data['PayeeLName'] = name[0]
-            data['PayeeFName'] = name[1]
-            data['PayeeMName'] = name[2]
-            data['PayeePfx'] = name[3]
-            data['PayeeSfx'] = name[4]
-        else:
-            data['PayeeLName'] = data['PayeeFullName']
-
-    # PayeeLName
-    data['PayeeLName'] = clean_sql_text(data['PayeeLName'])
-
-    # PayeeFName
-    data['PayeeFName'] = clean_sql_text(data['PayeeFName'])
-
-    # PayeeMName
-    data['PayeeMName'] = clean_sql_text(data['PayeeMName'])
-
-    # PayeePfx
-    data['PayeePfx'] = clean_sql_text(data['PayeePfx'])
-
-    # PayeeSfx
-    data['PayeeSfx'] = clean_sql_text(data['PayeeSfx'])
-
-    # PayeeAddr1
-    data['PayeeAddr1'] = clean_sql_text(data['PayeeAddr1'])
-
-    # PayeeAddr2
-    data['PayeeAddr2'] = clean_sql_text(data['PayeeAddr2'])
-
-    # PayeeCity
-    data['PayeeCity'] = clean_sql_text(data['PayeeCity'])
-
-    # PayeeStAbbr
-    data['PayeeStAbbr'] = clean_sql_text(data['PayeeStAbbr'])
-
-    # PayeeZip
-    data['PayeeZip'] = clean_sql_text(data['PayeeZip'])
-
-    # EventNm
-    data['EventNm'] = clean_sql_text(data['EventNm'])
-
-    # ExpDt
-    data['ExpDt'] = convert_to_date(data['ExpDt'], dateformat, image, 'ExpDt', data['LineNbr'], rownbr, 'H4',
-                                    data['TransID'])
-
-    # ExpAmt
-    data['ExpAmt'] = ck_curr_val(data['ExpAmt'], image, 'ExpAmt', data['LineNbr'], rownbr)
-
-    # FedAmt
-    data['FedAmt'] = ck_curr_val(data['FedAmt'], image, 'FedAmt', data['LineNbr'], rownbr)
-
-    # NonFedAmt
-    data['NonFedAmt'] = ck_curr_val(data['NonFedAmt'], image, 'NonFedAmt', data['LineNbr'], rownbr)
-
-    # EventAgg
-    data['EventAgg'] = ck_curr_val(data['EventAgg'], image, 'EventAgg', data['LineNbr'], rownbr)
-
-    # ExpPurpCd
-    data['ExpPurpCd'] = clean_sql_text(data['ExpPurpCd'])
-
-    # ExpPurpDesc
-    data['ExpPurpDesc'] = clean_sql_text(data['ExpPurpDesc'])
-
-    # ExpCatCd
-    data['ExpCatCd'] = clean_sql_text(data['ExpCatCd'])
-
-    # flgAdminActivity
-    data['flgAdminActivity'] = convert_to_bit(clean_sql_text(data['flgAdminActivity']))
-
-    # flgDirectFndrsg
-    data['flgDirectFndrsg'] = convert_to_bit(clean_sql_text(data['flgDirectFndrsg']))
-
-    # flgExempt
-    data['flgExempt'] = convert_to_bit(clean_sql_text(data['flgExempt']))
-
-    # flgGenVtrDrv
-    data['flgGenVtrDrv'] = convert_to_bit(clean_sql_text(data['flgGenVtrDrv']))
-
-    # flgDirCandSup
-    data['flgDirCandSup'] = convert_to_bit(clean_sql_text(data['flgDirCandSup']))
-
-    # flgPubCommun
-    data['flgPubCommun'] = convert_to_bit(clean_sql_text(data['flgPubCommun']))
-
-    # MemoCd
-    data['MemoCd'] = convert_to_bit(clean_sql_text(data['MemoCd']))
-
-    # MemoTxt
-    data['MemoTxt'] = clean_sql_text(data['MemoTxt'])
-
-    return data
-
-
-def check_row_data_sch_h5(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # AcctNm
-    data['AcctNm'] = clean_sql_text(data['AcctNm'])
-
-    # RcptDt
-    data['RcptDt'] = convert_to_date(data['RcptDt'], dateformat, image, 'RcptDt', data['LineNbr'], rownbr, 'H5',
-                                     data['TransID'])
-
-    # TotAmt
-    data['TotAmt'] = ck_curr_val(data['TotAmt'], image, 'TotAmt', data['LineNbr'], rownbr)
-
-    # VotRegnAmt
-    data['VotRegnAmt'] = ck_curr_val(data['VotRegnAmt'], image, 'VotRegnAmt', data['LineNbr'], rownbr)
-
-    # VotIDAmt
-    data['VotIDAmt'] = ck_curr_val(data['VotIDAmt'], image, 'VotIDAmt', data['LineNbr'], rownbr)
-
-    # GOTVAmt
-    data['GOTVAmt'] = ck_curr_val(data['GOTVAmt'], image, 'GOTVAmt', data['LineNbr'], rownbr)
-
-    # GenCampAmt
-    data['GenCampAmt'] = ck_curr_val(data['GenCampAmt'], image, 'GenCampAmt', data['LineNbr'], rownbr)
-
-    return data
-
-
-def check_row_data_sch_h6(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # BkRefTransID
-    data['BkRefTransID'] = clean_sql_text(data['BkRefTransID'])
-
-    # BkRefSchdNm
-    data['BkRefSchdNm'] = clean_sql_text(data['BkRefSchdNm'])
-
-    # EntTp
-    data['EntTp'] = clean_sql_text(data['EntTp'])
-
-    # PayeeOrgNm
-    data['PayeeOrgNm'] = clean_sql_text(data['PayeeOrgNm'])
-
-    # PayeeFullName
-    if data['PayeeFullName'] != '':
-        if data['PayeeLName'] != '' or data['PayeeFName'] != '' or data['PayeeMName'] != '' or data['PayeePfx'] != '' or \
-                        data['PayeeSfx'] != '':
-            AddEntryToErrorLog('Payee full name (' + data[
-                'PayeeFullName'] + ') could not be parsed for ' + imageid + ' because that would overwrite existing data. This script will attempt to add this data row to the database, but the full name field will be ignored.')
-        elif namedelim != '':
-            name = parse_full_name(data['PayeeFullName'], namedelim)
-            data['PayeeLName'] = name[0]
-            data['PayeeFName'] = name[1]
-            data['PayeeMName'] = name[2]
-            data['PayeePfx'] = name[3]
-            data['PayeeSfx'] = name[4]
-        else:
-            data['PayeeLName'] = data['PayeeFullName']
-
-    # PayeeLName
-    data['PayeeLName'] = clean_sql_text(data['PayeeLName'])
-
-    # PayeeFName
-    data['PayeeFName'] = clean_sql_text(data['PayeeFName'])
-
-    # PayeeMName
-    data['PayeeMName'] = clean_sql_text(data['PayeeMName'])
-
-    # PayeePfx
-    data['PayeePfx'] = clean_sql_text(data['PayeePfx'])
-
-    # PayeeSfx
-    data['PayeeSfx'] = clean_sql_text(data['PayeeSfx'])
-
-    # PayeeAddr1
-    data['PayeeAddr1'] = clean_sql_text(data['PayeeAddr1'])
-
-    # PayeeAddr2
-    data['PayeeAddr2'] = clean_sql_text(data['PayeeAddr2'])
-
-    # PayeeCity
-    data['PayeeCity'] = clean_sql_text(data['PayeeCity'])
-
-    # PayeeStAbbr
-    data['PayeeStAbbr'] = clean_sql_text(data['PayeeStAbbr'])
-
-    # PayeeZip
-    data['PayeeZip'] = clean_sql_text(data['PayeeZip'])
-
-    # EventNm
-    data['EventNm'] = clean_sql_text(data['EventNm'])
-
-    # ExpDt
-    data['ExpDt'] = convert_to_date(data['ExpDt'], dateformat, image, 'ExpDt', data['LineNbr'], rownbr, 'H6',
-                                    data['TransID'])
-
-    # TotExpAmt
-    data['TotExpAmt'] = ck_curr_val(data['TotExpAmt'], image, 'TotExpAmt', data['LineNbr'], rownbr)
-
-    # FedAmt
-    data['FedAmt'] = ck_curr_val(data['FedAmt'], image, 'FedAmt', data['LineNbr'], rownbr)
-
-    # LevinAmt
-    data['LevinAmt'] = ck_curr_val(data['LevinAmt'], image, 'LevinAmt', data['LineNbr'], rownbr)
-
-    # ExpAgg
-    data['ExpAgg'] = ck_curr_val(data['ExpAgg'], image, 'ExpAgg', data['LineNbr'], rownbr)
-
-    # ExpPurpCd
-    data['ExpPurpCd'] = clean_sql_text(data['ExpPurpCd'])
-
-    # ExpPurpDesc
-    data['ExpPurpDesc'] = clean_sql_text(data['ExpPurpDesc'])
-
-    # ExpCatCd
-    data['ExpCatCd'] = clean_sql_text(data['ExpCatCd'])
-
-    # flgActVotRegn
-    data['flgActVotRegn'] = convert_to_bit(clean_sql_text(data['flgActVotRegn']))
-
-    # flgActGOTV
-    data['flgActGOTV'] = convert_to_bit(clean_sql_text(data['flgActGOTV']))
-
-    # flgActVotID
-    data['flgActVotID'] = convert_to_bit(clean_sql_text(data['flgActVotID']))
-
-    # flgActGenCamp
-    data['flgActGenCamp'] = convert_to_bit(clean_sql_text(data['flgActGenCamp']))
-
-    # MemoCd
-    data['MemoCd'] = convert_to_bit(clean_sql_text(data['MemoCd']))
-
-    # MemoTxt
-    data['MemoTxt'] = clean_sql_text(data['MemoTxt'])
-
-    return data
-
-
-def check_row_data_sch_i(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # RecIDNbr
-    data['RecIDNbr'] = clean_sql_text(data['RecIDNbr'])
-
-    # AcctNm
-    data['AcctNm'] = clean_sql_text(data['AcctNm'])
-
-    # BankAcctID
-    data['BankAcctID'] = clean_sql_text(data['BankAcctID'])
-
-    # CovgFmDt
-    data['CovgFmDt'] = convert_to_date(data['CovgFmDt'], dateformat, image, 'CovgFmDt', data['LineNbr'], rownbr, 'SI',
-                                       data['TransID'])
-
-    # CovgToDt
-    data['CovgToDt'] = convert_to_date(data['CovgToDt'], dateformat, image, 'CovgToDt', data['LineNbr'], rownbr, 'SI',
-                                       data['TransID'])
-
-    # TotRcpts
-    data['TotRcpts'] = ck_curr_val(data['TotRcpts'], image, 'TotRcpts', data['LineNbr'], rownbr)
-
-    # TransToFed
-    data['TransToFed'] = ck_curr_val(data['TransToFed'], image, 'TransToFed', data['LineNbr'], rownbr)
-
-    # TransToStAndLoc
-    data['TransToStAndLoc'] = ck_curr_val(data['TransToStAndLoc'], image, 'TransToStAndLoc', data['LineNbr'], rownbr)
-
-    # DirStLocCandSup
-    data['DirStLocCandSup'] = ck_curr_val(data['DirStLocCandSup'], image, 'DirStLocCandSup', data['LineNbr'], rownbr)
-
-    # OthDisb
-    data['OthDisb'] = ck_curr_val(data['OthDisb'], image, 'OthDisb', data['LineNbr'], rownbr)
-
-    # TotDisb
-    data['TotDisb'] = ck_curr_val(data['TotDisb'], image, 'TotDisb', data['LineNbr'], rownbr)
-
-    # BegCOH
-    data['BegCOH'] = ck_curr_val(data['BegCOH'], image, 'BegCOH', data['LineNbr'], rownbr)
-
-    # Rcpts
-    data['Rcpts'] = ck_curr_val(data['Rcpts'], image, 'Rcpts', data['LineNbr'], rownbr)
-
-    # Subtotal
-    data['Subtotal'] = ck_curr_val(data['Subtotal'], image, 'Subtotal', data['LineNbr'], rownbr)
-
-    # Disb
-    data['Disb'] = ck_curr_val(data['Disb'], image, 'Disb', data['LineNbr'], rownbr)
-
-    # EndCOH
-    data['EndCOH'] = ck_curr_val(data['EndCOH'], image, 'EndCOH', data['LineNbr'], rownbr)
-
-    # TotRcpts2
-    data['TotRcpts2'] = ck_curr_val(data['TotRcpts2'], image, 'TotRcpts2', data['LineNbr'], rownbr)
-
-    # TransToFed2
-    data['TransToFed2'] = ck_curr_val(data['TransToFed2'], image, 'TransToFed2', data['LineNbr'], rownbr)
-
-    # TransToStAndLoc2
-    data['TransToStAndLoc2'] = ck_curr_val(data['TransToStAndLoc2'], image, 'TransToStAndLoc2', data['LineNbr'], rownbr)
-
-    # DirStLocCandSup2
-    data['DirStLocCandSup2'] = ck_curr_val(data['DirStLocCandSup2'], image, 'DirStLocCandSup2', data['LineNbr'], rownbr)
-
-    # OthDisb2
-    data['OthDisb2'] = ck_curr_val(data['OthDisb2'], image, 'OthDisb2', data['LineNbr'], rownbr)
-
-    # TotDisb2
-    data['TotDisb2'] = ck_curr_val(data['TotDisb2'], image, 'TotDisb2', data['LineNbr'], rownbr)
-
-    # BegCOH
-    data['BegCOH2'] = ck_curr_val(data['BegCOH2'], image, 'BegCOH2', data['LineNbr'], rownbr)
-
-    # Rcpts2
-    data['Rcpts2'] = ck_curr_val(data['Rcpts2'], image, 'Rcpts2', data['LineNbr'], rownbr)
-
-    # Subtotal2
-    data['Subtotal2'] = ck_curr_val(data['Subtotal2'], image, 'Subtotal2', data['LineNbr'], rownbr)
-
-    # Disb2
-    data['Disb2'] = ck_curr_val(data['Disb2'], image, 'Disb2', data['LineNbr'], rownbr)
-
-    # EndCOH2
-    data['EndCOH2'] = ck_curr_val(data['EndCOH2'], image, 'EndCOH2', data['LineNbr'], rownbr)
-
-    return data
-
-
-def check_row_data_sch_l(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # RecordID
-    data['RecordID'] = clean_sql_text(data['RecordID'])
-
-    # AcctNm
-    data['AcctNm'] = clean_sql_text(data['AcctNm'])
-
-    # CovgFmDt
-    data['CovgFmDt'] = convert_to_date(data['CovgFmDt'], dateformat, image, 'CovgFmDt', data['LineNbr'], rownbr, 'SL',
-                                       data['TransID'])
-
-    # CovgToDt
-    data['CovgToDt'] = convert_to_date(data['CovgToDt'], dateformat, image, 'CovgToDt', data['LineNbr'], rownbr, 'SL',
-                                       data['TransID'])
-
-    # IndRcptsItem_P
-    data['IndRcptsItem_P'] = ck_curr_val(data['IndRcptsItem_P'], image, 'IndRcptsItem_P', data['LineNbr'], 0)
-
-    # IndRcptsUnitem_P
-    data['IndRcptsUnitem_P'] = ck_curr_val(data['IndRcptsUnitem_P'], image, 'IndRcptsUnitem_P', data['LineNbr'], 0)
-
-    # IndRcptsTot_P
-    data['IndRcptsTot_P'] = ck_curr_val(data['IndRcptsTot_P'], image, 'IndRcptsTot_P', data['LineNbr'], 0)
-
-    # OthRcpts_P
-    data['OthRcpts_P'] = ck_curr_val(data['OthRcpts_P'], image, 'OthRcpts_P', data['LineNbr'], 0)
-
-    # TotRcpts_P
-    data['TotRcpts_P'] = ck_curr_val(data['TotRcpts_P'], image, 'TotRcpts_P', data['LineNbr'], 0)
-
-    # TransVotReg_P
-    data['TransVotReg_P'] = ck_curr_val(data['TransVotReg_P'], image, 'TransVotReg_P', data['LineNbr'], 0)
-
-    # TransVotID_P
-    data['TransVotID_P'] = ck_curr_val(data['TransVotID_P'], image, 'TransVotID_P', data['LineNbr'], 0)
-
-    # TransGOTV_P
-    data['TransGOTV_P'] = ck_curr_val(data['TransGOTV_P'], image, 'TransGOTV_P', data['LineNbr'], 0)
-
-    # TransGenCamp_P
-    data['TransGenCamp_P'] = ck_curr_val(data['TransGenCamp_P'], image, 'TransGenCamp_P', data['LineNbr'], 0)
-
-    # TransTot_P
-    data['TransTot_P'] = ck_curr_val(data['TransTot_P'], image, 'TransTot_P', data['LineNbr'], 0)
-
-    # OthDisb_P
-    data['OthDisb_P'] = ck_curr_val(data['OthDisb_P'], image, 'OthDisb_P', data['LineNbr'], 0)
-
-    # TotDisb_P
-    data['TotDisb_P'] = ck_curr_val(data['TotDisb_P'], image, 'TotDisb_P', data['LineNbr'], 0)
-
-    # BegCOH_P
-    data['BegCOH_P'] = ck_curr_val(data['BegCOH_P'], image, 'BegCOH_P', data['LineNbr'], 0)
-
-    # Rcpts_P
-    data['Rcpts_P'] = ck_curr_val(data['Rcpts_P'], image, 'Rcpts_P', data['LineNbr'], 0)
-
-    # Subtotal_P
-    data['Subtotal_P'] = ck_curr_val(data['Subtotal_P'], image, 'Subtotal_P', data['LineNbr'], 0)
-
-    # Disb_P
-    data['Disb_P'] = ck_curr_val(data['Disb_P'], image, 'Disb_P', data['LineNbr'], 0)
-
-    # EndCOH_P
-    data['EndCOH_P'] = ck_curr_val(data['EndCOH_P'], image, 'EndCOH_P', data['LineNbr'], 0)
-
-    # IndRcptsItem_T
-    data['IndRcptsItem_T'] = ck_curr_val(data['IndRcptsItem_T'], image, 'IndRcptsItem_T', data['LineNbr'], 0)
-
-    # IndRcptsUnitem_T
-    data['IndRcptsUnitem_T'] = ck_curr_val(data['IndRcptsUnitem_T'], image, 'IndRcptsUnitem_T', data['LineNbr'], 0)
-
-    # IndRcptsTot_T
-    data['IndRcptsTot_T'] = ck_curr_val(data['IndRcptsTot_T'], image, 'IndRcptsTot_T', data['LineNbr'], 0)
-
-    # OthRcpts_T
-    data['OthRcpts_T'] = ck_curr_val(data['OthRcpts_T'], image, 'OthRcpts_T', data['LineNbr'], 0)
-
-    # TotRcpts_T
-    data['TotRcpts_T'] = ck_curr_val(data['TotRcpts_T'], image, 'TotRcpts_T', data['LineNbr'], 0)
-
-    # TransVotReg_T
-    data['TransVotReg_T'] = ck_curr_val(data['TransVotReg_T'], image, 'TransVotReg_T', data['LineNbr'], 0)
-
-    # TransVotID_T
-    data['TransVotID_T'] = ck_curr_val(data['TransVotID_T'], image, 'TransVotID_T', data['LineNbr'], 0)
-
-    # TransGOTV_T
-    data['TransGOTV_T'] = ck_curr_val(data['TransGOTV_T'], image, 'TransGOTV_T', data['LineNbr'], 0)
-
-    # TransGenCamp_T
-    data['TransGenCamp_T'] = ck_curr_val(data['TransGenCamp_T'], image, 'TransGenCamp_T', data['LineNbr'], 0)
-
-    # TransTot_T
-    data['TransTot_T'] = ck_curr_val(data['TransTot_T'], image, 'TransTot_T', data['LineNbr'], 0)
-
-    # OthDisb_T
-    data['OthDisb_T'] = ck_curr_val(data['OthDisb_T'], image, 'OthDisb_T', data['LineNbr'], 0)
-
-    # TotDisb_T
-    data['TotDisb_T'] = ck_curr_val(data['TotDisb_T'], image, 'TotDisb_T', data['LineNbr'], 0)
-
-    # BegCOH_T
-    data['BegCOH_T'] = ck_curr_val(data['BegCOH_T'], image, 'BegCOH_T', data['LineNbr'], 0)
-
-    # Rcpts_T
-    data['Rcpts_T'] = ck_curr_val(data['Rcpts_T'], image, 'Rcpts_T', data['LineNbr'], 0)
-
-    # Subtotal_T
-    data['Subtotal_T'] = ck_curr_val(data['Subtotal_T'], image, 'Subtotal_T', data['LineNbr'], 0)
-
-    # Disb_T
-    data['Disb_T'] = ck_curr_val(data['Disb_T'], image, 'Disb_T', data['LineNbr'], 0)
-
-    # EndCOH_T'
-    data['EndCOH_T'] = ck_curr_val(data['EndCOH_T'], image, 'EndCOH_T', data['LineNbr'], 0)
-
-    return data
-
-
-def check_row_data_text(data, image, rownbr, namedelim='', dateformat='CCYYMMDD'):
-    # LineNbr
-    data['LineNbr'] = clean_sql_text(data['LineNbr'])
-
-    # CommID
-    data['CommID'] = clean_sql_text(data['CommID'])
-
-    # TransID
-    data['TransID'] = clean_sql_text(data['TransID'])
-
-    # BkRefTransID
-    data['BkRefTransID'] = clean_sql_text(data['BkRefTransID'])
-
-    # BkRefSchdNm
-    data['BkRefSchdNm'] = clean_sql_text(data['BkRefSchdNm'])
-
-    # FullText
-    data['FullText'] = clean_sql_text(data['FullText'])
-
-    return data
-
-
-##############################################
-
-
-
-# Built list of supported report types
-rpttypes = build_list_of_supported_report_types()
-
-# Create timestamp to append to output files
-filestamp = create_file_timestamp()
-
-# Build files to house data output
-otherdatafile = RPTOUTDIR + 'OtherData_' + filestamp + '.txt'
-schedafile = RPTOUTDIR + 'SchedA_' + filestamp + '.txt'
-schedbfile = RPTOUTDIR + 'SchedB_' + filestamp + '.txt'
-schedcfile = RPTOUTDIR + 'SchedC_' + filestamp + '.txt'
-schedc1file = RPTOUTDIR + 'SchedC1_' + filestamp + '.txt'
-schedc2file = RPTOUTDIR + 'SchedC2_' + filestamp + '.txt'
-scheddfile = RPTOUTDIR + 'SchedD_' + filestamp + '.txt'
-schedefile = RPTOUTDIR + 'SchedE_' + filestamp + '.txt'
-schedffile = RPTOUTDIR + 'SchedF_' + filestamp + '.txt'
-schedh1file = RPTOUTDIR + 'SchedH1_' + filestamp + '.txt'
-schedh2file = RPTOUTDIR + 'SchedH2_' + filestamp + '.txt'
-schedh3file = RPTOUTDIR + 'SchedH3_' + filestamp + '.txt'
-schedh4file = RPTOUTDIR + 'SchedH4_' + filestamp + '.txt'
-schedh5file = RPTOUTDIR + 'SchedH5_' + filestamp + '.txt'
-schedh6file = RPTOUTDIR + 'SchedH6_' + filestamp + '.txt'
-schedifile = RPTOUTDIR + 'SchedI_' + filestamp + '.txt'
-schedlfile = RPTOUTDIR + 'SchedL_' + filestamp + '.txt'
-textfile = RPTOUTDIR + 'Text_' + filestamp + '.txt'
-f1sfile = RPTOUTDIR + 'F1S_' + filestamp + '.txt'
-
-# Write headers to data output files
-with open(schedafile, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['SA'])) + '\r')
-
-with open(schedbfile, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['SB'])) + '\r')
-
-with open(schedcfile, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['SC'])) + '\r')
-
-with open(schedc1file, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['SC1'])) + '\r')
-
-with open(schedc2file, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['SC2'])) + '\r')
-
-with open(scheddfile, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['SD'])) + '\r')
-
-with open(schedefile, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['SE'])) + '\r')
-
-with open(schedffile, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['SF'])) + '\r')
-
-with open(schedh1file, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['H1'])) + '\r')
-
-with open(schedh2file, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['H2'])) + '\r')
-
-with open(schedh3file, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['H3'])) + '\r')
-
-with open(schedh4file, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['H4'])) + '\r')
-
-with open(schedh5file, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['H5'])) + '\r')
-
-with open(schedh6file, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['H6'])) + '\r')
-
-with open(schedifile, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['SI'])) + '\r')
-
-with open(schedlfile, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['SL'])) + '\r')
-
-with open(textfile, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
-        map(str, outputhdrs['TEXT'])) + '\r')
-
-with open(f1sfile, 'wb') as outputfile:
-    outputfile.write('ImageID' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(map(str, outputhdrs['F1S'])) + '\r')
-
-# Append full name fields to output headers
-outputhdrs['SA'].append('ContFullName')
-outputhdrs['SA'].append('DonorCandFullName')
-outputhdrs['SB'].append('PayeeFullName')
-outputhdrs['SB'].append('BenCandFullName')
-outputhdrs['SC'].append('LenderFullName')
-outputhdrs['SC'].append('LenderCandFullName')
-outputhdrs['SC1'].append('LendRepFullName')
-outputhdrs['SC1'].append('TrsFullName')
-outputhdrs['SC2'].append('GuarFullName')
-outputhdrs['SE'].append('PayeeFullName')
-outputhdrs['SE'].append('SupOppCandFullName')
-outputhdrs['SE'].append('CompFullName')
-outputhdrs['SF'].append('PayeeFullName')
-outputhdrs['SF'].append('PayeeCandFullName')
-outputhdrs['H4'].append('PayeeFullName')
-outputhdrs['H6'].append('PayeeFullName')
-outputhdrs['F1S'].append('AgtFullName')
-
-# Iterate through each file
-for fecfile in glob.glob(os.path.join(RPTSVDIR, '*.fec')):
-
-    # Iterate counter and break at desired file count
-    filectr += 1
-    if filectr > FILELIMIT:
-        break
 
+def prepare_report(fecfile):
+    # Prepares a single electronic filing and loads its report header
+    # into the database. Returns a dictionary describing the report for
+    # parse_data_rows or None when the filing has been moved to the Hold
+    # or Review directory.
+    return prepare_reports([fecfile])[0][1]
+
+
+def prepare_report_header(fecfile):
+    # Reads the file header and report header of a single electronic
+    # filing and calls parse_report_header. Returns a dictionary
+    # describing the report, including the stored procedure call that
+    # loads its report header, or None when the filing has been moved to
+    # the Hold directory. The returned dictionary houses the report
+    # header itself and the offset of the line that follows it, so
+    # parse_report can read the data rows without reading the headers
+    # again. The file is closed in the meantime, so a large HDRBATCHSIZE
+    # doesn't hold many files open at once.
     # Store ImageID in variable
     imageid = int(fecfile.replace(RPTSVDIR, '').replace('.fec', ''))
 
     # Move file to hold directory if it's a known bad file
     if imageid in BADREPORTS:
         os.rename(fecfile, fecfile.replace(RPTSVDIR, RPTHOLDDIR))
-        continue
+        return None
+
+    # Extract file header and report header. The headers are read with
+    # readline so the file's position is exact after the report header.
+    with open(fecfile, 'rb') as datafile:
+        filehdr, rpthdr, x = read_report_headers(iter(datafile.readline, ''))
+        dataoffset = datafile.tell()
+    report = parse_report_header(imageid, filehdr, rpthdr, sniff_dialect(rpthdr))
 
-    # Extract file header
-    filehdr = linecache.getline(fecfile, 1)
+    # If report type not supported, move file to Hold directory
+    if report is None:
+        os.rename(fecfile, fecfile.replace(RPTSVDIR, RPTHOLDDIR))
+        return None
+
+    report['dataoffset'] = dataoffset
+    report['rpthdr'] = rpthdr
+    report['hdrlines'] = x
+    return report
+
+
+def prepare_reports(fecfiles):
+    # Prepares a group of electronic filings and loads their report
+    # headers into the database in as few round trips as possible.
+    # Returns a list of (filing, report) tuples, where report is the
+    # dictionary describing the report for parse_data_rows or None when
+    # the filing has been moved to the Hold or Review directory.
+    reports = []
+    for fecfile in fecfiles:
+        reports.append((fecfile, prepare_report_header(fecfile)))
+
+    calls = []
+    for fecfile, report in reports:
+        if report is not None:
+            calls.append(report.pop('hdrcall'))
+    sqlresults = load_rpt_hdrs(calls, DBCONNSTR)
 
-    # Headers in versions 1 and 2 are multiple lines
-    # If first line contains /* Header, it's an old style header
-    x = 2
+    # On error, move file to Review directory
+    x = 0
+    for y, (fecfile, report) in enumerate(reports):
+        if report is not None:
+            if sqlresults[x] == -1 or sqlresults[x] == -2:
+                shutil.move(fecfile, fecfile.replace(RPTSVDIR, RPTRVWDIR))
+                reports[y] = (fecfile, None)
+            x += 1
+    return reports
+
+
+def print_error_counts():
+    # Displays the number of entries logged for each error type
+    for errortype in sorted(errorcounts):
+        print(errortype + ': ' + str(errorcounts[errortype]) + ' error log entries')
+
+
+def print_name_cache_stats():
+    # Displays the number of full names parsed and the share found in the
+    # name cache
+    total = namecachestats['hits'] + namecachestats['misses']
+    if total > 0:
+        print('Full names: ' + str(total) + ' parsed, ' + str(namecachestats['hits'] * 100 / total) +
+              '% found in the name cache')
+
+
+def read_byte_range(datafile, start, end):
+    # Yields the lines of datafile that begin between the start and end
+    # byte offsets. Both offsets must fall on line boundaries.
+    datafile.seek(start)
+    while start < end:
+        line = datafile.readline()
+        if line == '':
+            break
+        start += len(line)
+        yield line
+
+
+def read_report_headers(lines):
+    # Reads the file header and report header from the start of an
+    # iterator over the lines of a filing, leaving the iterator
+    # positioned at the first line after the report header. Headers in
+    # versions 1 and 2 are multiple lines and are joined into one file
+    # header. Returns the file header, the report header and the number
+    # of lines read.
+    filehdr = next(lines, '')
+    x = 1
     if filehdr.lower().find('/* header') != -1:
         filehdr = filehdr.replace('/* Header', '').replace('/* header', '').replace('/* HEADER', '').strip()
-        flg = 0
-        while flg == 0:
-            y = linecache.getline(fecfile, x)
-            if y.lower().find('/* end header') == -1:
-                filehdr = filehdr + '\n' + y.strip()
-            else:
-                flg = 1
+        for line in lines:
             x += 1
-
-    # Extract report header
-    rpthdr = linecache.getline(fecfile, x)
-
-    # Clear linecache
-    linecache.clearcache()
-
-    # Change file delimiter to commas if ASCII-28 not found in report header
-    if not SRCDELIMITER in rpthdr:
-        SRCDELIMITER = ','
-
-    # Extract report type from report header
-    fullrpttype = rpthdr[:rpthdr.find(SRCDELIMITER)].lstrip(' "').rstrip(' "')
-    rpttype = fullrpttype.rstrip('ANT')
-
-    # If report type not supported, move file to Hold directory
-    # and proceed to next file; otherwise retrieve header version
-    if rpttype not in rpttypes:
-        os.rename(fecfile, fecfile.replace(RPTSVDIR, RPTHOLDDIR))
-        continue
-    else:
-        hdrver = ''
-        if filehdr.lower().find('fec_ver_#') != -1:  # FEC_VER_#, FEC_Ver_#
-            hdrver = filehdr[filehdr.lower().find('fec_ver_#') + 9:].lstrip(' =')
-            hdrver = float(hdrver[:hdrver.find('\n')].strip(' "'))
+            if line.lower().find('/* end header') != -1:
+                break
+            filehdr = filehdr + '\n' + line.strip()
+    rpthdr = next(lines, '')
+    x += 1
+    return filehdr, rpthdr, x
+
+
+def split_report(fecfile, report, nranges):
+    # Splits the data rows of a filing into as many as nranges byte
+    # ranges that begin and end on line boundaries. Returns a list of
+    # (start, end, linenbr) tuples, where linenbr is the number of lines
+    # preceding the range so error logs report the correct line.
+    filesize = os.path.getsize(fecfile)
+    with open(fecfile, 'rb') as datafile:
+        # Data rows begin on the line after the report header
+        start = 0
+        linenbr = 0
+        while True:
+            line = datafile.readline()
+            if line == '':
+                return []
+            start += len(line)
+            linenbr += 1
+            if line.strip() == '':
+                continue
+            if split_data_line(line, report['delimiter'])[1][0] == report['formtp']:
+                break
+
+        # Move each split point forward to the end of its line
+        bounds = [start]
+        rangesize = (filesize - start) // nranges
+        for x in range(1, nranges):
+            datafile.seek(start + x * rangesize)
+            datafile.readline()
+            offset = datafile.tell()
+            if bounds[-1] < offset < filesize:
+                bounds.append(offset)
+        bounds.append(filesize)
+
+        # Count the lines preceding each range
+        ranges = []
+        datafile.seek(start)
+        for x in range(len(bounds) - 1):
+            ranges.append((bounds[x], bounds[x + 1], linenbr))
+            remaining = bounds[x + 1] - bounds[x]
+            while remaining > 0:
+                block = datafile.read(min(remaining, 16777216))
+                if block == '':
+                    break
+                linenbr += block.count('\n')
+                remaining -= len(block)
+
+    return ranges
+
+
+def sniff_dialect(rpthdr):
+    # Detects the dialect of a filing from its report header. Returns a
+    # dictionary housing the field delimiter: commas when ASCII-28 isn't
+    # found in the report header.
+    delimiter = SRCDELIMITER
+    if delimiter not in rpthdr:
+        delimiter = ','
+    return {'delimiter': delimiter}
+
+
+def split_comma_line(line):
+    # Splits a comma-delimited line into fields. There are many cases
+    # where a field begins with " but is cut off or otherwise ends with
+    # no closing ". The csv module joins the rest of the line into that
+    # field, so it is used only when it can parse the line strictly.
+    # Otherwise, a quotation mark that isn't closed before the next comma
+    # is treated as text.
+    if '"' not in line:
+        return line.split(',')
+    try:
+        for data in csv.reader([line], delimiter=',', quotechar='"', strict=True):
+            return data
+    except csv.Error:
+        pass
+    data = []
+    pos = 0
+    while True:
+        match = commafieldpattern.match(line, pos)
+        if match.group(1) is not None:
+            data.append(match.group(1).replace('""', '"'))
         else:
-            hdrver = float(filehdr.split(SRCDELIMITER)[2].strip(' "'))
-
-    # Now that we know the form type and header version, we are going
-    # to build the header data row to insert into the database.
-
-    # First, fetch file headers. Custom code needed for versions 1 and 2.
-    filehdrdata = {'ImageID': imageid,
-                   'RecType': 'HDR',
-                   'EFType': 'FEC',
-                   'Ver': hdrver,
-                   'SftNm': '',
-                   'SftVer': '',
-                   'RptID': '',
-                   'RptNbr': '0',
-                   'HdrCmnt': '',
-                   'NmDelim': '',
-                   'DecNoDec': 'DEC',
-                   'DtFmt': 'CCYYMMDD'}
-
-    if hdrver < 3.0:
-        # Custom code for multiline headers (versions 1 and 2)
-        # Set default name delimiter to ^
-        filehdrdata['NmDelim'] = '^'
-        filehdr = filehdr.split('\n')
-        for hdr in filehdr:
-            line = hdr.strip()
-            if line.lower().startswith('soft_name'):
-                filehdrdata['SftNm'] = line[line.find('=') + 1:].strip(' "')
-            elif line.lower().startswith('soft_ver'):
-                filehdrdata['SftVer'] = line[line.find('=') + 1:].strip(' "')
-            elif line.lower().startswith('control'):
-                filehdrdata['RptID'] = line[line.find('=') + 1:].strip(' "')
-            elif line.lower().startswith('namedelim'):
-                filehdrdata['NmDelim'] = line[line.find('=') + 1:].strip(' "')
-            elif line.lower().startswith('dec/nodec'):
-                filehdrdata['DecNoDec'] = line[line.find('=') + 1:].strip(' "')
-            elif line.lower().startswith('date_fmat'):
-                filehdrdata['DtFmt'] = line[line.find('=') + 1:].strip(' "')
-            elif line.lower().find('comment') != -1:
-                filehdrdata['HdrCmnt'] = line[line.find('=') + 1:].strip(' "')
+            data.append(match.group(2))
+        pos = match.end()
+        if pos >= len(line):
+            return data
+        pos += 1
+
+
+def split_data_line(line, delim):
+    # Cleans up a data line and splits it into fields, touching each
+    # field once. If OUTPUTDELIMITER is tab, tabs and carriage returns
+    # are changed to spaces. Runs of spaces are collapsed to one space,
+    # and quotation marks and spaces are stripped from each field.
+    # Returns the cleaned line and the list of fields.
+    if OUTPUTDELIMITER == '\t':
+        line = line.replace('\t', ' ').replace('\r', ' ').strip()
+    while '  ' in line:
+        line = line.replace('  ', ' ')
 
+    if delim == ',':
+        data = split_comma_line(line)
+    elif OUTPUTDELIMITER == '\t' and '"' not in line and ' ' + delim not in line and delim + ' ' not in line:
+        # The line has already been stripped, so no field can begin or
+        # end with a quotation mark or a space
+        data = line.split(delim)
     else:
-        rowhdrs = get_row_headers('Hdr', hdrver)
-
-        # Parse file header row
-        filehdr = parse_data_row(filehdr, SRCDELIMITER)
-
-        # Iterate through file header row and populate header dictionary
-        for x in range(len(rowhdrs)):
-            if rowhdrs[x] in filehdrdata.keys() and x < len(
-                    filehdr):  # Checking len because sometimes header comment omitted
-                filehdrdata[rowhdrs[x]] = filehdr[x].strip().replace(OUTPUTDELIMITER, ' ').strip(' "\n')
+        data = [datum.strip('" ') for datum in line.split(delim)]
 
-    # First, change hdrver to int when < 4
-    if hdrver < 4:
-        hdrver = int(hdrver)
+    # Fields need more cleanup only when whitespace other than spaces
+    # can remain at either end of a field
+    if delim == ',' or OUTPUTDELIMITER != '\t' or '\x0b' in line or '\x0c' in line:
+        data = [datum.strip().replace('\t', ' ').strip(' "\n') for datum in data]
+    return line, data
 
-    # Get output headers
-    rpthdrdata = {}
-    for hdr in outputhdrs[rpttype]:
-        rpthdrdata[hdr] = ''
 
-    # Get headers for report header row
-    rowhdrs = get_row_headers(rpttype, hdrver)
+def split_full_name(data, delimiter):
+    # Splits a full name into its last, first and middle names, prefix and
+    # suffix. Called by parse_full_name for names that aren't cached.
+    fullname = data.split(delimiter)
+    for name in fullname:
+        name = name.strip(' "')
+    if len(fullname) == 1:
+        fullname[0] = clean_sql_text(fullname[0])
+        fullname.append('')
+        fullname.append('')
+        fullname.append('')
+        fullname.append('')
+    elif len(fullname) == 2:
+        fullname[0] = clean_sql_text(fullname[0])
+        fullname[1] = clean_sql_text(fullname[1])
+        fullname.append('')
+        fullname.append('')
+        fullname.append('')
+    elif len(fullname) == 3:
+        fullname[0] = clean_sql_text(fullname[0])
+        fullname[1] = clean_sql_text(fullname[1])
+        fullname.insert(2, '')
+        fullname[3] = clean_sql_text(fullname[3])
+        fullname.append('')
+    elif len(fullname) == 4:
+        fullname[0] = clean_sql_text(fullname[0])
+        fullname[1] = clean_sql_text(fullname[1])
+        fullname.insert(2, '')
+        fullname[3] = clean_sql_text(fullname[3])
+        fullname[4] = clean_sql_text(fullname[4])
+    elif len(fullname) == 5:
+        fullname[0] = clean_sql_text(fullname[0])
+        fullname[1] = clean_sql_text(fullname[1])
+        fullname[2] = clean_sql_text(fullname[2])
+        fullname[3] = clean_sql_text(fullname[3])
+        fullname[4] = clean_sql_text(fullname[4])
+    else:
+        while len(fullname) < 5:
+            fullname.append('')
+        fullname = fullname[:5]
+        fullname[0] = clean_sql_text(data.replace(delimiter, ', '))
+        fullname[1] = ''
+        fullname[2] = ''
+        fullname[3] = ''
+        fullname[4] = ''
 
-    # Parse report header row
-    rpthdr = parse_data_row(rpthdr, SRCDELIMITER)
+    # Copy entire name to last name field if any other field is too long
+    if len(fullname[1]) > 35 or len(fullname[2]) > 20 or len(fullname[3]) > 20 or len(fullname[4]) > 15:
+        fullname[0] = clean_sql_text(data.replace(delimiter, ', '))
+        fullname[1] = ''
+        fullname[2] = ''
+        fullname[3] = ''
+        fullname[4] = ''
 
-    # Iterate through report header row and populate report header dictionary
-    for x in range(len(rowhdrs)):
-        if rowhdrs[x] in rpthdrdata.keys() and x < len(
-                rpthdr):  # 100235 (F3X, v5.0) missing last 12 cols after treas sign date
-            rpthdrdata[rowhdrs[x]] = rpthdr[x].strip().replace(OUTPUTDELIMITER, ' ').strip(' "\n')
+    return fullname
 
-    # Attempt to determine name delimiter if missing
-    if filehdrdata['NmDelim'] == '':
-        if 'TrsFullName' in rpthdrdata.keys():
-            if rpthdrdata['TrsFullName'].find('^') != -1:
-                filehdrdata['NmDelim'] = '^'
-            elif rpthdrdata['TrsFullName'].find(',') != -1:
-                filehdrdata['NmDelim'] = ','
 
-    # Call function to verify data is valid, then load into database
-    sqlresult = 0
-    if rpttype == 'F3':
-        rpthdrdata = check_rpt_hdrs_f3(imageid, rpthdrdata, filehdrdata['NmDelim'], filehdrdata['DtFmt'])
-        sqlresult = load_rpt_hdrs(rpttype, imageid, rpthdrdata, filehdrdata, outputhdrs[rpttype], DBCONNSTR)
-    elif rpttype == 'F3L':
-        rpthdrdata = check_rpt_hdrs_f3l(imageid, rpthdrdata, filehdrdata['NmDelim'], filehdrdata['DtFmt'])
-        sqlresult = load_rpt_hdrs(rpttype, imageid, rpthdrdata, filehdrdata, outputhdrs[rpttype], DBCONNSTR)
-    elif rpttype == 'F3P':
-        rpthdrdata = check_rpt_hdrs_f3p(imageid, rpthdrdata, filehdrdata['NmDelim'], filehdrdata['DtFmt'])
-        sqlresult = load_rpt_hdrs(rpttype, imageid, rpthdrdata, filehdrdata, outputhdrs[rpttype], DBCONNSTR)
-    elif rpttype == 'F3X':
-        rpthdrdata = check_rpt_hdrs_f3x(imageid, rpthdrdata, filehdrdata['NmDelim'], filehdrdata['DtFmt'])
-        sqlresult = load_rpt_hdrs(rpttype, imageid, rpthdrdata, filehdrdata, outputhdrs[rpttype], DBCONNSTR)
-    elif rpttype == 'F1':
-        rpthdrdata = check_rpt_hdrs_f1(imageid, rpthdrdata, filehdrdata['NmDelim'], filehdrdata['DtFmt'])
-        sqlresult = load_rpt_hdrs(rpttype, imageid, rpthdrdata, filehdrdata, outputhdrs[rpttype], DBCONNSTR)
+def take_error_counts():
+    # Returns the number of entries logged for each error type since the
+    # last call and resets the counts. Worker processes return these to
+    # the main process after each task.
+    counts = errorcounts.copy()
+    errorcounts.clear()
+    return counts
+
+
+def take_name_cache_stats():
+    # Returns the name cache counts since the last call and resets them.
+    # Worker processes return these to the main process after each task.
+    stats = namecachestats.copy()
+    for stat in namecachestats:
+        namecachestats[stat] = 0
+    return stats
+
+
+def truncate_output_files(outputs, offsets):
+    # Discards everything written to the file handles housed in outputs
+    # since mark_output_files returned offsets, including rows still
+    # buffered. truncate doesn't move the file position, so each handle
+    # is moved back to the end of its file, where the next row and the
+    # next mark_output_files belong.
+    for key, outputfile in outputs.items():
+        outputfile.truncate(offsets[key])
+        outputfile.seek(0, os.SEEK_END)
+
+
+def validate_batch(formtype, rows, image):
+    # Validates the currency and integer columns of rows, a list of (row
+    # number, data row) tuples of one form type that have been checked by
+    # the form type's deferred validator (see BATCHROWS). Each column is
+    # checked at once with NumPy when it is installed, and only the
+    # values NumPy can't vouch for are checked by ck_curr_val or
+    # convert_to_tinyint, which log any bad values as usual.
+    linehdrs = outputhdrs[formtype]
+    for spec in rowspecs[formtype]:
+        field, fieldtype = spec[0], spec[1]
+        if fieldtype == 'currency':
+            check = check_currency_column
+        elif fieldtype == 'tinyint' or fieldtype == 'district':
+            check = check_tinyint_column
+        else:
+            continue
 
-    # On error, move file to Review directory
-    if sqlresult == -1:
-        shutil.move(fecfile, fecfile.replace(RPTSVDIR, RPTRVWDIR))
-        continue
-    elif sqlresult == -2:
-        shutil.move(fecfile, fecfile.replace(RPTSVDIR, RPTRVWDIR))
-        continue
-
-    # ITERATE OVER DATA ROWS
-    # ----------------------
-    # Because some headers are multiple lines, create a flag to look for
-    # the report header and ignore all rows before finding a line that
-    # begins with the report type.
-    with open(fecfile, 'rb') as datafile:
-        # Create header flag and lists to house output data
-        hdrflg = 0
-        otherdata = []
-        scheda = []
-        schedb = []
-        schedc = []
-        schedc1 = []
-        schedc2 = []
-        schedd = []
-        schede = []
-        schedf = []
-        schedh1 = []
-        schedh2 = []
-        schedh3 = []
-        schedh4 = []
-        schedh5 = []
-        schedh6 = []
-        schedi = []
-        schedl = []
-        text = []
-        f1s = []
-
-        # Iterate through the file
-        linenbr = 0
-        for line in datafile:
-            linenbr += 1
-            # Skip blank lines
-            if line.strip() == '':
-                continue
+        x = linehdrs.index(field)
+        linenbr = linehdrs.index('LineNbr')
+        trans = linehdrs.index('TransID')
+        if numpy is None:
+            checked = [None] * len(rows)
+        else:
+            checked = check([data[x] for rownbr, data in rows])
+        for val, (rownbr, data) in itertools.izip(checked, rows):
+            if val is not None:
+                data[x] = val
+            elif fieldtype == 'currency':
+                data[x] = ck_curr_val(data[x], image, field, data[linenbr], rownbr, formtype, data[trans])
+            else:
+                data[x] = convert_to_tinyint(data[x], image, field, data[linenbr], rownbr, formtype, data[trans])
 
-            # Create list to house this line's data
-            data = []
 
-            # Do some basic whitespace cleanup
-            # If OUTPUTDELIMITER is tab, change all tabs and newlines to spaces
-            if OUTPUTDELIMITER == '\t':
-                line = line.expandtabs(1).replace('\r', ' ').strip()
+def write_data_row(outputfile, row):
+    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
 
-            # Remove all instances of two spaces
-            while '  ' in line:
-                line = line.replace('  ', ' ')
 
-            # Convert line to list
-            data = parse_data_row(line, SRCDELIMITER)
+def write_error_log(logfile):
+    # Writes the entries buffered for logfile in a single write. The
+    # file is opened once, unbuffered and in append mode, so batches
+    # written by several worker processes don't interleave.
+    entries = errorlogbuffers.pop(logfile, None)
+    if not entries:
+        return
+    if logfile not in errorloghandles:
+        errorloghandles[logfile] = open_error_log(logfile)
+    errorloghandles[logfile].write(''.join(entries))
 
-            # If hdrflag == 0, see if this is header line; if not, continue
-            if hdrflg == 0:
-                if data[0] == rpthdrdata['FormTp'].strip(" '"):
-                    hdrflg = 1
-                continue
 
-            # This is a data row. Determine row's form type.
-            # Additional coding is necessary for Text, the three types
-            # of Schedule C forms and the six types of Schedule H forms.
-            formtype = ''
-            if data[0].startswith('SC1'):
-                formtype = 'SC1'
-            elif data[0].startswith('SC2'):
-                formtype = 'SC2'
-            elif data[0].startswith('SC'):
-                formtype = 'SC'
-            elif data[0].startswith('H1'):
-                formtype = 'H1'
-            elif data[0].startswith('H2'):
-                formtype = 'H2'
-            elif data[0].startswith('H3'):
-                formtype = 'H3'
-            elif data[0].startswith('H4'):
-                formtype = 'H4'
-            elif data[0].startswith('H5'):
-                formtype = 'H5'
-            elif data[0].startswith('H6'):
-                formtype = 'H6'
-            elif data[0].lower() == 'text':  # Sometimes not ALLCAPS
-                formtype = 'TEXT'
-            elif data[0].startswith('F1S'):
-                formtype = 'F1S'
+def write_output_headers(outputfiles):
+    # Creates the data file for each form type and writes its headers.
+    # Full name fields are not written to the data files.
+    for formtype, outputfile in outputfiles.items():
+        if formtype == 'OtherData':
+            continue
+        omit = fullnamehdrs.get(formtype, [])
+        hdrs = [hdr for hdr in outputhdrs[formtype] if hdr not in omit]
+        with open(outputfile, 'wb') as output:
+            if formtype == 'F1S':
+                output.write('ImageID' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(map(str, hdrs)) + '\r')
             else:
-                for key in outputhdrs.keys():
-                    if data[0].startswith(key):
-                        formtype = key
-                        continue
-
-            # Write the row to the other data file if row's form type not found
-            # and skip to next line
-            if formtype == '':
-                otherdata.append(str(imageid) + OUTPUTDELIMITER + str(hdrver) + OUTPUTDELIMITER + 'line: ' + str(
-                    linenbr) + OUTPUTDELIMITER + line + '\r')
-                continue
+                output.write('ImageID' + OUTPUTDELIMITER + 'PrtTp' + OUTPUTDELIMITER + OUTPUTDELIMITER.join(
+                    map(str, hdrs)) + '\r')
 
-            # Make local copy of output headers
-            linehdrs = outputhdrs[formtype][:]
 
-            # Build output dictionary to house data
-            linedata = {}
-            for hdr in linehdrs:
-                linedata[hdr] = ''
-
-            # Get headers for data row
-            rowhdrs = get_row_headers(formtype, hdrver)
+##############################################
 
-            # Write the row to the other data file if no headers found
-            if rowhdrs == []:
-                otherdata.append(str(imageid) + OUTPUTDELIMITER + str(hdrver) + OUTPUTDELIMITER + 'line: ' + str(
-                    linenbr) + OUTPUTDELIMITER + line + '\r')
-                continue
 
-            # Populate data row dictionary
-            linedata = populate_data_row_dict(data, rowhdrs, linedata)
-
-            # Call function to verify data is valid before loading into database
-            if formtype == 'SA':
-                # Validate data
-                linedata = check_row_data_sch_a(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                filehdrdata['DtFmt'])
-                # Remove full name fields
-                linehdrs.remove('ContFullName')
-                linehdrs.remove('DonorCandFullName')
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                scheda.append(data)
-            elif formtype == 'SB':
-                # Validate data
-                linedata = check_row_data_sch_b(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                filehdrdata['DtFmt'])
-                # Remove full name fields
-                linehdrs.remove('PayeeFullName')
-                linehdrs.remove('BenCandFullName')
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedb.append(data)
-            elif formtype == 'SC':
-                # Validate data
-                linedata = check_row_data_sch_c(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                filehdrdata['DtFmt'])
-                # Remove full name fields
-                linehdrs.remove('LenderFullName')
-                linehdrs.remove('LenderCandFullName')
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedc.append(data)
-            elif formtype == 'SC1':
-                # Validate data
-                linedata = check_row_data_sch_c1(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                 filehdrdata['DtFmt'])
-                # Remove full name fields
-                linehdrs.remove('LendRepFullName')
-                linehdrs.remove('TrsFullName')
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedc1.append(data)
-            elif formtype == 'SC2':
-                linedata = check_row_data_sch_c2(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                 filehdrdata['DtFmt'])
-                # Remove full name fields
-                linehdrs.remove('GuarFullName')
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedc2.append(data)
-            elif formtype == 'SD':
-                # No full name fields in data dictionary
-                # Validate data
-                linedata = check_row_data_sch_d(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                filehdrdata['DtFmt'])
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedd.append(data)
-            elif formtype == 'SE':
-                # Validate data
-                linedata = check_row_data_sch_e(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                filehdrdata['DtFmt'])
-                # Remove full name fields
-                linehdrs.remove('PayeeFullName')
-                linehdrs.remove('SupOppCandFullName')
-                linehdrs.remove('CompFullName')
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schede.append(data)
-            elif formtype == 'SF':
-                # Validate data
-                linedata = check_row_data_sch_f(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                filehdrdata['DtFmt'])
-                # Remove full name fields
-                linehdrs.remove('PayeeFullName')
-                linehdrs.remove('PayeeCandFullName')
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedf.append(data)
-            elif formtype == 'H1':
-                # No full name fields in data dictionary
-                # Validate data
-                linedata = check_row_data_sch_h1(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                 filehdrdata['DtFmt'])
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedh1.append(data)
-            elif formtype == 'H2':
-                # No full name fields in data dictionary
-                # Validate data
-                linedata = check_row_data_sch_h2(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                 filehdrdata['DtFmt'])
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedh2.append(data)
-            elif formtype == 'H3':
-                # No full name fields in data dictionary
-                # Validate data
-                linedata = check_row_data_sch_h3(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                 filehdrdata['DtFmt'])
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedh3.append(data)
-            elif formtype == 'H4':
-                # Validate data
-                linedata = check_row_data_sch_h4(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                 filehdrdata['DtFmt'])
-                # Remove full name fields
-                linehdrs.remove('PayeeFullName')
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedh4.append(data)
-            elif formtype == 'H5':
-                # No full name fields in data dictionary
-                # Validate data
-                linedata = check_row_data_sch_h5(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                 filehdrdata['DtFmt'])
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedh5.append(data)
-            elif formtype == 'H6':
-                # Validate data
-                linedata = check_row_data_sch_h6(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                 filehdrdata['DtFmt'])
-                # Remove full name fields
-                linehdrs.remove('PayeeFullName')
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedh6.append(data)
-            elif formtype == 'SI':
-                # No full name fields in data dictionary
-                # Validate data
-                linedata = check_row_data_sch_i(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                filehdrdata['DtFmt'])
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedi.append(data)
-            elif formtype == 'SL':
-                # No full name fields in data dictionary
-                # Validate data
-                linedata = check_row_data_sch_l(linedata, imageid, linenbr, filehdrdata['NmDelim'],
-                                                filehdrdata['DtFmt'])
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                schedl.append(data)
-            elif formtype == 'TEXT':
-                # No full name fields in data dictionary
-                # Validate data
-                linedata = check_row_data_text(linedata, imageid, linenbr, filehdrdata['NmDelim'], filehdrdata['DtFmt'])
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, fullrpttype)
-                text.append(data)
-            elif formtype == 'F1S':
-                # Validate data
-                linedata = check_row_data_f1s(linedata, imageid, linenbr, filehdrdata['NmDelim'], filehdrdata['DtFmt'])
-                # Remove full name fields
-                linehdrs.remove('AgtFullName')
-                # Create list for the data row
-                data = build_data_row(linedata, linehdrs, imageid, None)
-                f1s.append(data)
-
-        # Write data to files
-        if len(otherdata) > 0:
-            with open(otherdatafile, 'a+b') as outputfile:
-                for row in otherdata:
-                    outputfile.write(row)
-
-        if len(scheda) > 0:
-            with open(schedafile, 'a+b') as outputfile:
-                for row in scheda:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedb) > 0:
-            with open(schedbfile, 'a+b') as outputfile:
-                for row in schedb:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedc) > 0:
-            with open(schedcfile, 'a+b') as outputfile:
-                for row in schedc:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedc1) > 0:
-            with open(schedc1file, 'a+b') as outputfile:
-                for row in schedc1:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedc2) > 0:
-            with open(schedc2file, 'a+b') as outputfile:
-                for row in schedc2:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedd) > 0:
-            with open(scheddfile, 'a+b') as outputfile:
-                for row in schedd:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schede) > 0:
-            with open(schedefile, 'a+b') as outputfile:
-                for row in schede:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedf) > 0:
-            with open(schedffile, 'a+b') as outputfile:
-                for row in schedf:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedh1) > 0:
-            with open(schedh1file, 'a+b') as outputfile:
-                for row in schedh1:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedh2) > 0:
-            with open(schedh2file, 'a+b') as outputfile:
-                for row in schedh2:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedh3) > 0:
-            with open(schedh3file, 'a+b') as outputfile:
-                for row in schedh3:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedh4) > 0:
-            with open(schedh4file, 'a+b') as outputfile:
-                for row in schedh4:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedh5) > 0:
-            with open(schedh5file, 'a+b') as outputfile:
-                for row in schedh5:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedh6) > 0:
-            with open(schedh6file, 'a+b') as outputfile:
-                for row in schedh6:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedi) > 0:
-            with open(schedifile, 'a+b') as outputfile:
-                for row in schedi:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(schedl) > 0:
-            with open(schedlfile, 'a+b') as outputfile:
-                for row in schedl:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(text) > 0:
-            with open(textfile, 'a+b') as outputfile:
-                for row in text:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
-
-        if len(f1s) > 0:
-            with open(f1sfile, 'a+b') as outputfile:
-                for row in f1s:
-                    outputfile.write(OUTPUTDELIMITER.join(map(str, row)) + '\r')
+# Built list of supported report types
+rpttypes = build_list_of_supported_report_types()
 
-    # Move the file to the processed directory
-    shutil.move(fecfile, fecfile.replace(RPTSVDIR, RPTPROCDIR))
-    continue
+# Dates later than the current year are assumed to be in the 1900s
+curryear = datetime.date.today().year
 
-# Run stored procedure to deactivate overlapping reports
-# not covered by database triggers
-try:
-    sql = 'EXEC dbo.usp_DeactivateOverlappingReports'
+# Compile row headers for every supported form type and version
+rowhdrregistry = build_row_header_registry()
 
-    # Create SQL Server connection
-    conn = pyodbc.connect(DBCONNSTR)
-    cursor = conn.cursor()
+# Append full name fields to output headers
+for formtype, hdrs in fullnamehdrs.items():
+    outputhdrs[formtype].extend(hdrs)
+
+# Compile column plans now that the full name fields are in place
+columnplans = build_column_plans()
+
+# Compile form types for record type lookups
+formtypetrie = build_form_type_trie()
+
+# Compile the validators for data rows and report headers
+rowvalidators = {}
+batchvalidators = {}
+for formtype, fields in rowspecs.items():
+    rowvalidators[formtype] = build_validator(formtype, fields)
+    batchvalidators[formtype] = build_validator(formtype, fields, deferred=True)
+rpthdrvalidators = {}
+for rpttype, fields in rpthdrspecs.items():
+    rpthdrvalidators[rpttype] = build_validator(rpttype, fields, header=True)
+
+
+if __name__ == '__main__':
+    argparser = argparse.ArgumentParser(description='Parse electronically filed FEC reports.')
+    argparser.add_argument('--workers', type=int, default=NUMPROC,
+                           help='number of processes used to parse reports (default: %(default)s)')
+    args = argparser.parse_args()
+
+    # Create timestamp to append to output files
+    filestamp = create_file_timestamp()
+
+    # Build files to house data output and write headers
+    outputfiles = build_output_files(filestamp)
+    write_output_headers(outputfiles)
+
+    # Build list of files to parse, stopping at desired file count
+    fecfiles = glob.glob(os.path.join(RPTSVDIR, '*.fec'))[:FILELIMIT]
+
+    # Iterate through each file
+    if args.workers > 1:
+        # Large files are split and parsed by all workers, one at a time
+        largefiles = []
+        for fecfile in fecfiles:
+            if os.path.getsize(fecfile) > SPLITSIZE:
+                largefiles.append(fecfile)
+        for fecfile in largefiles:
+            fecfiles.remove(fecfile)
+
+        # Each worker writes to its own output shards. The shards are
+        # appended to the output files once every file has been parsed.
+        stopparsing = multiprocessing.Event()
+        pool = multiprocessing.Pool(processes=args.workers, initializer=init_parse_worker,
+                                    initargs=(filestamp, stopparsing))
+        try:
+            for fecfile in largefiles:
+                parse_large_report(fecfile, outputfiles, filestamp, pool, args.workers)
+            fecgroups = [fecfiles[x:x + HDRBATCHSIZE] for x in range(0, len(fecfiles), HDRBATCHSIZE)]
+            for counts, namestats in pool.imap_unordered(parse_report_worker, fecgroups):
+                merge_error_counts(counts)
+                merge_name_cache_stats(namestats)
+        except:
+            # Rather than terminating the workers partway through a file,
+            # let each one finish the reports it has started and skip the
+            # rest. A report that fails is removed from the worker's
+            # shards by parse_report, so only whole reports are merged.
+            stopparsing.set()
+            raise
+        finally:
+            pool.close()
+            pool.join()
+            merge_output_shards(outputfiles)
+            close_error_logs()
+            commit_db_work()
+    else:
+        outputs = open_output_files(outputfiles)
+        try:
+            for x in range(0, len(fecfiles), HDRBATCHSIZE):
+                parse_reports(fecfiles[x:x + HDRBATCHSIZE], outputs)
+        finally:
+            close_output_files(outputs)
+            close_error_logs()
+            commit_db_work()
+
+    # Run stored procedure to deactivate overlapping reports
+    # not covered by database triggers
+    try:
+        execute_db_sql('EXEC dbo.usp_DeactivateOverlappingReports', nresults=0)
+        close_db_connection()
+    except:
+        pass
 
-    # Excecute stored procedure
-    cursor.execute(sql)
-    conn.commit()
-    conn.close()
-except:
-    pass
+    print_error_counts()
+    print_name_cache_stats()
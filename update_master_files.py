@@ -24,10 +24,11 @@ from datetime import datetime, timedelta
 import glob
 import multiprocessing
 import os
-import urllib
 import urllib2
 import zipfile
 
+import download_tools
+
 # Try to import user settings or set them explicitly
 try:
     import usersettings
@@ -92,35 +93,24 @@ def delete_files(dir, ext):
 
 def download_file(src, dest):
     """
-    Downloads a single master file (src) and saves it as dest. After
-    downloading a file, this subroutine compares the length of the
-    downloaded file with the length of the source file and will try to
-    download a file up to five times when the lengths don't match.
+    Downloads a single master file (src) and saves it as dest.
+    download_url compares the length of the download with the length of
+    the source file, and this subroutine will try to download a file up
+    to five times when the lengths don't match.
     """
     y = 0
-    try:
-        # Add a header to the request.
-        request = urllib2.Request(src, headers={'User-Agent': 'Mozilla/5.0 (Windows NT 6.1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/35.0.1916.153 Safari/537.36 SE 2.X MetaSr 1.0'})
-        srclen = float(urllib2.urlopen(request).info().get('Content-Length'))
-    except:
-        y = 5
     while y < 5:
         try:
-            urllib.URLopener.version = 'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:54.0) Gecko/20100101 Firefox/54.0'
-            urllib.urlretrieve(src, dest)
-            destlen = os.path.getsize(dest)
-
-            # Repeat download up to five times if files not same size
-            if srclen != destlen:
-                os.remove(dest)
-                y += 1
-                continue
-            else:
-                y = 6
+            # Add a header to the request.
+            download_tools.download_url(src, dest, {'User-Agent': 'Mozilla/5.0 (Windows NT 6.1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/35.0.1916.153 Safari/537.36 SE 2.X MetaSr 1.0'})
+            return
+        except urllib2.HTTPError:
+            # The file isn't available
+            break
         except:
+            # Repeat download up to five times if files not same size
             y += 1
-    if y == 5:
-        print(src + ' could not be downloaded.')
+    print(src + ' could not be downloaded.')
 
 
 def unzip_master_file(masterfile):